@@ -0,0 +1,570 @@
+"""
+처리량 벤치마크
+
+ERP 시뮬레이터(src.erp_simulator) 위에서 부양가족 입력과 분납적용 자동화를 끝까지 실행하고
+입력 방식별 처리량(사원/분)과 사원당 키 입력 수를 측정합니다.
+Windows/ERP 없이 Linux에서도 실행되며, 시간은 가상 시계로 계산하므로 실제로 기다리지 않습니다.
+"""
+
+import argparse
+import contextlib
+import csv
+import io
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List
+
+from bulk_dependent_input import BulkDependentInput
+from src.installment_automation import (
+    InstallmentAutomation, INSTALLMENT_INPUT_COLUMNS, INSTALLMENT_INPUT_PASTE, INSTALLMENT_INPUT_STREAM
+)
+from src.installment_grid import GRID_COLUMN_INDEX, INSTALLMENT_GRID_COLUMNS, grid_values, is_installment
+from src.erp_simulator import ErpSimulator, SimulatorBackend, WallClock
+from src.key_input import KEY_INPUT_MESSAGE, KEY_INPUT_TYPE_KEYS
+from src.foreground_arbiter import DEFAULT_LINGER, DEFAULT_SWITCH_SETTLE
+from src.multi_window import JOB_DEPENDENT, MultiWindowRunner, WindowJob
+
+CSV_HEADER = ['근로자\n사번', '근로자명', '관계코드', '이름', '내/외국인', '주민등록번호',
+              '만나이', '기본공제여부', '장애유형', '자녀공제']
+
+# 벤치마크 시나리오: (이름, BulkDependentInput 옵션, 기존 부양가족을 미리 채울지)
+DEPENDENT_SCENARIOS = [
+    ("keys", dict(input_mode="keys"), False),
+    ("script", dict(input_mode="script"), False),
+    ("script+snapshot", dict(input_mode="script", snapshot_mode=True), False),
+    ("script+prefetch", dict(input_mode="script", snapshot_mode=True, prefetch_depth=4), False),
+    ("paste+snapshot", dict(input_mode="paste", snapshot_mode=True), False),
+    ("block+snapshot", dict(input_mode="block", snapshot_mode=True), False),
+    ("keys+message", dict(input_mode="keys", key_input="message"), False),
+    ("script+message", dict(input_mode="script", snapshot_mode=True, key_input="message"), False),
+    ("rerun keys", dict(input_mode="keys"), True),
+    ("rerun sync+snapshot", dict(input_mode="script", snapshot_mode=True, sync_mode=True), True),
+]
+
+# 분납적용 시나리오: (이름, 체크박스 여부, InstallmentAutomation 옵션, verify=True면 입력 후 검증까지)
+INSTALLMENT_SCENARIOS = [
+    ("installment", False, dict(key_input=KEY_INPUT_TYPE_KEYS)),
+    ("installment+message", False, dict(key_input=KEY_INPUT_MESSAGE)),
+    ("installment stream", False, dict(input_mode=INSTALLMENT_INPUT_STREAM)),
+    ("stream+message", False, dict(input_mode=INSTALLMENT_INPUT_STREAM, key_input=KEY_INPUT_MESSAGE)),
+    ("installment paste", False, dict(input_mode=INSTALLMENT_INPUT_PASTE)),
+    ("installment columns", False, dict(input_mode=INSTALLMENT_INPUT_COLUMNS)),
+    ("columns+verify", False, dict(input_mode=INSTALLMENT_INPUT_COLUMNS, verify=True)),
+    ("combined keys", False, dict(with_checkbox=True)),
+    ("combined stream", False, dict(input_mode=INSTALLMENT_INPUT_STREAM, with_checkbox=True)),
+    ("combined paste", False, dict(input_mode=INSTALLMENT_INPUT_PASTE, with_checkbox=True)),
+    ("combined columns", False, dict(input_mode=INSTALLMENT_INPUT_COLUMNS, with_checkbox=True)),
+    ("installment checkbox", True, dict(key_input=KEY_INPUT_TYPE_KEYS)),
+    ("checkbox+message", True, dict(key_input=KEY_INPUT_MESSAGE)),
+]
+
+
+def _rrn(rng: random.Random, year: int) -> str:
+    """나이에 맞는 13자리 주민등록번호 (체크섬 무관)"""
+    century_digit = rng.choice('12') if year < 2000 else rng.choice('34')
+    return (f"{year % 100:02d}{rng.randint(1, 12):02d}{rng.randint(1, 28):02d}"
+            f"{century_digit}{rng.randint(0, 999999):06d}")
+
+
+def generate_dataset(employees: int, seed: int = 0):
+    """
+    합성 데이터 생성
+
+    Args:
+        employees: 사원 수
+        seed: 난수 시드
+
+    Returns:
+        (사원 목록 [(사번, 성명, 본인번호)], CSV 행 리스트, 시뮬레이터 기존 부양가족 {사번: [행]})
+    """
+    rng = random.Random(seed)
+    this_year = datetime.now().year
+    roster, rows, existing = [], [], {}
+
+    for i in range(employees):
+        emp_no = f"{20000001 + i}"
+        emp_name = f"사원{i:05d}"
+        own_year = rng.randint(1965, 1998)
+        own_number = _rrn(rng, own_year)
+        roster.append((emp_no, emp_name, own_number))
+        rows.append([emp_no, emp_name, '0', emp_name, 'N', own_number,
+                     str(this_year - own_year), 'Y', '', ''])
+
+        grid_rows = []
+        for j in range(rng.choice((0, 1, 1, 2, 2, 3, 4))):
+            code = rng.choice('1234')
+            year = {'1': own_year - 28, '2': own_year - 28, '3': own_year + 1, '4': own_year + 28}[code]
+            year = min(year, this_year - 1)
+            number = _rrn(rng, year)
+            age = this_year - year
+            basic = 'Y' if rng.random() < 0.85 else 'N'
+            disability = '1' if rng.random() < 0.05 else ''
+            child = 'Y' if code == '4' and age < 20 else ''
+            name = f"가족{i:05d}{j}"
+            rows.append([emp_no, emp_name, code, name, 'N', number, str(age), basic, disability, child])
+
+            # 재실행 시나리오용: 이미 입력된 것과 같은 그리드 행
+            grid_rows.append([
+                code, name, '1', '1', number, str(age),
+                '1' if basic == 'Y' else '0',
+                '1' if basic == 'Y' and age >= 60 else '',
+                disability or ('0' if basic == 'Y' else ''),
+                ('1' if child else '0') if basic == 'Y' and code == '4' else '',
+            ])
+        existing[emp_no] = grid_rows
+
+    return roster, rows, existing
+
+
+def generate_installment(employees: int, seed: int = 0) -> List[Dict]:
+    """분납적용 합성 데이터 (약 절반이 분납 대상)"""
+    rng = random.Random(seed)
+    data = []
+    for i in range(employees):
+        total = rng.choice((rng.randint(1000, 100000), rng.randint(100001, 3000000)))
+        first = total // 3
+        data.append({
+            "사원코드": f"{20000001 + i}",
+            "사원명": f"사원{i:05d}",
+            "총액_소득세": total,
+            "총액_지방소득세": total // 10,
+            "분납1_소득세": first,
+            "분납1_지방소득세": first // 10,
+            "분납2_소득세": first,
+            "분납2_지방소득세": first // 10,
+        })
+    return data
+
+
+def write_csv(path: Path, rows: List[List[str]]):
+    """CSV 저장 (실제 입력 파일과 같은 utf-8-sig)"""
+    with open(path, 'w', encoding='utf-8-sig', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(CSV_HEADER)
+        writer.writerows(rows)
+
+
+@contextlib.contextmanager
+def _quiet(enabled: bool):
+    """자동화 코드의 콘솔 출력 숨김"""
+    if not enabled:
+        yield
+        return
+    with contextlib.redirect_stdout(io.StringIO()):
+        yield
+
+
+def _result(name: str, employees: int, sim: ErpSimulator, wall: float, extra: Dict = None) -> Dict:
+    virtual = sim.clock.now
+    result = {
+        'scenario': name,
+        'employees': employees,
+        'keystrokes': sim.keystrokes,
+        'keys_per_employee': round(sim.keystrokes / employees, 1) if employees else 0.0,
+        'virtual_seconds': round(virtual, 1),
+        'employees_per_minute': round(employees * 60.0 / virtual, 2) if virtual else 0.0,
+        'wall_seconds': round(wall, 2),
+    }
+    if extra:
+        result.update(extra)
+    return result
+
+
+def run_dependent_scenario(name: str, options: Dict, rerun: bool, roster, csv_path: Path,
+                           existing, args) -> Dict:
+    """부양가족 입력 시나리오 1개 실행"""
+    sim = ErpSimulator(key_latency=args.latency, jitter=args.jitter, seed=args.seed)
+    sim.build_employee_window(roster, existing if rerun else None)
+    backend = SimulatorBackend(sim)
+
+    wall_start = time.perf_counter()
+    with sim.clock.install(), _quiet(not args.show_log):
+        bulk = BulkDependentInput(str(csv_path), global_delay=args.delay, backend=backend, **options)
+        sim.clock.now = 0.0
+        sim.keystrokes = 0
+        try:
+            summary = bulk.run(count=len(roster))
+        finally:
+            bulk.cleanup()
+    wall = time.perf_counter() - wall_start
+
+    # 시뮬레이터 그리드가 CSV와 같은지 확인 (입력 누락/밀림 검출)
+    mismatched = 0
+    for emp_no, _, _ in roster:
+        expected = existing.get(emp_no, [])
+        actual = sim.dependent_rows(emp_no)
+        key = lambda r: (r[0], r[1], r[4])
+        if sorted(map(key, actual)) != sorted(map(key, expected)):
+            mismatched += 1
+
+    return _result(name, len(roster), sim, wall, {
+        'success': summary.get('success', 0),
+        'failed': summary.get('failed', 0),
+        'grid_mismatch': mismatched,
+        'paste_fallbacks': summary.get('paste_fallbacks', 0),
+        'block_fallbacks': summary.get('block_fallbacks', 0),
+        'foreground_fallbacks': summary.get('foreground_fallbacks', 0),
+    })
+
+
+def expected_installment_row(row: Dict, amounts: bool, checkbox: bool) -> List[str]:
+    """
+    분납적용 입력 후 오른쪽 스프레드 행의 기대값
+
+    Args:
+        row: 사원 데이터
+        amounts: True면 금액 입력 결과 포함
+        checkbox: True면 체크박스 결과 포함 (단건 사원만 체크 열 "1")
+
+    Returns:
+        INSTALLMENT_GRID_COLUMNS 순서의 셀 문자열 리스트
+    """
+    values = grid_values(row) if amounts else [""] * len(INSTALLMENT_GRID_COLUMNS)
+    if checkbox and not is_installment(row):
+        values[GRID_COLUMN_INDEX["체크"]] = "1"
+    return values
+
+
+def run_installment_scenario(name: str, checkbox: bool, data: List[Dict], args, workdir: Path,
+                             options: Dict = None) -> Dict:
+    """분납적용 시나리오 1개 실행 (checkbox=True면 단건 체크, options는 InstallmentAutomation 옵션)"""
+    options = dict(options or {})
+    verify = options.pop('verify', False)
+    sim = ErpSimulator(key_latency=args.latency, jitter=args.jitter, seed=args.seed)
+    sim.build_installment_dialog([(d['사원코드'], d['사원명']) for d in data])
+    if checkbox:
+        sim.installment_spread.col = GRID_COLUMN_INDEX["체크"]
+    backend = SimulatorBackend(sim)
+
+    # 진행 저널은 원본 파일 경로로 구분하므로 데이터를 파일로 남겨 둠
+    source = workdir / f"installment_{len(data)}.json"
+    source.write_text(json.dumps(data, ensure_ascii=False), encoding='utf-8')
+
+    wall_start = time.perf_counter()
+    with sim.clock.install(), _quiet(not args.show_log):
+        automation = InstallmentAutomation(str(source), global_delay=args.delay, backend=backend, data=data,
+                                           **options)
+        sim.clock.now = 0.0
+        sim.keystrokes = 0
+        report = None
+        try:
+            if checkbox:
+                summary = automation.run_checkbox()
+            else:
+                summary = automation.run()
+            if verify:
+                verify_start = sim.clock.now
+                report = automation.verify()
+                report['virtual_seconds'] = sim.clock.now - verify_start
+        finally:
+            automation.cleanup()
+    wall = time.perf_counter() - wall_start
+
+    # 스프레드 값이 데이터와 같은지 확인 (입력 누락/행 밀림 검출)
+    mismatched = sum(1 for d, actual in zip(data, sim.installment_spread.rows)
+                     if list(actual) != expected_installment_row(d, not checkbox,
+                                                                  checkbox or options.get('with_checkbox', False)))
+
+    extra = {
+        'success': summary.get('success', 0),
+        'failed': summary.get('fail', 0),
+        'grid_mismatch': mismatched,
+    }
+    if report is not None:
+        # 검증 결과는 위 그리드 비교와 같아야 함 (다르면 검증 코드 문제)
+        extra['verify_seconds'] = round(report['virtual_seconds'], 1)
+        extra['verify_mismatch'] = report['mismatch_rows']
+    return _result(name, len(data), sim, wall, extra)
+
+
+def run_multi_window(windows: int, employees: int, args) -> Dict:
+    """
+    여러 창 동시 실행 비교 (실제 시간)
+
+    창마다 시뮬레이터를 하나씩 두고 같은 부양가족 입력을 창 수만큼 순서대로 한 번,
+    MultiWindowRunner로 동시에 한 번 실행합니다. 가상 시계는 스레드를 나눠 셀 수 없으므로
+    실제 시계(WallClock)로 기다리며, 그래서 사원 수는 작게 잡아야 합니다.
+
+    Args:
+        windows: 창 수
+        employees: 창마다 처리할 사원 수
+        args: 명령줄 인자 (latency, jitter, delay, seed, show_log, switch_settle, linger)
+
+    Returns:
+        결과 딕셔너리 (순차/동시 실행 시간, 전경 독점 시간 합계, 그리드 불일치 수)
+    """
+    options = dict(input_mode="keys", snapshot_mode=True, global_delay=args.delay)
+    original_cwd = os.getcwd()
+
+    with tempfile.TemporaryDirectory(prefix="erp_bench_multi_") as tmp:
+        workdir = Path(tmp)
+        datasets = []
+        for w in range(windows):
+            roster, rows, _ = generate_dataset(employees, seed=args.seed + w)
+            csv_path = workdir / f"dependents_w{w + 1}.csv"
+            write_csv(csv_path, rows)
+            datasets.append((roster, rows, csv_path))
+
+        def make_sims():
+            sims = []
+            for w, (roster, _, _) in enumerate(datasets):
+                sim = ErpSimulator(key_latency=args.latency, jitter=args.jitter, seed=args.seed + w,
+                                   clock=WallClock())
+                sim.build_employee_window(roster)
+                sims.append(sim)
+            return sims
+
+        def mismatched(sims):
+            expected_counts = [
+                {emp_no: sum(1 for r in rows if r[0] == emp_no and r[2] != '0') for emp_no, _, _ in roster}
+                for roster, rows, _ in datasets
+            ]
+            return sum(
+                1
+                for sim, counts in zip(sims, expected_counts)
+                for emp_no, count in counts.items()
+                if len(sim.dependent_rows(emp_no)) != count
+            )
+
+        os.chdir(workdir)
+        try:
+            # 순차 실행 (창 하나씩)
+            sequential_sims = make_sims()
+            start = time.perf_counter()
+            with _quiet(not args.show_log):
+                for sim, (roster, _, csv_path) in zip(sequential_sims, datasets):
+                    bulk = BulkDependentInput(str(csv_path), backend=SimulatorBackend(sim), **options)
+                    try:
+                        bulk.run(count=len(roster))
+                    finally:
+                        bulk.cleanup()
+            sequential = time.perf_counter() - start
+
+            # 동시 실행
+            concurrent_sims = make_sims()
+            jobs = [
+                WindowJob(kind=JOB_DEPENDENT, path=str(csv_path), options=options, count=len(roster),
+                          label=f"창{w + 1}", backend=SimulatorBackend(sim))
+                for w, (sim, (roster, _, csv_path)) in enumerate(zip(concurrent_sims, datasets))
+            ]
+            with _quiet(not args.show_log):
+                summary = MultiWindowRunner(jobs, switch_settle=args.switch_settle, linger=args.linger).run()
+        finally:
+            os.chdir(original_cwd)
+
+    hold_time = sum(s['hold_time'] for s in summary['arbiter'].values())
+    return {
+        'scenario': f"multi-window x{windows}",
+        'windows': windows,
+        'employees': employees,
+        'sequential_seconds': round(sequential, 2),
+        'concurrent_seconds': round(summary['elapsed'], 2),
+        'speedup': round(sequential / summary['elapsed'], 2) if summary['elapsed'] else 0.0,
+        'hold_seconds': round(hold_time, 2),
+        'switches': summary['switches'],
+        'failed': sum(1 for r in summary['jobs'].values() if r.get('status') == 'error')
+                  + sum(r.get('failed', 0) for r in summary['jobs'].values()),
+        'grid_mismatch': mismatched(sequential_sims) + mismatched(concurrent_sims),
+    }
+
+
+def format_multi_window(r: Dict) -> str:
+    """여러 창 동시 실행 결과 1줄"""
+    notes = []
+    if r['failed']:
+        notes.append(f"실패 {r['failed']}")
+    if r['grid_mismatch']:
+        notes.append(f"그리드 불일치 {r['grid_mismatch']}")
+    return (f"창 {r['windows']}개 x 사원 {r['employees']}명: 순차 {r['sequential_seconds']:.1f}s → "
+            f"동시 {r['concurrent_seconds']:.1f}s ({r['speedup']:.2f}배), "
+            f"전경 독점 합계 {r['hold_seconds']:.1f}s, 전환 {r['switches']}회  " + ", ".join(notes))
+
+
+def run_benchmark(args) -> List[Dict]:
+    """모든 시나리오 실행 (로그/저널은 임시 폴더에 기록)"""
+    results = []
+    original_cwd = os.getcwd()
+    scenarios = [s for s in DEPENDENT_SCENARIOS if not args.scenario or s[0] in args.scenario]
+
+    for employees in args.employees:
+        with tempfile.TemporaryDirectory(prefix="erp_bench_") as tmp:
+            workdir = Path(tmp)
+            roster, rows, existing = generate_dataset(employees, seed=args.seed)
+            csv_path = workdir / f"dependents_{employees}.csv"
+            write_csv(csv_path, rows)
+
+            for name, options, rerun in scenarios:
+                scenario_dir = workdir / name.replace(' ', '_').replace('+', '_')
+                scenario_dir.mkdir()
+                os.chdir(scenario_dir)
+                try:
+                    results.append(run_dependent_scenario(name, options, rerun, roster, csv_path, existing, args))
+                finally:
+                    os.chdir(original_cwd)
+                print(format_result(results[-1]))
+
+            if not args.skip_installment:
+                data = generate_installment(employees, seed=args.seed)
+                for name, checkbox, options in INSTALLMENT_SCENARIOS:
+                    scenario_dir = workdir / name.replace(' ', '_').replace('+', '_')
+                    scenario_dir.mkdir()
+                    os.chdir(scenario_dir)
+                    try:
+                        results.append(run_installment_scenario(name, checkbox, data, args, scenario_dir, options))
+                    finally:
+                        os.chdir(original_cwd)
+                    print(format_result(results[-1]))
+
+    return results
+
+
+def format_header() -> str:
+    return (f"{'시나리오':<22}{'사원':>7}{'사원/분':>10}{'키/사원':>9}"
+            f"{'가상시간':>11}{'실제시간':>10}  비고")
+
+
+def format_result(r: Dict) -> str:
+    notes = []
+    if r.get('failed'):
+        notes.append(f"실패 {r['failed']}")
+    if r.get('grid_mismatch'):
+        notes.append(f"그리드 불일치 {r['grid_mismatch']}")
+    if r.get('paste_fallbacks'):
+        notes.append(f"붙여넣기 재입력 {r['paste_fallbacks']}")
+    if r.get('block_fallbacks'):
+        notes.append(f"블록 재입력 {r['block_fallbacks']}")
+    if r.get('foreground_fallbacks'):
+        notes.append(f"전경 입력 {r['foreground_fallbacks']}회")
+    if 'verify_seconds' in r:
+        notes.append(f"검증 {r['verify_seconds']:.1f}s (불일치 {r['verify_mismatch']}명)")
+    return (f"{r['scenario']:<22}{r['employees']:>7}{r['employees_per_minute']:>10.2f}"
+            f"{r['keys_per_employee']:>9.1f}{r['virtual_seconds']:>10.0f}s{r['wall_seconds']:>9.1f}s  "
+            + ", ".join(notes))
+
+
+def compare_baseline(results: List[Dict], baseline_path: str, tolerance: float) -> List[str]:
+    """
+    기준 결과와 비교
+
+    Args:
+        results: 이번 결과
+        baseline_path: 기준 결과 JSON (--json으로 저장한 파일)
+        tolerance: 허용 하락 비율 (0.05 = 5%)
+
+    Returns:
+        회귀 메시지 리스트 (없으면 빈 리스트)
+    """
+    with open(baseline_path, 'r', encoding='utf-8') as f:
+        baseline = {(r['scenario'], r['employees']): r for r in json.load(f)['results']}
+
+    regressions = []
+    for r in results:
+        base = baseline.get((r['scenario'], r['employees']))
+        if not base:
+            continue
+        if r['employees_per_minute'] < base['employees_per_minute'] * (1 - tolerance):
+            regressions.append(f"{r['scenario']} ({r['employees']}명): 사원/분 "
+                               f"{base['employees_per_minute']:.2f} → {r['employees_per_minute']:.2f}")
+        if r['keys_per_employee'] > base['keys_per_employee'] * (1 + tolerance):
+            regressions.append(f"{r['scenario']} ({r['employees']}명): 키/사원 "
+                               f"{base['keys_per_employee']:.1f} → {r['keys_per_employee']:.1f}")
+    return regressions
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(
+        description='ERP 시뮬레이터 처리량 벤치마크',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+사용 예시:
+  # 사원 1,000명 / 10,000명 벤치마크
+  python benchmark_throughput.py --employees 1000 10000
+
+  # 키당 ERP 처리 지연 20ms + 흔들림 10ms
+  python benchmark_throughput.py --employees 1000 --latency 0.02 --jitter 0.01
+
+  # 결과 저장 후 다음 실행에서 기준과 비교 (5% 넘게 느려지면 종료 코드 1)
+  python benchmark_throughput.py --employees 1000 --json bench.json
+  python benchmark_throughput.py --employees 1000 --baseline bench.json
+
+  # 일부 시나리오만
+  python benchmark_throughput.py --employees 200 --scenario script "rerun sync+snapshot" --skip-installment
+
+  # 창 3개 동시 실행 vs 순차 실행 (실제 시간으로 기다림, 창마다 사원 5명)
+  python benchmark_throughput.py --multi-window 3 --multi-window-employees 5
+
+  # 창 전환 비용을 줄였을 때 (전환 후 대기 20ms, 이어 쓰기 50ms)
+  python benchmark_throughput.py --multi-window 2 --switch-settle 0.02 --linger 0.05
+        """
+    )
+
+    parser.add_argument('--employees', type=int, nargs='+', default=[1000], help='사원 수 (여러 개 가능, 기본값: 1000)')
+    parser.add_argument('--latency', type=float, default=0.01, help='키 1개당 ERP 처리 지연 (초, 기본값: 0.01)')
+    parser.add_argument('--jitter', type=float, default=0.005, help='키 1개당 추가 지연 최대값 (초, 기본값: 0.005)')
+    parser.add_argument('--delay', type=float, default=1.0, help='전역 지연 시간 배율 (0.5~2.0, 기본값: 1.0)')
+    parser.add_argument('--seed', type=int, default=0, help='데이터/지연 난수 시드 (기본값: 0)')
+    parser.add_argument('--scenario', nargs='+', choices=[s[0] for s in DEPENDENT_SCENARIOS],
+                        help='부양가족 시나리오 선택 (미지정 시 전체)')
+    parser.add_argument('--skip-installment', action='store_true', help='분납적용 시나리오 제외')
+    parser.add_argument('--show-log', action='store_true', help='자동화 로그를 콘솔에 출력')
+    parser.add_argument('--multi-window', type=int, default=0, metavar='N',
+                        help='시나리오 대신 창 N개 동시 실행과 순차 실행을 실제 시간으로 비교')
+    parser.add_argument('--multi-window-employees', type=int, default=5, metavar='N',
+                        help='--multi-window에서 창마다 처리할 사원 수 (기본값: 5)')
+    parser.add_argument('--switch-settle', type=float, default=DEFAULT_SWITCH_SETTLE,
+                        help=f'--multi-window에서 창 전환 후 입력 전 대기 (초, 기본값: {DEFAULT_SWITCH_SETTLE})')
+    parser.add_argument('--linger', type=float, default=DEFAULT_LINGER,
+                        help=f'--multi-window에서 같은 작업이 전환 없이 이어 쓰는 시간 (초, 기본값: {DEFAULT_LINGER})')
+    parser.add_argument('--json', help='결과를 JSON 파일로 저장')
+    parser.add_argument('--baseline', help='기준 결과 JSON과 비교 (회귀 시 종료 코드 1)')
+    parser.add_argument('--tolerance', type=float, default=0.05, help='기준 대비 허용 하락 비율 (기본값: 0.05)')
+
+    args = parser.parse_args()
+
+    print(f"지연: 키당 {args.latency * 1000:.0f}ms + 0~{args.jitter * 1000:.0f}ms, 전역 배율 {args.delay}")
+
+    if args.multi_window:
+        result = run_multi_window(args.multi_window, args.multi_window_employees, args)
+        print(format_multi_window(result))
+        if args.json:
+            with open(args.json, 'w', encoding='utf-8') as f:
+                json.dump({'args': {k: v for k, v in vars(args).items() if k not in ('json', 'baseline')},
+                           'results': [result]}, f, ensure_ascii=False, indent=2)
+            print(f"\n결과 저장: {args.json}")
+        if result['failed'] or result['grid_mismatch']:
+            print("\n⚠ 입력 실패/그리드 불일치가 있습니다")
+            sys.exit(1)
+        return
+
+    print(format_header())
+    results = run_benchmark(args)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'args': {k: v for k, v in vars(args).items() if k not in ('json', 'baseline')},
+                       'results': results}, f, ensure_ascii=False, indent=2)
+        print(f"\n결과 저장: {args.json}")
+
+    failed = [r for r in results if r.get('failed') or r.get('grid_mismatch')]
+    if failed:
+        print("\n⚠ 입력 실패/그리드 불일치가 있는 시나리오가 있습니다")
+
+    if args.baseline:
+        regressions = compare_baseline(results, args.baseline, args.tolerance)
+        if regressions:
+            print("\n❌ 기준 대비 회귀:")
+            for line in regressions:
+                print(f"  - {line}")
+            sys.exit(1)
+        print("\n✓ 기준 대비 회귀 없음")
+
+
+if __name__ == "__main__":
+    main()
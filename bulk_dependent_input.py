@@ -10,21 +10,37 @@ import argparse
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List
-import pyperclip
-import keyboard
+from typing import Dict, List, Optional
 
-from pywinauto import Application
-from src.csv_reader import CSVReader, DependentData
+from src.clipboard_reader import ClipboardTimeout
+from src.csv_reader import CSVReader
+from src.csv_validator import DependentValidator, validate_csv
+from src.dependent_normalizer import NormalizedDependent, normalize_employee, normalize_employees
+from src.erp_backend import default_backend
 from src.hotkey_manager import HotkeyManager
+from src.log_service import LogService
+from src.metrics import Metrics, format_summary
 from src.spread_controller import SpreadController
-from src.input_handler import InputHandler
+from src.input_handler import (
+    InputHandler, INPUT_MODE_KEYS, INPUT_MODE_SCRIPT, INPUT_MODE_PASTE, INPUT_MODE_BLOCK, INPUT_MODES
+)
+from src.sync_barrier import WAIT_MODE_SLEEP, WAIT_MODES
+from src.key_input import KEY_INPUTS, KEY_INPUT_TYPE_KEYS
+from src.key_script import DependentScriptCompiler, KeyScript, KeyScriptExecutor
+from src.run_plan import RunPlanner, RunPlan, format_duration
+from src.employee_snapshot import EmployeeSnapshot
+from src.dependent_grid import DependentGridComparer, GridRow, parse_grid
+from src.prefetch import EmployeePayload, PrefetchPipeline
+from src.progress_journal import ProgressJournal, STATUS_DONE, STATUS_PARTIAL, STATUS_ERROR
 
 
 class BulkDependentInput:
     """부양가족 대량 입력 자동화"""
 
-    def __init__(self, csv_path: str, verbose: bool = False, global_delay: float = 1.0, start_from_current: bool = False):
+    def __init__(self, csv_path: str, verbose: bool = False, global_delay: float = 1.0, start_from_current: bool = False,
+                 wait_mode: str = WAIT_MODE_SLEEP, input_mode: str = INPUT_MODE_KEYS, key_pause: float = 0.05,
+                 snapshot_mode: bool = False, sync_mode: bool = False, resume: bool = False, backend=None,
+                 prefetch_depth: int = 0, key_input: str = KEY_INPUT_TYPE_KEYS):
         """
         초기화 및 연결
 
@@ -33,10 +49,41 @@ class BulkDependentInput:
             verbose: True면 DEBUG 로그 출력, False면 숨김 (기본값: False)
             global_delay: 전역 지연 시간 배율 (0.5~2.0, 기본값: 1.0)
             start_from_current: True면 현재 위치에서 시작, False면 Ctrl+Home 실행 (기본값: False)
+            wait_mode: 입력 후 대기 방식 ("sleep"=고정 대기, "sync"=동기화 배리어, 기본값: "sleep")
+            input_mode: 부양가족 입력 방식 ("keys"=필드별 입력, "script"=키 스크립트 일괄 전송,
+                        "paste"=행 붙여넣기, "block"=부양가족 전체 블록 붙여넣기, 기본값: "keys")
+            key_pause: script 방식의 키 사이 간격 (초, 기본값: 0.05)
+            snapshot_mode: True면 사원 목록 사번 열을 한 번에 복사해 두고 {DOWN}만으로 이동 (기본값: False)
+            sync_mode: True면 기존 부양가족을 한 번에 읽어 CSV와 다른 행만 삭제/입력 (기본값: False)
+            resume: True면 진행 저널에 완료로 기록된 사원은 이동만 하고 건너뜀 (기본값: False)
+            backend: ERP 창/클립보드/전역 키 백엔드 (None이면 Win32Backend, 벤치마크는 시뮬레이터)
+            prefetch_depth: 스냅샷 모드에서 작업 스레드가 몇 명 앞서 입력 데이터를 준비할지 (0이면 사용 안 함)
+            key_input: 키 입력 방식 ("type_keys"=전경 창 입력, "message"=스프레드 핸들로 메시지 전송,
+                       복사/붙여넣기/F5 등은 type_keys, 기본값: "type_keys")
         """
+        if input_mode not in INPUT_MODES:
+            raise ValueError(f"알 수 없는 입력 방식: {input_mode} (가능: {', '.join(INPUT_MODES)})")
+
         self.verbose = verbose
         self.global_delay = max(0.5, min(2.0, global_delay))
         self.start_from_current = start_from_current
+        self.wait_mode = wait_mode
+        self.input_mode = input_mode
+        self.key_pause = key_pause
+        self.snapshot_mode = snapshot_mode
+        self.sync_mode = sync_mode
+        self.resume = resume
+        self.paste_fallbacks = 0    # paste 방식에서 필드별 입력으로 다시 입력한 부양가족 수
+        self.block_fallbacks = 0    # block 방식에서 행 단위 입력으로 다시 입력한 사원 수
+        self.prefetch_depth = prefetch_depth
+        self.key_input = key_input
+        self._prefetch = None
+        self.backend = backend if backend is not None else default_backend()
+
+        # 커서 위치 추적 (중복 이동 생략용)
+        self._left_at_employee_no = False        # 왼쪽 커서가 사번 열에 있음
+        self._right_at_input_row = False         # 오른쪽 커서가 입력 시작 행 첫 열에 있음
+        self._delete_stopped = False             # 중지 요청으로 기존 부양가족 삭제가 중간에 멈춤
 
         print(f"초기화 중...")
 
@@ -45,23 +92,34 @@ class BulkDependentInput:
         log_dir.mkdir(exist_ok=True)
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         self.log_file = log_dir / f"bulk_input_{timestamp}.log"
+        self.log_service = LogService(self.log_file, verbose=self.verbose)
+        self.metrics = Metrics()
         print(f"  [OK] 로그 파일: {self.log_file}")
 
         # 핫키 관리자 초기화
-        self.hotkey_manager = HotkeyManager(log_callback=self.log)
+        self.hotkey_manager = HotkeyManager(log_callback=self.log, backend=self.backend)
         print(f"  [OK] 핫키 관리자 초기화 (Pause 키 리스너 등록)")
 
         # CSV 데이터 로드
         self.csv_reader = CSVReader(csv_path)
-        self.csv_reader.read()
-        self.csv_data = self.csv_reader.group_by_employee()
+        self.csv_data = self.csv_reader.load()
         print(f"  [OK] CSV 로드: {len(self.csv_data)}명 사원")
 
+        # 입력용 정규화 (본인 제외/정렬/번호 정제/값 변환을 한 번만)
+        self.employees = normalize_employees(self.csv_data, log_callback=self.log)
+        print(f"  [OK] 부양가족 정규화: {sum(len(e.dependents) for e in self.employees.values())}명")
+
+        # CSV 검증 (입력 전 전체 검사, 결과는 run()에서 로그로 남김)
+        self.validation = DependentValidator().validate(list(self.csv_data.rows()))
+        print(f"  [{'OK' if self.validation.ok else '!!'}] CSV 검증: {self.validation.summary()}")
+
+        # 진행 저널 (CSV 내용 + 창 이름별)
+        self.journal = ProgressJournal(csv_path, "사원등록", log_callback=self.log)
+        print(f"  [OK] 진행 저널: {self.journal.path} (완료 기록 {self.journal.done_count()}명)")
+
         # pywinauto 연결
         try:
-            self.app = Application(backend='win32')
-            self.app.connect(title="사원등록")
-            self.dlg = self.app.window(title="사원등록")
+            self.app, self.dlg = self.backend.connect("사원등록")
             print(f"  [OK] 사원등록 프로그램 연결")
         except Exception as e:
             error_msg = "❌ 사원등록 창을 찾을 수 없습니다!\n\n"
@@ -77,7 +135,8 @@ class BulkDependentInput:
             print(f"  [OK] 스프레드 찾기 완료 (왼쪽/오른쪽)")
 
             # 왼쪽 포커스 설정
-            self.left_spread.set_focus()
+            with self.backend.exclusive(self.left_spread):
+                self.left_spread.set_focus()
             time.sleep(0.3 * self.global_delay)
             print(f"  [OK] 왼쪽 사원 목록 포커스 설정")
         except Exception as e:
@@ -88,31 +147,29 @@ class BulkDependentInput:
             self.left_spread,
             self.right_spread,
             global_delay=self.global_delay,
-            log_callback=self.log
+            log_callback=self.log,
+            wait_mode=self.wait_mode,
+            backend=self.backend,
+            key_input=self.key_input
         )
-        print(f"  [OK] 입력 핸들러 초기화")
+        print(f"  [OK] 입력 핸들러 초기화 (대기 방식: {self.wait_mode}, 키 입력: {self.key_input})")
 
-    def log(self, level: str, message: str):
+        # 키 스크립트 컴파일러/실행기
+        self.script_compiler = DependentScriptCompiler()
+        self.script_executor = KeyScriptExecutor(self.input_handler, key_pause=key_pause)
+        self.grid_comparer = DependentGridComparer()
+        print(f"  [OK] 입력 방식: {self.input_mode}" + (" (변경분만 반영)" if self.sync_mode else ""))
+
+    def log(self, level: str, message: str, *args):
         """
-        로그 기록
+        로그 기록 (콘솔/파일 출력은 LogService 기록 스레드가 처리)
 
         Args:
             level: 로그 레벨 (INFO, SUCCESS, WARNING, ERROR, DEBUG)
-            message: 메시지
+            message: 메시지 (args가 있으면 % 포맷 문자열, 포맷팅은 기록 스레드에서)
+            *args: 포맷 인자
         """
-        # DEBUG 로그는 verbose 모드일 때만 출력
-        if level == "DEBUG" and not self.verbose:
-            return
-
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        log_line = f"[{timestamp}] {level}: {message}"
-
-        # 콘솔 출력
-        print(log_line)
-
-        # 파일 기록
-        with open(self.log_file, 'a', encoding='utf-8') as f:
-            f.write(log_line + '\n')
+        self.log_service.log(level, message, *args)
 
     def check_stop_key(self) -> bool:
         """
@@ -129,133 +186,152 @@ class BulkDependentInput:
 
     def cleanup(self):
         """리소스 정리"""
+        prefetch, self._prefetch = self._prefetch, None
+        if prefetch is not None:
+            prefetch.close()
+        self.journal.close()
         self.hotkey_manager.cleanup()
+        self.log_service.close()
 
     def read_current_employee_no(self) -> str:
         """
         현재 선택된 사원의 사번 읽기 (클립보드 방식)
 
         Returns:
-            사번
+            사번 (빈 칸으로 확인되면 빈 문자열)
+
+        Raises:
+            ClipboardTimeout: 복사가 반영되지 않아 사번을 알 수 없는 경우
         """
-        start_time = time.time()
+        with self.metrics.span("사번 읽기"):
+            # HOME → RIGHT → Ctrl+C → 사번 (이미 사번 열이면 이동 생략)
+            if not self._left_at_employee_no:
+                self.input_handler.type_keys_with_delay(self.left_spread, "{HOME}", pause=0.05)
+                self.input_handler.type_keys_with_delay(self.left_spread, "{RIGHT}", pause=0.05)
+                self._left_at_employee_no = True
+            # 빈 셀은 복사해도 클립보드가 바뀌지 않으므로 선택 열까지 두 칸 복사로 확인
+            employee_no = self.input_handler.copy_cell(self.left_spread, "+{LEFT}", "{RIGHT}")
 
-        # HOME → RIGHT → Ctrl+C → 사번
-        self.input_handler.type_keys_with_delay(self.left_spread, "{HOME}", pause=0.05)
-        self.input_handler.type_keys_with_delay(self.left_spread, "{RIGHT}", pause=0.05)
-        employee_no = self.input_handler.copy_from_control()
+        return employee_no
 
-        elapsed = time.time() - start_time
-        self.log("DEBUG", f"⏱️ 사번 읽기: {elapsed:.2f}초")
+    def snapshot_employee_list(self) -> EmployeeSnapshot:
+        """
+        왼쪽 사원 목록의 사번 열 전체를 한 번에 복사
 
-        return employee_no
+        사번 열 첫 행에서 Shift+Ctrl+End로 선택을 확장해 복사한 뒤
+        첫 번째 사원 위치(Ctrl+Home → HOME → LEFT)로 돌아옵니다.
 
-    def input_dependent(self, dep: DependentData) -> bool:
+        Returns:
+            EmployeeSnapshot (행 순서대로의 사번)
+        """
+        with self.metrics.span("사원목록 스냅샷"):
+            self.input_handler.type_keys_with_delay(self.left_spread, "^{HOME}", pause=0.05)
+            self.input_handler.type_keys_with_delay(self.left_spread, "{HOME}", pause=0.05)
+            self.input_handler.type_keys_with_delay(self.left_spread, "{RIGHT}", pause=0.05)
+            tsv = self.input_handler.copy_block(self.left_spread)
+
+            # 선택 해제 후 첫 번째 사원으로 복귀
+            self.input_handler.type_keys_with_delay(self.left_spread, "^{HOME}", pause=0.05)
+            self.input_handler.type_keys_with_delay(self.left_spread, "{HOME}", pause=0.05)
+            self.input_handler.type_keys_with_delay(self.left_spread, "{LEFT}", pause=0.05)
+            self._left_at_employee_no = False
+
+        snapshot = EmployeeSnapshot.parse(tsv)
+        self.log("INFO", f"사원 목록 스냅샷: {len(snapshot)}명")
+
+        return snapshot
+
+    def input_dependent(self, dep: NormalizedDependent) -> bool:
         """
         부양가족 한 명의 데이터 입력
 
         Args:
-            dep: 부양가족 데이터
+            dep: 정규화된 부양가족
 
         Returns:
             성공 여부
         """
-        start_time = time.time()
+        metrics = self.metrics
 
         try:
+            dep_start = time.perf_counter()
+
             # 1. 관계코드 입력
-            t1 = time.time()
-            self.input_handler.type_keys_with_delay(
-                self.right_spread, dep.relationship_code, with_spaces=False, pause=0.05
-            )
-            self.log("DEBUG", f"  ⏱️ 관계코드: {time.time()-t1:.2f}초")
+            with metrics.span("관계코드"):
+                self.input_handler.type_keys_with_delay(
+                    self.right_spread, dep.relationship_code, with_spaces=False, pause=0.05
+                )
 
             # 2. 성명 입력 + ENTER
-            t2 = time.time()
-            self.input_handler.type_keys_with_delay(
-                self.right_spread, dep.name, with_spaces=False, pause=0.05
-            )
-            self.input_handler.type_keys_with_delay(self.right_spread, "{ENTER}", pause=0.05)
-            self.log("DEBUG", f"  ⏱️ 성명: {time.time()-t2:.2f}초")
+            with metrics.span("성명"):
+                self.input_handler.type_keys_with_delay(
+                    self.right_spread, dep.name, with_spaces=False, pause=0.05
+                )
+                self.input_handler.type_keys_with_delay(self.right_spread, "{ENTER}", pause=0.05)
 
             # 3. 내/외국인 입력
-            t3 = time.time()
-            nationality_code = self.input_handler.convert_nationality(dep.nationality)
-            self.input_handler.type_keys_with_delay(
-                self.right_spread, nationality_code, with_spaces=False, pause=0.05
-            )
-            self.log("DEBUG", f"  ⏱️ 내/외국인: {time.time()-t3:.2f}초")
+            with metrics.span("내/외국인"):
+                self.input_handler.type_keys_with_delay(
+                    self.right_spread, dep.nationality_code, with_spaces=False, pause=0.05
+                )
 
             # 4. 번호 타입 입력
-            t4 = time.time()
-            id_type_code, id_number_clean = self.input_handler.clean_id_number(dep.id_number)
-            self.input_handler.type_keys_with_delay(
-                self.right_spread, id_type_code, with_spaces=False, pause=0.05
-            )
-            self.log("DEBUG", f"  ⏱️ 번호타입: {time.time()-t4:.2f}초")
-
-            # 5. 주민등록번호/외국인등록번호/여권번호 입력
-            t5 = time.time()
-            self.input_handler.type_keys_with_delay(
-                self.right_spread, id_number_clean, with_spaces=False, pause=0.05
-            )
-            self.log("DEBUG", f"  ⏱️ 번호입력: {time.time()-t5:.2f}초")
-
-            # 6. 나이는 자동 입력되므로 건너뜀
-
-            # 7. 기본공제여부
-            t7 = time.time()
-            is_basic_deduction = dep.basic_deduction.strip().upper() != 'N'
-            if not is_basic_deduction:
+            with metrics.span("번호타입"):
                 self.input_handler.type_keys_with_delay(
-                    self.right_spread, "0", with_spaces=False, pause=0.05
+                    self.right_spread, dep.id_type, with_spaces=False, pause=0.05
                 )
-            else:
+
+            # 5. 주민등록번호/외국인등록번호/여권번호 입력
+            with metrics.span("번호"):
                 self.input_handler.type_keys_with_delay(
-                    self.right_spread, "{RIGHT}", with_spaces=False, pause=0.05
+                    self.right_spread, dep.id_number, with_spaces=False, pause=0.05
                 )
-            self.log("DEBUG", f"  ⏱️ 기본공제: {time.time()-t7:.2f}초")
 
-            # 기본공제 Y인 경우에만 이후 필드 입력
-            if is_basic_deduction:
-                # 8. 장애유형 (0이면 건너뛰기)
-                #    만나이 60 이상 + 기본공제 Y → 경로공제 열이 자동체크되므로 한 칸 더 이동
-                t8 = time.time()
-                try:
-                    age = int(dep.age.strip())
-                except ValueError:
-                    age = 0
-                if age >= 60:
-                    self.input_handler.type_keys_with_delay(self.right_spread, "{RIGHT}", pause=0.05)
+            # 6. 나이는 자동 입력되므로 건너뜀
 
-                if dep.disability_type.strip() == '0' or not dep.disability_type.strip():
+            # 7. 기본공제여부
+            with metrics.span("기본공제"):
+                if not dep.basic_deduction:
                     self.input_handler.type_keys_with_delay(
-                        self.right_spread, "{RIGHT}", pause=0.05
+                        self.right_spread, "0", with_spaces=False, pause=0.05
                     )
                 else:
                     self.input_handler.type_keys_with_delay(
-                        self.right_spread, dep.disability_type.strip(), with_spaces=False, pause=0.05
+                        self.right_spread, "{RIGHT}", with_spaces=False, pause=0.05
                     )
-                self.log("DEBUG", f"  ⏱️ 장애유형: {time.time()-t8:.2f}초")
+
+            # 기본공제 Y인 경우에만 이후 필드 입력
+            if dep.basic_deduction:
+                # 8. 장애유형 (0이면 건너뛰기)
+                #    만나이 60 이상 + 기본공제 Y → 경로공제 열이 자동체크되므로 한 칸 더 이동
+                with metrics.span("장애유형"):
+                    if dep.age >= 60:
+                        self.input_handler.type_keys_with_delay(self.right_spread, "{RIGHT}", pause=0.05)
+
+                    if dep.disability_type == '0':
+                        self.input_handler.type_keys_with_delay(
+                            self.right_spread, "{RIGHT}", pause=0.05
+                        )
+                    else:
+                        self.input_handler.type_keys_with_delay(
+                            self.right_spread, dep.disability_type, with_spaces=False, pause=0.05
+                        )
 
                 # 9. 자녀공제 (연말관계가 4인 경우만)
-                t9 = time.time()
                 if dep.relationship_code == '4':
-                    child_code = '1' if dep.child_deduction.strip().upper() == 'Y' else '0'
-                    self.input_handler.type_keys_with_delay(
-                        self.right_spread, child_code, with_spaces=False, pause=0.05
-                    )
-                    time.sleep(0.3)
-                self.log("DEBUG", f"  ⏱️ 자녀공제: {time.time()-t9:.2f}초")
+                    with metrics.span("자녀공제"):
+                        child_code = '1' if dep.child_deduction else '0'
+                        self.input_handler.type_keys_with_delay(
+                            self.right_spread, child_code, with_spaces=False, pause=0.05
+                        )
+                        time.sleep(0.3)
 
             # 다음 부양가족으로 이동
-            t9 = time.time()
-            self.input_handler.type_keys_with_delay(self.right_spread, "{HOME}", pause=0.05)
-            self.input_handler.type_keys_with_delay(self.right_spread, "{DOWN}", pause=0.05)
-            self.log("DEBUG", f"  ⏱️ 다음행이동: {time.time()-t9:.2f}초")
+            with metrics.span("다음행"):
+                self.input_handler.type_keys_with_delay(self.right_spread, "{HOME}", pause=0.05)
+                self.input_handler.type_keys_with_delay(self.right_spread, "{DOWN}", pause=0.05)
 
-            elapsed = time.time() - start_time
-            self.log("DEBUG", f"⏱️ 부양가족 1명 전체: {elapsed:.2f}초")
+            metrics.record("부양가족 1명", time.perf_counter() - dep_start)
 
             return True
 
@@ -263,80 +339,377 @@ class BulkDependentInput:
             self.log("ERROR", f"input_dependent 실패: {e}")
             return False
 
+    def input_dependent_script(self, dep: NormalizedDependent, emp_no: str = "", emp_name: str = "",
+                               script: KeyScript = None) -> bool:
+        """
+        부양가족 한 명의 데이터를 키 스크립트 1개로 입력
+
+        Args:
+            dep: 정규화된 부양가족
+            emp_no: 사번 (스크립트 설명용)
+            emp_name: 사원 이름 (스크립트 설명용)
+            script: 미리 컴파일한 스크립트 (None이면 여기서 컴파일)
+
+        Returns:
+            성공 여부
+        """
+        try:
+            with self.metrics.span("부양가족 1명"):
+                if script is None:
+                    script = self._compile_script(dep, emp_no, emp_name)
+                self.script_executor.execute(self.right_spread, script)
+
+            return True
+
+        except Exception as e:
+            self.log("ERROR", f"input_dependent_script 실패: {e}")
+            return False
+
+    def _compile_script(self, dep: NormalizedDependent, emp_no: str, emp_name: str) -> KeyScript:
+        """부양가족 1명의 키 스크립트 컴파일 (verbose면 스크립트 로그)"""
+        script = self.script_compiler.compile(dep, emp_no, emp_name)
+        if self.verbose:
+            self.log("DEBUG", "  키 스크립트 (%s키): %s", script.keystroke_count(), script.render())
+        return script
+
+    def input_dependent_paste(self, dep: NormalizedDependent, row: str = None) -> bool:
+        """
+        부양가족 한 명을 TSV 한 행으로 붙여넣기
+
+        붙여넣은 행을 다시 복사해 확인하고, ERP가 붙여넣기를 받지 않았으면
+        같은 행에 필드별 입력(input_dependent)으로 다시 입력합니다.
+
+        Args:
+            dep: 정규화된 부양가족
+            row: 미리 만든 TSV 행 (None이면 여기서 생성)
+
+        Returns:
+            성공 여부
+        """
+        metrics = self.metrics
+
+        try:
+            dep_start = time.perf_counter()
+
+            with metrics.span("행 붙여넣기"):
+                if row is None:
+                    row = self.grid_comparer.paste_row(dep)
+                self.input_handler.paste_text(self.right_spread, row)
+
+            with metrics.span("붙여넣기 확인"):
+                tsv = self.input_handler.copy_block(self.right_spread, "+{END}")
+                self.input_handler.type_keys_with_delay(self.right_spread, "{HOME}", pause=0.05)
+                cells = tuple(tsv.split('\n', 1)[0].rstrip('\r').split('\t')) if tsv else ()
+                pasted = bool(cells) and self.grid_comparer.matches(GridRow(0, cells), dep)
+
+            if pasted:
+                self.input_handler.type_keys_with_delay(self.right_spread, "{DOWN}", pause=0.05)
+                metrics.record("부양가족 1명", time.perf_counter() - dep_start)
+                return True
+
+        except Exception as e:
+            self.log("ERROR", f"input_dependent_paste 실패: {e}")
+            return False
+
+        # 붙여넣기 거부 → 같은 행(첫 열)에 필드별 입력
+        self.log("WARNING", f"    붙여넣기 확인 실패 ({dep.name}), 필드별 입력으로 다시 입력")
+        self.paste_fallbacks += 1
+        return self.input_dependent(dep)
+
+    def input_dependents_block(self, to_input: List[NormalizedDependent], dependents: List[NormalizedDependent],
+                               block: str = None) -> int:
+        """
+        부양가족 여러 명을 TSV 블록 하나로 붙여넣기
+
+        입력 시작 행에서 한 번 붙여넣은 뒤 부양가족 목록 전체를 복사해 행 수와 내용을 확인합니다.
+        맞지 않으면 변경분 비교(sync_existing_dependents)로 틀린 행만 지우고
+        남은 부양가족을 행 붙여넣기(input_dependent_paste)로 다시 입력합니다.
+
+        Args:
+            to_input: 붙여넣을 부양가족 (커서는 첫 입력 행 첫 열)
+            dependents: 입력 후 그리드에 있어야 할 전체 부양가족 (유지한 행 포함)
+            block: 미리 만든 TSV 블록 (None이면 여기서 생성)
+
+        Returns:
+            입력 성공한 부양가족 수
+        """
+        metrics = self.metrics
+        block_start = time.perf_counter()
+
+        try:
+            with metrics.span("블록 붙여넣기"):
+                if block is None:
+                    block = self.grid_comparer.paste_block(to_input)
+                self.input_handler.paste_text(
+                    self.right_spread, block,
+                    sleep_after=0.1 + 0.05 * len(to_input)
+                )
+
+            with metrics.span("블록 확인"):
+                self.input_handler.type_keys_with_delay(self.right_spread, "^{HOME}", pause=0.05)
+                self.input_handler.type_keys_with_delay(self.right_spread, "{HOME}", pause=0.05)
+                rows = parse_grid(self.input_handler.copy_block(self.right_spread))
+        except Exception as e:
+            self.log("ERROR", f"input_dependents_block 실패: {e}")
+            rows = None
+
+        if rows is not None and len(rows) == len(dependents) \
+                and self.grid_comparer.diff(rows, dependents).unchanged:
+            metrics.record("블록 1회", time.perf_counter() - block_start)
+            return len(to_input)
+
+        # 행 수/내용 불일치 → 틀린 행만 지우고 행 단위로 다시 입력
+        found = "읽기 실패" if rows is None else f"{len(rows)}행"
+        self.log("WARNING", f"    블록 붙여넣기 확인 실패 ({found}/{len(dependents)}행), 행 단위로 다시 입력")
+        self.block_fallbacks += 1
+
+        retry = self.sync_existing_dependents(dependents)
+        if retry is None:
+            try:
+                self.clear_existing_dependents()
+            except ClipboardTimeout as e:
+                self.log("ERROR", f"    기존 부양가족 확인 실패: {e}")
+                return 0
+            retry = dependents
+        if self._delete_stopped:
+            return 0
+        if retry and not self._right_at_input_row:
+            self.input_handler.type_keys_with_delay(self.right_spread, "^{HOME}", pause=0.05)
+            self.input_handler.type_keys_with_delay(self.right_spread, "{HOME}", pause=0.05)
+            self.input_handler.type_keys_with_delay(self.right_spread, "{DOWN}", pause=0.05)
+        self._right_at_input_row = False
+
+        failed = 0
+        for i, dep in enumerate(retry):
+            if self.check_stop_key():
+                failed += len(retry) - i
+                break
+            if not self.input_dependent_paste(dep):
+                failed += 1
+                self.log("ERROR", f"    [X] {dep.name} 실패")
+        return max(0, len(to_input) - failed)
+
     def clear_existing_dependents(self) -> int:
         """
         오른쪽 스프레드에서 기존 부양가족 행을 모두 삭제
 
-        1행과 2행의 관계코드를 비교하여 다르면 2행을 F5+y로 삭제.
-        같아질 때까지 반복.
+        2행(첫 부양가족 행)의 관계코드를 복사해 보고, 값이 있으면 F5+y로 삭제.
+        빈 행으로 확인되면(1행 본인과 함께 두 칸 복사) 종료.
+        중지 요청으로 멈추면 _delete_stopped가 True가 됩니다 (행이 남아 있을 수 있음).
 
         Returns:
             삭제한 행 수
+
+        Raises:
+            ClipboardTimeout: 복사가 반영되지 않아 2행이 비었는지 알 수 없는 경우
         """
         deleted = 0
         max_attempts = 100  # 무한루프 방지
+        self._right_at_input_row = False
+        self._delete_stopped = False
 
         for _ in range(max_attempts):
             if self.check_stop_key():
+                self._delete_stopped = True
                 break
 
-            # 1행 관계코드 읽기
+            # 2행 관계코드 읽기
             self.input_handler.type_keys_with_delay(self.right_spread, "^{HOME}", pause=0.05)
             self.input_handler.type_keys_with_delay(self.right_spread, "{HOME}", pause=0.05)
-            row1_value = self.input_handler.copy_from_control(self.right_spread)
-
-            # 2행 관계코드 읽기
             self.input_handler.type_keys_with_delay(self.right_spread, "{DOWN}", pause=0.05)
-            row2_value = self.input_handler.copy_from_control(self.right_spread)
+            # 마지막에는 항상 빈 행을 확인하므로 타임아웃을 기다리지 않고 바로 두 칸 복사
+            row2_value = self.input_handler.copy_cell(self.right_spread, "+{UP}", "{DOWN}", single_first=False)
 
-            if row1_value == row2_value:
-                # 같으면 부양가족 없음, 종료
+            if not row2_value:
+                # 빈 행이면 부양가족 없음, 종료 (커서는 2행 첫 열)
+                self._right_at_input_row = True
                 break
 
-            # 다르면 2행 삭제 (F5 → 글로벌 y)
-            self.input_handler.type_keys_with_delay(self.right_spread, "{F5}", sleep_after=0.2, pause=0.05)
-            keyboard.press_and_release('y')
-            time.sleep(0.1 * self.global_delay)
+            # 값이 있으면 2행 삭제 (F5 → 글로벌 y)
+            # 삭제 확인 창에 y가 가야 하므로 F5부터 y까지 전경 창 독점
+            with self.backend.exclusive(self.right_spread):
+                self.input_handler.type_keys_with_delay(self.right_spread, "{F5}", sleep_after=0.2, pause=0.05)
+                self.backend.press_global('y')
+            self.input_handler.wait_for_idle(self.right_spread, 0.1)
             deleted += 1
-            self.log("DEBUG", f"  기존 부양가족 행 삭제 ({deleted}번째)")
+            self.log("DEBUG", "  기존 부양가족 행 삭제 (%s번째)", deleted)
 
         if deleted > 0:
             self.log("INFO", f"  → 기존 부양가족 {deleted}명 삭제 완료")
 
         return deleted
 
-    def _process_with_employee_no(self, emp_no: str) -> Dict:
+    def sync_existing_dependents(self, dependents: List[NormalizedDependent]) -> Optional[List[NormalizedDependent]]:
+        """
+        오른쪽 스프레드의 기존 부양가족을 CSV와 비교해 다른 행만 삭제
+
+        부양가족 목록을 한 번에 복사해 비교하고, 맞는 부양가족이 없는 행만
+        아래쪽 행부터 F5+y로 삭제합니다. 새로 입력할 부양가족이 있으면
+        커서를 남은 행 바로 아래로 옮겨 둡니다. 모두 같으면 복사 외의 키 입력은 없습니다.
+        중지 요청으로 삭제가 멈추면 _delete_stopped가 True가 되고 빈 리스트를 돌려줍니다.
+
+        Args:
+            dependents: 정렬된 부양가족 리스트 (본인 제외)
+
+        Returns:
+            새로 입력할 부양가족 리스트. 목록을 읽지 못하면 None
         """
-        이미 읽은 사번으로 부양가족 처리
+        self._right_at_input_row = False
+        self._delete_stopped = False
+
+        self.input_handler.type_keys_with_delay(self.right_spread, "^{HOME}", pause=0.05)
+        self.input_handler.type_keys_with_delay(self.right_spread, "{HOME}", pause=0.05)
+        rows = parse_grid(self.input_handler.copy_block(self.right_spread))
+        if rows is None:
+            self.log("WARNING", "  → 기존 부양가족 목록 읽기 실패, 전체 삭제 후 다시 입력")
+            return None
+
+        diff = self.grid_comparer.diff(rows, dependents)
+        if diff.unchanged:
+            self.log("INFO", f"  → 기존 부양가족 {len(diff.kept)}명 모두 일치, 변경 없음")
+            return []
+
+        for row in diff.deleted:
+            if self.check_stop_key():
+                self._delete_stopped = True
+                return []
+            self.input_handler.type_keys_with_delay(self.right_spread, "^{HOME}", pause=0.05)
+            self.input_handler.type_keys_with_delay(self.right_spread, f"{{HOME}}{{DOWN {row.row}}}", pause=0.05)
+            # 삭제 확인 창에 y가 가야 하므로 F5부터 y까지 전경 창 독점
+            with self.backend.exclusive(self.right_spread):
+                self.input_handler.type_keys_with_delay(self.right_spread, "{F5}", sleep_after=0.2, pause=0.05)
+                self.backend.press_global('y')
+            self.input_handler.wait_for_idle(self.right_spread, 0.1)
+            self.log("DEBUG", "  기존 부양가족 행 삭제 (%s행: %s)", row.row, row.cell('성명'))
+
+        self.log("INFO", f"  → 유지 {len(diff.kept)}명 / 삭제 {len(diff.deleted)}명 / 입력 {len(diff.appended)}명")
+
+        if diff.appended:
+            # 남은 행 바로 아래(첫 빈 행)로 이동
+            self.input_handler.type_keys_with_delay(self.right_spread, "^{HOME}", pause=0.05)
+            self.input_handler.type_keys_with_delay(self.right_spread, f"{{HOME}}{{DOWN {len(diff.kept) + 1}}}", pause=0.05)
+            self._right_at_input_row = True
+
+        return diff.appended
+
+    def build_payload(self, emp_no: str) -> EmployeePayload:
+        """
+        사원 1명의 입력 데이터 준비 (키 입력 없음, 작업 스레드에서도 호출)
+
+        정규화된 부양가족(본인 제외, 정렬 완료)과 저널 해시에 입력 방식별 키 스크립트 또는 TSV 행을 붙입니다.
 
         Args:
             emp_no: 사번
 
         Returns:
-            결과 딕셔너리
+            EmployeePayload
         """
-        start_time = time.time()
+        employee = self.employees.get(emp_no)
+        if employee is None:
+            employee = normalize_employee(emp_no, [])
+        emp_name = employee.employee_name
+        dependents = list(employee.dependents)
+
+        encoded = {}
+        if self.input_mode == INPUT_MODE_SCRIPT:
+            encoded = {id(d): self._compile_script(d, emp_no, emp_name) for d in dependents}
+        elif self.input_mode in (INPUT_MODE_PASTE, INPUT_MODE_BLOCK):
+            encoded = {id(d): self.grid_comparer.paste_row(d) for d in dependents}
+
+        digest = employee.digest
+        return EmployeePayload(emp_no, emp_name, dependents, digest, encoded)
+
+    def _process_with_employee_no(self, emp_no: str, payload: EmployeePayload = None) -> Dict:
+        """
+        이미 읽은 사번으로 부양가족 처리 (진행 저널 기록)
 
+        resume 모드에서 저널에 완료로 기록되어 있고 CSV 부양가족이 그때와 같으면
+        오른쪽 스프레드를 건드리지 않고 건너뜁니다.
+
+        Args:
+            emp_no: 사번
+            payload: 미리 준비한 입력 데이터 (None이면 여기서 준비)
+
+        Returns:
+            결과 딕셔너리
+        """
         if not emp_no:
             return {'status': 'error', 'reason': 'empty_employee_no'}
 
-        # CSV에서 사원 이름 가져오기 (로그용)
-        emp_name = ""
-        if emp_no in self.csv_data:
-            first_dep = self.csv_data[emp_no][0]
-            emp_name = first_dep.employee_name
+        if payload is None:
+            payload = self.build_payload(emp_no)
+        digest = payload.digest
+        if self.resume and self.journal.is_done(emp_no, digest):
+            self.log("INFO", f"이미 완료 (저널): {emp_no}, 건너뜀")
+            return {'status': 'skip', 'reason': 'journaled', 'employee_no': emp_no}
+
+        result = self._input_employee_dependents(payload)
+
+        if result['status'] == 'error':
+            status = STATUS_ERROR
+        elif result['status'] == 'stopped' or result.get('success', 0) < result.get('total', 0):
+            status = STATUS_PARTIAL
+        else:
+            status = STATUS_DONE
+        self.journal.record(emp_no, status, digest, result=result['status'])
+
+        return result
+
+    def _input_employee_dependents(self, payload: EmployeePayload) -> Dict:
+        """
+        사원 1명의 기존 부양가족 삭제(또는 비교) 후 입력
+
+        Args:
+            payload: 사원 1명의 입력 데이터 (build_payload)
+
+        Returns:
+            결과 딕셔너리
+        """
+        start_time = time.perf_counter()
+
+        emp_no = payload.employee_no
+        emp_name = payload.employee_name
+        dependents = payload.dependents
 
         self.log("INFO", f"처리 시작: {emp_no} ({emp_name})")
 
-        # 오른쪽 스프레드로 포커스 이동 → 기존 부양가족 삭제
-        self.right_spread.set_focus()
-        self.clear_existing_dependents()
+        # 오른쪽 스프레드로 포커스 이동 → 기존 부양가족 삭제 (변경분 모드면 다른 행만)
+        self.input_handler.focus(self.right_spread)
+        to_input = None
+        if self.sync_mode:
+            with self.metrics.span("변경분 비교"):
+                to_input = self.sync_existing_dependents(dependents)
+        if to_input is None:
+            try:
+                with self.metrics.span("기존 삭제"):
+                    self.clear_existing_dependents()
+            except ClipboardTimeout as e:
+                # 2행이 비었는지 모르는 채로 입력하면 기존 행과 섞이므로 이 사원은 실패 처리
+                self.log("ERROR", f"  → 기존 부양가족 확인 실패: {e}")
+                self.input_handler.focus(self.left_spread, 0.1)
+                return {
+                    'status': 'error',
+                    'reason': 'copy_failed',
+                    'employee_no': emp_no,
+                    'employee_name': emp_name
+                }
+            to_input = dependents
+
+        if self._delete_stopped:
+            # 기존 행이 일부만 지워진 상태 → 완료로 기록하지 않음 (저널에는 PARTIAL)
+            self.log("WARNING", "  → 중지 요청으로 기존 부양가족 삭제 중단")
+            self.input_handler.focus(self.left_spread, 0.1)
+            return {
+                'status': 'stopped',
+                'reason': 'stopped_during_delete',
+                'employee_no': emp_no,
+                'employee_name': emp_name
+            }
 
         # CSV 데이터 찾기
-        if emp_no not in self.csv_data:
+        if emp_no not in self.employees:
             self.log("INFO", f"  → CSV 데이터 없음, 기존 삭제만 수행")
-            self.left_spread.set_focus()
-            time.sleep(0.1 * self.global_delay)
+            self.input_handler.focus(self.left_spread, 0.1)
             return {
                 'status': 'skip',
                 'reason': 'no_csv_data',
@@ -344,15 +717,9 @@ class BulkDependentInput:
                 'employee_name': emp_name
             }
 
-        # 부양가족 필터링 (본인 제외) 및 정렬
-        all_dependents = self.csv_data[emp_no]
-        dependents = [d for d in all_dependents if d.relationship_code != '0']
-        dependents = sorted(dependents, key=lambda d: (d.relationship_code, d.name))
-
         if not dependents:
             self.log("INFO", f"  → 부양가족 없음, 기존 삭제만 수행")
-            self.left_spread.set_focus()
-            time.sleep(0.1 * self.global_delay)
+            self.input_handler.focus(self.left_spread, 0.1)
             return {
                 'status': 'skip',
                 'reason': 'no_dependents',
@@ -360,42 +727,59 @@ class BulkDependentInput:
                 'employee_name': emp_name
             }
 
-        # 입력 시작 위치로 이동
-        self.input_handler.type_keys_with_delay(self.right_spread, "^{HOME}", pause=0.05)
-        self.input_handler.type_keys_with_delay(self.right_spread, "{HOME}", pause=0.05)
-        self.input_handler.type_keys_with_delay(self.right_spread, "{DOWN}", pause=0.05)
+        # 입력 시작 위치로 이동 (삭제 확인 직후면 이미 입력 시작 행 첫 열)
+        if to_input and not self._right_at_input_row:
+            self.input_handler.type_keys_with_delay(self.right_spread, "^{HOME}", pause=0.05)
+            self.input_handler.type_keys_with_delay(self.right_spread, "{HOME}", pause=0.05)
+            self.input_handler.type_keys_with_delay(self.right_spread, "{DOWN}", pause=0.05)
+        self._right_at_input_row = False
 
         # 각 부양가족 입력
-        self.log("INFO", f"  → 부양가족 {len(dependents)}명 입력 시작")
+        kept_count = len(dependents) - len(to_input)
+        if to_input:
+            self.log("INFO", f"  → 부양가족 {len(to_input)}명 입력 시작")
         success_count = 0
 
-        for dep in dependents:
+        if self.input_mode == INPUT_MODE_BLOCK and to_input:
+            to_input_each = []
+            block = '\r\n'.join(payload.encoded_for(d) or self.grid_comparer.paste_row(d) for d in to_input)
+            success_count = self.input_dependents_block(to_input, dependents, block)
+        else:
+            to_input_each = to_input
+
+        for dep in to_input_each:
             # 중지 요청 체크
             if self.check_stop_key():
                 self.log("WARNING", "  → 중지 요청으로 부양가족 입력 중단")
                 break
 
-            if self.input_dependent(dep):
+            if self.input_mode == INPUT_MODE_SCRIPT:
+                ok = self.input_dependent_script(dep, emp_no, emp_name, script=payload.encoded_for(dep))
+            elif self.input_mode == INPUT_MODE_PASTE:
+                ok = self.input_dependent_paste(dep, row=payload.encoded_for(dep))
+            else:
+                ok = self.input_dependent(dep)
+
+            if ok:
                 success_count += 1
                 self.log("SUCCESS", f"    [OK] {dep.name} (관계: {dep.relationship_code})")
             else:
                 self.log("ERROR", f"    [X] {dep.name} 실패")
 
-        self.log("INFO", f"  → 완료: {success_count}/{len(dependents)}")
+        self.log("INFO", f"  → 완료: {success_count}/{len(to_input)}" + (f" (유지 {kept_count}명)" if kept_count else ""))
 
         # 왼쪽 스프레드로 포커스 복귀
-        self.left_spread.set_focus()
-        time.sleep(0.1 * self.global_delay)
+        self.input_handler.focus(self.left_spread, 0.1)
 
-        elapsed = time.time() - start_time
-        self.log("DEBUG", f"⏱️ 사원 1명 전체 처리: {elapsed:.2f}초")
+        self.metrics.record("사원 1명", time.perf_counter() - start_time)
 
         return {
             'status': 'success',
             'employee_no': emp_no,
             'employee_name': emp_name,
-            'total': len(dependents),
-            'success': success_count
+            'total': len(to_input),
+            'success': success_count,
+            'kept': kept_count
         }
 
     def process_current_employee(self) -> Dict:
@@ -429,11 +813,27 @@ class BulkDependentInput:
         self.log("INFO", "=== 부양가족 대량 입력 시작 ===")
         self.log("INFO", f"CSV 파일: {self.csv_reader.csv_path}")
         self.log("INFO", f"CSV 사원 수: {len(self.csv_data)}")
+        self.log("INFO" if self.validation.ok else "WARNING", f"CSV 검증: {self.validation.summary()}")
+        for issue in self.validation.errors[:20]:
+            self.log("WARNING", f"  {issue.line}행 [{issue.employee_no} {issue.name}] {issue.column}: {issue.message}")
         if count is None:
             self.log("INFO", f"처리할 사원 수: 전체 (빈 칸까지)")
         else:
             self.log("INFO", f"처리할 사원 수: {count}명")
 
+        # 실행 계획 (예상 소요시간)
+        self.plan = self.build_plan(count)
+        self._actual_total = 0.0
+        self._estimated_total = 0.0
+        self.log("INFO", f"예상 소요시간: {format_duration(self.plan.total_estimate)} "
+                         f"(CSV 사원 {len(self.plan.employees)}명, 키 입력 {self.plan.total_keystrokes}회)")
+
+        if self.resume:
+            self.journal.log_resume()
+
+        if self.prefetch_depth > 0 and not self.snapshot_mode:
+            self.log("WARNING", "입력 데이터 미리 준비는 스냅샷 모드에서만 사용합니다 (사원 순서를 미리 알아야 함)")
+
         if dry_run:
             self.log("INFO", "!!! DRY RUN 모드 - 실제 입력 안함 !!!")
 
@@ -448,13 +848,70 @@ class BulkDependentInput:
             self.input_handler.type_keys_with_delay(self.left_spread, "^{HOME}", pause=0.05)
             self.input_handler.type_keys_with_delay(self.left_spread, "{HOME}", pause=0.05)
             self.input_handler.type_keys_with_delay(self.left_spread, "{LEFT}", pause=0.05)
+            self._left_at_employee_no = False
         else:
             self.log("INFO", "현재 위치에서 시작...")
 
         # 각 사원 처리
         results = []
 
-        if count is None:
+        if self.snapshot_mode:
+            # 스냅샷 모드: 사번을 한 번에 읽고 {DOWN}만으로 이동
+            current_no = None
+            if self.start_from_current:
+                try:
+                    current_no = self.read_current_employee_no()
+                except ClipboardTimeout as e:
+                    self.log("WARNING", f"현재 사번 읽기 실패 ({e}), 첫 번째 사원부터 시작")
+            snapshot = self.snapshot_employee_list()
+
+            start_idx = 0
+            if current_no:
+                start_idx = snapshot.index_of(current_no)
+                if start_idx is None:
+                    self.log("WARNING", f"현재 사번({current_no})이 목록에 없어 첫 번째 사원부터 시작")
+                    start_idx = 0
+                elif start_idx > 0:
+                    self.input_handler.type_keys_with_delay(self.left_spread, f"{{DOWN {start_idx}}}", pause=0.05)
+
+            targets = snapshot[start_idx:]
+            if count is not None:
+                targets = targets[:count]
+
+            # 작업 스레드가 다음 사원들의 입력 데이터를 미리 준비
+            if self.prefetch_depth > 0 and not dry_run:
+                self._prefetch = PrefetchPipeline(
+                    targets, self.build_payload, depth=self.prefetch_depth, log_callback=self.log
+                )
+                self._prefetch.start()
+                self.log("INFO", f"입력 데이터 미리 준비: {self.prefetch_depth}명 앞서")
+
+            for i, emp_no in enumerate(targets):
+                if self.check_stop_key():
+                    self.log("WARNING", "중지 요청으로 처리 중단")
+                    break
+
+                self.log("INFO", f"\n[{i+1}/{len(targets)}]")
+                emp_start = time.time()
+
+                if not dry_run:
+                    prefetch = self._prefetch     # cleanup()이 다른 스레드에서 None으로 바꿀 수 있음
+                    payload = prefetch.take(emp_no) if prefetch else None
+                    result = self._process_with_employee_no(emp_no, payload)
+                    results.append(result)
+                    self._report_progress(emp_no, time.time() - emp_start)
+                else:
+                    self._dry_run_employee(emp_no)
+
+                if i < len(targets) - 1:
+                    self.input_handler.type_keys_with_delay(self.left_spread, "{DOWN}", pause=0.05)
+
+            prefetch = self._prefetch
+            if prefetch is not None:
+                prefetch.close()
+                self._prefetch = None
+
+        elif count is None:
             # 전체 처리 모드: 빈 칸까지
             i = 0
             prev_emp_no = None
@@ -466,12 +923,17 @@ class BulkDependentInput:
                     break
 
                 self.log("INFO", f"\n[{i+1}]")
+                emp_start = time.time()
 
-                emp_no = self.read_current_employee_no()
+                try:
+                    emp_no = self.read_current_employee_no()
+                except ClipboardTimeout as e:
+                    self.log("ERROR", f"사번 읽기 실패, 처리 중단: {e}")
+                    break
 
-                # 빈 칸 감지
+                # 마지막 사원에서는 {DOWN}이 움직이지 않아 같은 사번이 다시 읽힘
                 if i > 0 and emp_no == prev_emp_no:
-                    self.log("INFO", "빈 칸 도달, 처리 종료")
+                    self.log("INFO", "목록 끝 도달, 처리 종료")
                     break
 
                 if not emp_no:
@@ -481,13 +943,9 @@ class BulkDependentInput:
                 if not dry_run:
                     result = self._process_with_employee_no(emp_no)
                     results.append(result)
+                    self._report_progress(emp_no, time.time() - emp_start)
                 else:
-                    emp_name = ""
-                    if emp_no in self.csv_data:
-                        emp_name = self.csv_data[emp_no][0].employee_name
-                    self.log("INFO", f"읽음: {emp_no} ({emp_name})")
-                    has_data = emp_no in self.csv_data
-                    self.log("INFO", f"  → CSV 데이터: {'있음' if has_data else '없음'}")
+                    self._dry_run_employee(emp_no)
 
                 prev_emp_no = emp_no
                 self.input_handler.type_keys_with_delay(self.left_spread, "{DOWN}", pause=0.05)
@@ -503,18 +961,19 @@ class BulkDependentInput:
                     break
 
                 self.log("INFO", f"\n[{i+1}/{count}]")
+                emp_start = time.time()
 
                 if not dry_run:
                     result = self.process_current_employee()
                     results.append(result)
+                    self._report_progress(result.get('employee_no'), time.time() - emp_start)
                 else:
-                    emp_no = self.read_current_employee_no()
-                    emp_name = ""
-                    if emp_no and emp_no in self.csv_data:
-                        emp_name = self.csv_data[emp_no][0].employee_name
-                    self.log("INFO", f"읽음: {emp_no} ({emp_name})")
-                    has_data = emp_no in self.csv_data if emp_no else False
-                    self.log("INFO", f"  → CSV 데이터: {'있음' if has_data else '없음'}")
+                    try:
+                        emp_no = self.read_current_employee_no()
+                    except ClipboardTimeout as e:
+                        self.log("ERROR", f"사번 읽기 실패, 처리 중단: {e}")
+                        break
+                    self._dry_run_employee(emp_no)
 
                 if i < count - 1:
                     self.input_handler.type_keys_with_delay(self.left_spread, "{DOWN}", pause=0.05)
@@ -529,14 +988,28 @@ class BulkDependentInput:
             self.log("INFO", "\n=== 결과 요약 ===")
             self.log("INFO", f"처리 사원: {summary['processed']}")
             self.log("INFO", f"성공: {summary['success']}")
-            self.log("INFO", f"건너뜀: {summary['skipped']}")
+            self.log("INFO", f"건너뜀: {summary['skipped']}" + (f" (저널 완료 {summary['journaled']})" if summary['journaled'] else ""))
             self.log("INFO", f"실패: {summary['failed']}")
+            if summary['stopped']:
+                self.log("INFO", f"중단 (기존 삭제 도중): {summary['stopped']}")
             self.log("INFO", f"입력 부양가족: {summary['total_dependents']}")
+            if self.input_mode == INPUT_MODE_PASTE:
+                summary['paste_fallbacks'] = self.paste_fallbacks
+                self.log("INFO", f"붙여넣기 확인 실패 → 필드별 입력: {self.paste_fallbacks}명")
+            if self.input_mode == INPUT_MODE_BLOCK:
+                summary['block_fallbacks'] = self.block_fallbacks
+                self.log("INFO", f"블록 확인 실패 → 행 단위 입력: {self.block_fallbacks}명")
+            if self.input_handler.key_input.background:
+                summary['foreground_fallbacks'] = self.input_handler.key_input.fallbacks
+                self.log("INFO", f"전경 창으로 보낸 키 묶음 (복사/붙여넣기/삭제 등): "
+                                 f"{self.input_handler.key_input.fallbacks}회")
             if minutes > 0:
                 self.log("INFO", f"총 소요시간: {minutes}분 {seconds:.1f}초")
             else:
                 self.log("INFO", f"총 소요시간: {seconds:.1f}초")
 
+            summary['metrics'] = self.export_metrics()
+
             self.cleanup()
             return summary
         else:
@@ -549,18 +1022,132 @@ class BulkDependentInput:
             self.cleanup()
             return {}
 
+    def export_metrics(self) -> List[Dict]:
+        """
+        구간별 소요시간(p50/p95/max) 로그 출력 및 JSON/CSV 저장 (로그 파일과 같은 이름)
+
+        Returns:
+            Metrics.summary() 결과
+        """
+        rows = self.metrics.summary()
+        if not rows:
+            return rows
+
+        self.log("INFO", "\n=== 구간별 소요시간 ===\n" + format_summary(rows))
+        try:
+            self.metrics.export_json(self.log_file.with_suffix(".metrics.json"))
+            self.metrics.export_csv(self.log_file.with_suffix(".metrics.csv"))
+            self.log("INFO", f"구간별 소요시간 저장: {self.log_file.with_suffix('.metrics.json')}")
+        except OSError as e:
+            self.log("WARNING", f"구간별 소요시간 저장 실패: {e}")
+        return rows
+
+    def _dry_run_employee(self, emp_no: str):
+        """DRY RUN: 읽은 사번과 CSV 데이터 유무만 출력"""
+        emp_name = ""
+        if emp_no and emp_no in self.employees:
+            emp_name = self.employees[emp_no].employee_name
+        self.log("INFO", f"읽음: {emp_no} ({emp_name})")
+        has_data = emp_no in self.employees if emp_no else False
+        self.log("INFO", f"  → CSV 데이터: {'있음' if has_data else '없음'}")
+        if has_data and self.input_mode == INPUT_MODE_SCRIPT:
+            self._log_scripts(emp_no)
+
+    def build_plan(self, count: int = None) -> RunPlan:
+        """
+        현재 설정으로 실행 계획 생성
+
+        Args:
+            count: 처리할 사원 수 (None이면 CSV 전체)
+
+        Returns:
+            RunPlan
+        """
+        planner = RunPlanner(
+            self.script_compiler,
+            global_delay=self.global_delay,
+            input_mode=self.input_mode,
+            key_pause=self.key_pause,
+            start_from_current=self.start_from_current,
+            snapshot=self.snapshot_mode,
+            sync=self.sync_mode
+        )
+        return planner.build(self.employees, count)
+
+    def _report_progress(self, emp_no: str, elapsed: float):
+        """
+        사원 1명 처리 후 실제/예상 소요시간 보고
+
+        Args:
+            emp_no: 사번 (계획에 없으면 예상 시간 없음)
+            elapsed: 실제 소요시간 (초)
+        """
+        estimate = self.plan.estimate_for(emp_no) if emp_no else None
+        self._actual_total += elapsed
+        if estimate is not None:
+            self._estimated_total += estimate
+            self.log("INFO", f"  ⏱️ 실제 {elapsed:.1f}초 / 예상 {estimate:.1f}초 "
+                             f"(누적 실제 {format_duration(self._actual_total)} / 예상 {format_duration(self._estimated_total)})")
+        else:
+            self.log("INFO", f"  ⏱️ 실제 {elapsed:.1f}초 (계획에 없는 사원)")
+
+    def _log_scripts(self, emp_no: str):
+        """사원의 부양가족 키 스크립트 출력 (DRY RUN 확인용)"""
+        employee = self.employees[emp_no]
+        for dep in employee.dependents:
+            script = self.script_compiler.compile(dep, emp_no, employee.employee_name)
+            self.log("INFO", f"  → {script.description}: {script.render()} ({script.keystroke_count()}키)")
+
     def _summarize_results(self, results: List[Dict]) -> Dict:
         """결과 리스트 집계"""
         summary = {
             'processed': len(results),
             'success': len([r for r in results if r['status'] == 'success']),
             'skipped': len([r for r in results if r['status'] == 'skip']),
+            'journaled': len([r for r in results if r.get('reason') == 'journaled']),
             'failed': len([r for r in results if r['status'] == 'error']),
+            'stopped': len([r for r in results if r['status'] == 'stopped']),
             'total_dependents': sum(r.get('success', 0) for r in results)
         }
         return summary
 
 
+def build_run_plan(csv_path: str, count: int = None, global_delay: float = 1.0,
+                   input_mode: str = INPUT_MODE_KEYS, key_pause: float = 0.05,
+                   start_from_current: bool = False, assume_rerun: bool = False,
+                   snapshot_mode: bool = False, sync_mode: bool = False) -> RunPlan:
+    """
+    ERP 연결 없이 CSV만으로 실행 계획 생성 (시작 전 확인용)
+
+    Args:
+        csv_path: CSV 파일 경로
+        count: 처리할 사원 수 (None이면 CSV 전체)
+        global_delay: 전역 지연 시간 배율
+        input_mode: 부양가족 입력 방식
+        key_pause: script 방식의 키 사이 간격 (초)
+        start_from_current: True면 첫 사원 이동 생략
+        assume_rerun: True면 기존 부양가족 삭제 비용 포함
+        snapshot_mode: True면 사원 목록 스냅샷 방식으로 계산
+        sync_mode: True면 변경분만 반영 방식으로 계산 (assume_rerun과 함께면 변경 없음 가정)
+
+    Returns:
+        RunPlan
+    """
+    csv_reader = CSVReader(csv_path)
+    compiler = DependentScriptCompiler()
+    planner = RunPlanner(
+        compiler,
+        global_delay=global_delay,
+        input_mode=input_mode,
+        key_pause=key_pause,
+        start_from_current=start_from_current,
+        assume_rerun=assume_rerun,
+        snapshot=snapshot_mode,
+        sync=sync_mode
+    )
+    return planner.build(normalize_employees(csv_reader.group_by_employee()), count)
+
+
 def main():
     """메인 함수"""
     parser = argparse.ArgumentParser(
@@ -579,6 +1166,39 @@ def main():
 
   # 실제 실행 (전체)
   python bulk_dependent_input.py --csv "테스트 데이터.csv"
+
+  # 동기화 배리어 대기 (고정 대기 대신 입력 처리 확인 후 즉시 진행)
+  python bulk_dependent_input.py --csv "테스트 데이터.csv" --wait-mode sync
+
+  # 부양가족 1명을 키 스크립트 1개로 전송
+  python bulk_dependent_input.py --csv "테스트 데이터.csv" --input-mode script
+
+  # 부양가족 1명을 TSV 1행으로 붙여넣기 (확인 실패 시 필드별 입력)
+  python bulk_dependent_input.py --csv "테스트 데이터.csv" --input-mode paste
+
+  # 사원 1명의 부양가족 전체를 한 번에 붙여넣기 (행 수 확인, 실패 시 행 단위)
+  python bulk_dependent_input.py --csv "테스트 데이터.csv" --input-mode block --snapshot
+
+  # 사원 목록을 한 번에 읽어 두고 {DOWN}만으로 이동
+  python bulk_dependent_input.py --csv "테스트 데이터.csv" --snapshot
+
+  # 다음 4명의 입력 데이터를 작업 스레드에서 미리 준비
+  python bulk_dependent_input.py --csv "테스트 데이터.csv" --snapshot --input-mode script --prefetch 4
+
+  # 재실행: 기존 부양가족과 비교해 바뀐 행만 삭제/입력
+  python bulk_dependent_input.py --csv "테스트 데이터.csv" --sync
+
+  # 중지/오류 후 이어서 실행 (완료된 사원은 이동만)
+  python bulk_dependent_input.py --csv "테스트 데이터.csv" --resume --snapshot
+
+  # 스프레드에 창 메시지로 입력 (입력 중에도 다른 창에서 작업 가능, 복사/붙여넣기/삭제는 전경)
+  python bulk_dependent_input.py --csv "테스트 데이터.csv" --key-input message --snapshot
+
+  # 실행 계획과 예상 소요시간만 출력 (ERP 연결 없음)
+  python bulk_dependent_input.py --csv "테스트 데이터.csv" --plan
+
+  # CSV 검증 보고서만 출력 (주민번호 검증번호, 코드 값, 중복 등, ERP 연결 없음)
+  python bulk_dependent_input.py --csv "테스트 데이터.csv" --validate
         """
     )
 
@@ -586,13 +1206,58 @@ def main():
     parser.add_argument('--count', type=int, default=None, help='처리할 사원 수 (미지정 시 전체)')
     parser.add_argument('--dry-run', action='store_true', help='실제 입력 없이 테스트')
     parser.add_argument('--delay', type=float, default=1.0, help='전역 지연 시간 배율 (0.5~2.0, 기본값: 1.0)')
+    parser.add_argument('--input-mode', choices=INPUT_MODES, default=INPUT_MODE_KEYS,
+                        help='부양가족 입력 방식 (keys=필드별 입력, script=키 스크립트 일괄 전송, '
+                             'paste=행 붙여넣기, block=부양가족 전체 블록 붙여넣기, 기본값: keys)')
+    parser.add_argument('--key-pause', type=float, default=0.05,
+                        help='script 방식의 키 사이 간격 (초, 기본값: 0.05)')
+    parser.add_argument('--wait-mode', choices=WAIT_MODES, default=WAIT_MODE_SLEEP,
+                        help='입력 후 대기 방식 (sleep=고정 대기, sync=동기화 배리어, 기본값: sleep)')
+    parser.add_argument('--snapshot', action='store_true',
+                        help='사원 목록 사번 열을 한 번에 복사해 두고 사원마다 다시 읽지 않음')
+    parser.add_argument('--sync', action='store_true',
+                        help='기존 부양가족을 한 번에 읽어 CSV와 다른 행만 삭제/입력 (재실행용)')
+    parser.add_argument('--resume', action='store_true',
+                        help='진행 저널에 완료로 기록된 사원은 건너뜀 (중지/오류 후 이어서 실행)')
+    parser.add_argument('--prefetch', type=int, default=0, metavar='N',
+                        help='스냅샷 모드에서 작업 스레드가 N명 앞서 입력 데이터를 준비 (기본값: 0=사용 안 함)')
+    parser.add_argument('--key-input', choices=KEY_INPUTS, default=KEY_INPUT_TYPE_KEYS,
+                        help='키 입력 방식 (type_keys=전경 창 입력, message=스프레드 핸들로 메시지 전송, '
+                             '기본값: type_keys)')
+    parser.add_argument('--plan', action='store_true', help='실행 계획과 예상 소요시간만 출력하고 종료')
+    parser.add_argument('--validate', action='store_true',
+                        help='CSV 검증 보고서만 출력하고 종료 (오류가 있으면 종료 코드 1)')
+    parser.add_argument('--assume-rerun', action='store_true',
+                        help='계획 계산 시 기존 부양가족 삭제 비용 포함 (재실행 가정)')
 
     args = parser.parse_args()
 
+    # CSV 검증만 출력
+    if args.validate:
+        report = validate_csv(args.csv)
+        print(report.to_text(limit=500))
+        sys.exit(0 if report.ok else 1)
+
+    # 실행 계획만 출력
+    if args.plan:
+        plan = build_run_plan(
+            args.csv, count=args.count, global_delay=args.delay,
+            input_mode=args.input_mode, key_pause=args.key_pause,
+            assume_rerun=args.assume_rerun, snapshot_mode=args.snapshot,
+            sync_mode=args.sync
+        )
+        print(plan.to_text())
+        return
+
     # 실행
     bulk = None
     try:
-        bulk = BulkDependentInput(args.csv, global_delay=args.delay)
+        bulk = BulkDependentInput(
+            args.csv, global_delay=args.delay, wait_mode=args.wait_mode,
+            input_mode=args.input_mode, key_pause=args.key_pause,
+            snapshot_mode=args.snapshot, sync_mode=args.sync, resume=args.resume,
+            prefetch_depth=args.prefetch, key_input=args.key_input
+        )
         bulk.run(count=args.count, dry_run=args.dry_run)
     except KeyboardInterrupt:
         print("\n\n중단됨 (Ctrl+C)")
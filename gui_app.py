@@ -9,8 +9,36 @@ import threading
 import queue
 import sys
 from pathlib import Path
-from bulk_dependent_input import BulkDependentInput
-from src.installment_automation import InstallmentAutomation
+from bulk_dependent_input import (
+    BulkDependentInput, build_run_plan, INPUT_MODE_KEYS, INPUT_MODE_SCRIPT, INPUT_MODE_PASTE, INPUT_MODE_BLOCK
+)
+from src.csv_validator import validate_csv
+from src.installment_automation import (
+    InstallmentAutomation, INSTALLMENT_INPUT_KEYS, INSTALLMENT_INPUT_STREAM, INSTALLMENT_INPUT_PASTE,
+    INSTALLMENT_INPUT_COLUMNS
+)
+from src.installment_grid import INSTALLMENT_THRESHOLD
+from src.key_input import KEY_INPUT_MESSAGE, KEY_INPUT_TYPE_KEYS
+from src.sync_barrier import WAIT_MODE_SLEEP, WAIT_MODE_SYNC
+
+# 부양가족 입력 방식 (표시 이름 → 모드)
+DEPENDENT_INPUT_MODES = {
+    "필드별 입력": INPUT_MODE_KEYS,
+    "스크립트 일괄 전송": INPUT_MODE_SCRIPT,
+    "행 붙여넣기": INPUT_MODE_PASTE,
+    "블록 붙여넣기": INPUT_MODE_BLOCK,
+}
+
+# 분납적용 입력 방식 (표시 이름 → 모드)
+INSTALLMENT_INPUT_MODE_NAMES = {
+    "필드별 입력": INSTALLMENT_INPUT_KEYS,
+    "행 단위 일괄 전송": INSTALLMENT_INPUT_STREAM,
+    "행 붙여넣기": INSTALLMENT_INPUT_PASTE,
+    "열 단위 일괄 붙여넣기": INSTALLMENT_INPUT_COLUMNS,
+}
+
+# "다음 사원 미리 준비" 체크 시 앞서 준비할 사원 수
+PREFETCH_DEPTH = 4
 
 # CustomTkinter 설정
 ctk.set_appearance_mode("dark")  # "light", "dark", "system"
@@ -124,6 +152,13 @@ class BulkInputGUI(ctk.CTk):
         self.global_delay_dep = ctk.StringVar(value="1.0")
         self.dry_run_dep = ctk.BooleanVar(value=False)
         self.start_from_current = ctk.BooleanVar(value=False)
+        self.sync_wait_dep = ctk.BooleanVar(value=False)
+        self.input_mode_dep = ctk.StringVar(value="필드별 입력")
+        self.snapshot_dep = ctk.BooleanVar(value=False)
+        self.sync_mode_dep = ctk.BooleanVar(value=False)
+        self.resume_dep = ctk.BooleanVar(value=False)
+        self.prefetch_dep = ctk.BooleanVar(value=False)
+        self.background_dep = ctk.BooleanVar(value=False)
         self.bulk_automation = None
 
         # 분납적용 변수
@@ -132,6 +167,10 @@ class BulkInputGUI(ctk.CTk):
         self.installment_count = ctk.StringVar()
         self.global_delay_inst = ctk.StringVar(value="1.0")
         self.dry_run_inst = ctk.BooleanVar(value=False)
+        self.resume_inst = ctk.BooleanVar(value=False)
+        self.background_inst = ctk.BooleanVar(value=False)
+        self.input_mode_inst = ctk.StringVar(value="필드별 입력")
+        self.with_checkbox_inst = ctk.BooleanVar(value=False)
         self.installment_automation = None
 
         # UI 생성
@@ -294,6 +333,24 @@ class BulkInputGUI(ctk.CTk):
             text_color="gray"
         ).pack(side="left", padx=5)
 
+        # 입력 방식
+        mode_frame = ctk.CTkFrame(options_frame)
+        mode_frame.pack(side="left", padx=10, pady=10)
+
+        ctk.CTkLabel(
+            mode_frame,
+            text="입력 방식:",
+            font=ctk.CTkFont(size=13)
+        ).pack(side="left", padx=5)
+
+        self.input_mode_menu_dep = ctk.CTkOptionMenu(
+            mode_frame,
+            variable=self.input_mode_dep,
+            values=list(DEPENDENT_INPUT_MODES.keys()),
+            width=150
+        )
+        self.input_mode_menu_dep.pack(side="left", padx=5)
+
         # 체크박스
         checkbox_frame = ctk.CTkFrame(tab)
         checkbox_frame.pack(padx=10, pady=5, fill="x")
@@ -314,6 +371,54 @@ class BulkInputGUI(ctk.CTk):
         )
         self.start_from_current_check.pack(side="left", padx=20, pady=10)
 
+        self.sync_wait_check_dep = ctk.CTkCheckBox(
+            checkbox_frame,
+            text="동기화 대기 (입력 처리 확인 후 진행)",
+            variable=self.sync_wait_dep,
+            font=ctk.CTkFont(size=13)
+        )
+        self.sync_wait_check_dep.pack(side="left", padx=20, pady=10)
+
+        self.snapshot_check_dep = ctk.CTkCheckBox(
+            checkbox_frame,
+            text="사원목록 일괄 읽기",
+            variable=self.snapshot_dep,
+            font=ctk.CTkFont(size=13)
+        )
+        self.snapshot_check_dep.pack(side="left", padx=20, pady=10)
+
+        self.sync_mode_check_dep = ctk.CTkCheckBox(
+            checkbox_frame,
+            text="변경분만 반영 (재실행)",
+            variable=self.sync_mode_dep,
+            font=ctk.CTkFont(size=13)
+        )
+        self.sync_mode_check_dep.pack(side="left", padx=20, pady=10)
+
+        self.resume_check_dep = ctk.CTkCheckBox(
+            checkbox_frame,
+            text="이어서 실행 (완료 사원 건너뜀)",
+            variable=self.resume_dep,
+            font=ctk.CTkFont(size=13)
+        )
+        self.resume_check_dep.pack(side="left", padx=20, pady=10)
+
+        self.prefetch_check_dep = ctk.CTkCheckBox(
+            checkbox_frame,
+            text="다음 사원 미리 준비 (일괄 읽기 시)",
+            variable=self.prefetch_dep,
+            font=ctk.CTkFont(size=13)
+        )
+        self.prefetch_check_dep.pack(side="left", padx=20, pady=10)
+
+        self.background_check_dep = ctk.CTkCheckBox(
+            checkbox_frame,
+            text="백그라운드 입력 (창 메시지)",
+            variable=self.background_dep,
+            font=ctk.CTkFont(size=13)
+        )
+        self.background_check_dep.pack(side="left", padx=20, pady=10)
+
         # 실행 버튼
         button_frame = ctk.CTkFrame(tab)
         button_frame.pack(padx=10, pady=10, fill="x")
@@ -329,6 +434,28 @@ class BulkInputGUI(ctk.CTk):
         )
         self.start_btn_dep.pack(side="left", padx=10, pady=10, fill="x", expand=True)
 
+        self.plan_btn_dep = ctk.CTkButton(
+            button_frame,
+            text="📋 실행 계획",
+            command=self.show_dependent_plan,
+            font=ctk.CTkFont(size=16, weight="bold"),
+            height=40,
+            fg_color="#3498db",
+            hover_color="#2980b9"
+        )
+        self.plan_btn_dep.pack(side="left", padx=10, pady=10, fill="x", expand=True)
+
+        self.validate_btn_dep = ctk.CTkButton(
+            button_frame,
+            text="✔ CSV 검증",
+            command=self.show_dependent_validation,
+            font=ctk.CTkFont(size=16, weight="bold"),
+            height=40,
+            fg_color="#9b59b6",
+            hover_color="#8e44ad"
+        )
+        self.validate_btn_dep.pack(side="left", padx=10, pady=10, fill="x", expand=True)
+
         self.stop_btn_dep = ctk.CTkButton(
             button_frame,
             text="■ 중지",
@@ -434,6 +561,24 @@ class BulkInputGUI(ctk.CTk):
             text_color="gray"
         ).pack(side="left", padx=5)
 
+        # 입력 방식
+        mode_frame = ctk.CTkFrame(options_frame)
+        mode_frame.pack(side="left", padx=10, pady=10)
+
+        ctk.CTkLabel(
+            mode_frame,
+            text="입력 방식:",
+            font=ctk.CTkFont(size=13)
+        ).pack(side="left", padx=5)
+
+        self.input_mode_menu_inst = ctk.CTkOptionMenu(
+            mode_frame,
+            variable=self.input_mode_inst,
+            values=list(INSTALLMENT_INPUT_MODE_NAMES.keys()),
+            width=150
+        )
+        self.input_mode_menu_inst.pack(side="left", padx=5)
+
         # 체크박스
         checkbox_frame = ctk.CTkFrame(tab)
         checkbox_frame.pack(padx=10, pady=5, fill="x")
@@ -446,12 +591,37 @@ class BulkInputGUI(ctk.CTk):
         )
         self.dry_run_check_inst.pack(side="left", padx=20, pady=10)
 
+        self.resume_check_inst = ctk.CTkCheckBox(
+            checkbox_frame,
+            text="이어서 실행 (완료 사원 건너뜀)",
+            variable=self.resume_inst,
+            font=ctk.CTkFont(size=13)
+        )
+        self.resume_check_inst.pack(side="left", padx=20, pady=10)
+
+        self.background_check_inst = ctk.CTkCheckBox(
+            checkbox_frame,
+            text="백그라운드 입력 (창 메시지)",
+            variable=self.background_inst,
+            font=ctk.CTkFont(size=13)
+        )
+        self.background_check_inst.pack(side="left", padx=20, pady=10)
+
+        self.with_checkbox_check_inst = ctk.CTkCheckBox(
+            checkbox_frame,
+            text=f"체크박스도 함께 (<={INSTALLMENT_THRESHOLD:,})",
+            variable=self.with_checkbox_inst,
+            font=ctk.CTkFont(size=13)
+        )
+        self.with_checkbox_check_inst.pack(side="left", padx=20, pady=10)
+
         # 안내 문구
         info_label = ctk.CTkLabel(
             tab,
             text="⚠️ 분납적용 다이얼로그를 열고, 첫 번째 사원의 총액 소득세 셀을 선택한 상태에서 시작\n"
                  "   총액(소득세/지방소득세) + 1차분납 소득세 + 2차분납 소득세 입력 (3차분납 자동)\n"
-                 "   총액 소득세 <= 100,000: 체크박스 선택 후 다음 사원 이동",
+                 f"   총액 소득세 <= {INSTALLMENT_THRESHOLD:,}: 체크박스 선택 후 다음 사원 이동\n"
+                 "   (체크박스도 함께: 금액 입력과 한 번에 처리, 체크박스 버튼을 따로 실행할 필요 없음)",
             font=ctk.CTkFont(size=12),
             text_color="#e67e22",
             justify="left"
@@ -484,6 +654,17 @@ class BulkInputGUI(ctk.CTk):
         )
         self.checkbox_btn_inst.pack(side="left", padx=10, pady=10, fill="x", expand=True)
 
+        self.verify_btn_inst = ctk.CTkButton(
+            button_frame,
+            text="✔ 입력 검증",
+            command=lambda: self.start_automation("verify"),
+            font=ctk.CTkFont(size=16, weight="bold"),
+            height=40,
+            fg_color="#8e44ad",
+            hover_color="#71368a"
+        )
+        self.verify_btn_inst.pack(side="left", padx=10, pady=10, fill="x", expand=True)
+
         self.stop_btn_inst = ctk.CTkButton(
             button_frame,
             text="■ 중지",
@@ -546,6 +727,8 @@ class BulkInputGUI(ctk.CTk):
             self._start_installment_automation()
         elif automation_type == "checkbox":
             self._start_checkbox_automation()
+        elif automation_type == "verify":
+            self._start_verify_installment()
 
     def _start_dependent_automation(self):
         """부양가족 입력 자동화 시작"""
@@ -585,6 +768,21 @@ class BulkInputGUI(ctk.CTk):
                 messagebox.showerror("오류", "입력 속도는 숫자여야 합니다.")
                 return
 
+        # CSV 검증 (오류가 있으면 계속할지 확인)
+        try:
+            report = validate_csv(csv_file)
+        except Exception as e:
+            messagebox.showerror("오류", f"CSV 읽기 실패:\n{e}")
+            return
+        if not report.ok:
+            self.log_text.delete("1.0", "end")
+            self.log(report.to_text(limit=50))
+            if not messagebox.askyesno(
+                "CSV 검증",
+                f"CSV에 오류 {len(report.errors)}건이 있습니다. (로그 참고)\n그래도 계속하시겠습니까?"
+            ):
+                return
+
         # UI 상태 변경
         self._disable_ui()
         self.log_text.delete("1.0", "end")
@@ -594,14 +792,84 @@ class BulkInputGUI(ctk.CTk):
         self.log("💡 중지하려면: Pause 키를 3번 누르세요 (2초 이내)")
         self.log("=" * 50)
 
+        # BulkDependentInput 옵션
+        options = {
+            "global_delay": delay,
+            "start_from_current": self.start_from_current.get(),
+            "wait_mode": WAIT_MODE_SYNC if self.sync_wait_dep.get() else WAIT_MODE_SLEEP,
+            "input_mode": DEPENDENT_INPUT_MODES[self.input_mode_dep.get()],
+            "snapshot_mode": self.snapshot_dep.get(),
+            "sync_mode": self.sync_mode_dep.get(),
+            "resume": self.resume_dep.get(),
+            "prefetch_depth": PREFETCH_DEPTH if self.prefetch_dep.get() else 0,
+            "key_input": KEY_INPUT_MESSAGE if self.background_dep.get() else KEY_INPUT_TYPE_KEYS,
+        }
+
         # 백그라운드 스레드에서 실행
         thread = threading.Thread(
             target=self.run_dependent_automation,
-            args=(csv_file, count, delay, self.dry_run_dep.get(), self.start_from_current.get()),
+            args=(csv_file, count, self.dry_run_dep.get(), options),
             daemon=True
         )
         thread.start()
 
+    def show_dependent_plan(self):
+        """부양가족 입력 실행 계획 출력 (ERP 연결 없음)"""
+        csv_file = self.csv_path.get()
+        if not csv_file:
+            messagebox.showerror("오류", "CSV 파일을 선택하세요.")
+            return
+
+        if not Path(csv_file).exists():
+            messagebox.showerror("오류", f"파일을 찾을 수 없습니다:\n{csv_file}")
+            return
+
+        count_str = self.employee_count.get().strip()
+        count = int(count_str) if count_str.isdigit() and int(count_str) > 0 else None
+
+        try:
+            delay = float(self.global_delay_dep.get().strip() or "1.0")
+        except ValueError:
+            messagebox.showerror("오류", "입력 속도는 숫자여야 합니다.")
+            return
+
+        try:
+            plan = build_run_plan(
+                csv_file,
+                count=count,
+                global_delay=delay,
+                input_mode=DEPENDENT_INPUT_MODES[self.input_mode_dep.get()],
+                start_from_current=self.start_from_current.get(),
+                snapshot_mode=self.snapshot_dep.get(),
+                sync_mode=self.sync_mode_dep.get()
+            )
+        except Exception as e:
+            messagebox.showerror("오류", f"실행 계획 생성 실패:\n{e}")
+            return
+
+        self.log_text.delete("1.0", "end")
+        self.log(plan.to_text(limit=50))
+
+    def show_dependent_validation(self):
+        """부양가족 CSV 검증 보고서 출력 (ERP 연결 없음)"""
+        csv_file = self.csv_path.get()
+        if not csv_file:
+            messagebox.showerror("오류", "CSV 파일을 선택하세요.")
+            return
+
+        if not Path(csv_file).exists():
+            messagebox.showerror("오류", f"파일을 찾을 수 없습니다:\n{csv_file}")
+            return
+
+        try:
+            report = validate_csv(csv_file)
+        except Exception as e:
+            messagebox.showerror("오류", f"CSV 검증 실패:\n{e}")
+            return
+
+        self.log_text.delete("1.0", "end")
+        self.log(report.to_text(limit=200))
+
     def _start_installment_automation(self):
         """분납적용 자동화 시작"""
         # 유효성 검사
@@ -665,7 +933,9 @@ class BulkInputGUI(ctk.CTk):
         # 백그라운드 스레드에서 실행
         thread = threading.Thread(
             target=self.run_installment_automation,
-            args=(excel_file, start, count, delay, self.dry_run_inst.get()),
+            args=(excel_file, start, count, delay, self.dry_run_inst.get(), self.resume_inst.get(),
+                  KEY_INPUT_MESSAGE if self.background_inst.get() else KEY_INPUT_TYPE_KEYS,
+                  INSTALLMENT_INPUT_MODE_NAMES[self.input_mode_inst.get()], self.with_checkbox_inst.get()),
             daemon=True
         )
         thread.start()
@@ -729,7 +999,46 @@ class BulkInputGUI(ctk.CTk):
 
         thread = threading.Thread(
             target=self.run_checkbox_automation,
-            args=(excel_file, start, count, delay, self.dry_run_inst.get()),
+            args=(excel_file, start, count, delay, self.dry_run_inst.get(), self.resume_inst.get(),
+                  KEY_INPUT_MESSAGE if self.background_inst.get() else KEY_INPUT_TYPE_KEYS),
+            daemon=True
+        )
+        thread.start()
+
+    def _start_verify_installment(self):
+        """분납적용 입력 검증 시작 (스프레드 전체 복사 후 Excel과 비교)"""
+        excel_file = self.excel_path.get()
+        if not excel_file:
+            messagebox.showerror("오류", "Excel 파일을 선택하세요.")
+            return
+
+        if not Path(excel_file).exists():
+            messagebox.showerror("오류", f"파일을 찾을 수 없습니다:\n{excel_file}")
+            return
+
+        start_str = self.start_index.get().strip()
+        count_str = self.installment_count.get().strip()
+        try:
+            start = int(start_str) if start_str else 0
+            count = int(count_str) if count_str else None
+        except ValueError:
+            messagebox.showerror("오류", "시작 인덱스와 처리 개수는 숫자여야 합니다.")
+            return
+        if start < 0 or (count is not None and count <= 0):
+            messagebox.showerror("오류", "시작 인덱스는 0 이상, 처리 개수는 양수여야 합니다.")
+            return
+
+        # UI 상태 변경
+        self._disable_ui()
+        self.log_text.delete("1.0", "end")
+        self.log("=" * 50)
+        self.log("분납적용 입력 검증 시작")
+        self.log("=" * 50)
+
+        thread = threading.Thread(
+            target=self.run_verify_installment,
+            args=(excel_file, start, count,
+                  KEY_INPUT_MESSAGE if self.background_inst.get() else KEY_INPUT_TYPE_KEYS),
             daemon=True
         )
         thread.start()
@@ -746,22 +1055,36 @@ class BulkInputGUI(ctk.CTk):
 
         # 부양가족 탭 버튼
         self.start_btn_dep.configure(state="disabled")
+        self.plan_btn_dep.configure(state="disabled")
+        self.validate_btn_dep.configure(state="disabled")
         self.stop_btn_dep.configure(state="normal")
         self.browse_btn_dep.configure(state="disabled")
         self.count_entry.configure(state="disabled")
         self.delay_entry_dep.configure(state="disabled")
         self.dry_run_check_dep.configure(state="disabled")
         self.start_from_current_check.configure(state="disabled")
+        self.sync_wait_check_dep.configure(state="disabled")
+        self.snapshot_check_dep.configure(state="disabled")
+        self.sync_mode_check_dep.configure(state="disabled")
+        self.resume_check_dep.configure(state="disabled")
+        self.prefetch_check_dep.configure(state="disabled")
+        self.background_check_dep.configure(state="disabled")
+        self.input_mode_menu_dep.configure(state="disabled")
 
         # 분납적용 탭 버튼
         self.start_btn_inst.configure(state="disabled")
         self.checkbox_btn_inst.configure(state="disabled")
+        self.verify_btn_inst.configure(state="disabled")
         self.stop_btn_inst.configure(state="normal")
         self.browse_btn_inst.configure(state="disabled")
         self.start_index_entry.configure(state="disabled")
         self.installment_count_entry.configure(state="disabled")
         self.delay_entry_inst.configure(state="disabled")
         self.dry_run_check_inst.configure(state="disabled")
+        self.resume_check_inst.configure(state="disabled")
+        self.background_check_inst.configure(state="disabled")
+        self.input_mode_menu_inst.configure(state="disabled")
+        self.with_checkbox_check_inst.configure(state="disabled")
 
     def _enable_ui(self):
         """UI 활성화"""
@@ -769,32 +1092,51 @@ class BulkInputGUI(ctk.CTk):
 
         # 부양가족 탭 버튼
         self.start_btn_dep.configure(state="normal")
+        self.plan_btn_dep.configure(state="normal")
+        self.validate_btn_dep.configure(state="normal")
         self.stop_btn_dep.configure(state="disabled")
         self.browse_btn_dep.configure(state="normal")
         self.count_entry.configure(state="normal")
         self.delay_entry_dep.configure(state="normal")
         self.dry_run_check_dep.configure(state="normal")
         self.start_from_current_check.configure(state="normal")
+        self.sync_wait_check_dep.configure(state="normal")
+        self.snapshot_check_dep.configure(state="normal")
+        self.sync_mode_check_dep.configure(state="normal")
+        self.resume_check_dep.configure(state="normal")
+        self.prefetch_check_dep.configure(state="normal")
+        self.background_check_dep.configure(state="normal")
+        self.input_mode_menu_dep.configure(state="normal")
 
         # 분납적용 탭 버튼
         self.start_btn_inst.configure(state="normal")
         self.checkbox_btn_inst.configure(state="normal")
+        self.verify_btn_inst.configure(state="normal")
         self.stop_btn_inst.configure(state="disabled")
         self.browse_btn_inst.configure(state="normal")
         self.start_index_entry.configure(state="normal")
         self.installment_count_entry.configure(state="normal")
         self.delay_entry_inst.configure(state="normal")
         self.dry_run_check_inst.configure(state="normal")
-
-    def run_dependent_automation(self, csv_file, count, delay, dry_run, start_from_current):
-        """백그라운드에서 부양가족 입력 자동화 실행"""
+        self.resume_check_inst.configure(state="normal")
+        self.background_check_inst.configure(state="normal")
+        self.input_mode_menu_inst.configure(state="normal")
+        self.with_checkbox_check_inst.configure(state="normal")
+
+    def run_dependent_automation(self, csv_file, count, dry_run, options):
+        """
+        백그라운드에서 부양가족 입력 자동화 실행
+
+        Args:
+            options: BulkDependentInput 키워드 인자 (global_delay, wait_mode 등)
+        """
         try:
             # stdout 리디렉션
             original_stdout = sys.stdout
             sys.stdout = LogRedirector(self.log_text, self.log_queue)
 
             # BulkDependentInput 실행
-            self.bulk_automation = BulkDependentInput(csv_file, verbose=False, global_delay=delay, start_from_current=start_from_current)
+            self.bulk_automation = BulkDependentInput(csv_file, verbose=False, **options)
             result = self.bulk_automation.run(count=count, dry_run=dry_run)
 
             # 결과 표시
@@ -806,6 +1148,14 @@ class BulkInputGUI(ctk.CTk):
                 self.log_queue.put(f"건너뜀: {result['skipped']}명")
                 self.log_queue.put(f"실패: {result['failed']}명")
                 self.log_queue.put(f"입력 부양가족: {result['total_dependents']}명")
+                # 합계 구간(사원/부양가족 1명) 제외, 누적 시간이 가장 큰 단계
+                steps = [m for m in result.get('metrics', []) if not m['span'].endswith("1명")]
+                if steps:
+                    slowest = max(steps, key=lambda m: m['total'])
+                    self.log_queue.put(
+                        f"가장 오래 걸린 단계: {slowest['span']} "
+                        f"(합계 {slowest['total']:.1f}초, p95 {slowest['p95']:.2f}초)"
+                    )
                 self.log_queue.put("=" * 50)
 
             # stdout 복원
@@ -834,7 +1184,8 @@ class BulkInputGUI(ctk.CTk):
             # 실패 완료
             self.after(0, lambda: self.on_automation_complete(False, error_message))
 
-    def run_installment_automation(self, excel_file, start_index, count, delay, dry_run):
+    def run_installment_automation(self, excel_file, start_index, count, delay, dry_run, resume, key_input,
+                                   input_mode=INSTALLMENT_INPUT_KEYS, with_checkbox=False):
         """백그라운드에서 분납적용 자동화 실행"""
         try:
             # stdout 리디렉션
@@ -842,7 +1193,10 @@ class BulkInputGUI(ctk.CTk):
             sys.stdout = LogRedirector(self.log_text, self.log_queue)
 
             # InstallmentAutomation 실행
-            self.installment_automation = InstallmentAutomation(excel_file, verbose=False, global_delay=delay)
+            self.installment_automation = InstallmentAutomation(
+                excel_file, verbose=False, global_delay=delay, resume=resume, key_input=key_input,
+                input_mode=input_mode, with_checkbox=with_checkbox
+            )
             result = self.installment_automation.run(start_index=start_index, count=count, dry_run=dry_run)
 
             # 결과 표시
@@ -852,7 +1206,7 @@ class BulkInputGUI(ctk.CTk):
                     self.log_queue.put("✅ 완료!")
                     self.log_queue.put(f"성공: {result['success']}명")
                     self.log_queue.put(f"실패: {result['fail']}명")
-                    if dry_run:
+                    if dry_run or result['skip']:
                         self.log_queue.put(f"건너뜀: {result['skip']}명")
                     self.log_queue.put(f"소요 시간: {result['elapsed']:.1f}초")
                 else:
@@ -885,13 +1239,15 @@ class BulkInputGUI(ctk.CTk):
             # 실패 완료
             self.after(0, lambda: self.on_automation_complete(False, error_message))
 
-    def run_checkbox_automation(self, excel_file, start_index, count, delay, dry_run):
+    def run_checkbox_automation(self, excel_file, start_index, count, delay, dry_run, resume, key_input):
         """백그라운드에서 체크박스 체크 자동화 실행"""
         try:
             original_stdout = sys.stdout
             sys.stdout = LogRedirector(self.log_text, self.log_queue)
 
-            self.installment_automation = InstallmentAutomation(excel_file, verbose=False, global_delay=delay)
+            self.installment_automation = InstallmentAutomation(
+                excel_file, verbose=False, global_delay=delay, resume=resume, key_input=key_input
+            )
             result = self.installment_automation.run_checkbox(start_index=start_index, count=count, dry_run=dry_run)
 
             if result:
@@ -923,6 +1279,48 @@ class BulkInputGUI(ctk.CTk):
 
             self.after(0, lambda: self.on_automation_complete(False, error_message))
 
+    def run_verify_installment(self, excel_file, start_index, count, key_input):
+        """백그라운드에서 분납적용 입력 검증 실행"""
+        try:
+            original_stdout = sys.stdout
+            sys.stdout = LogRedirector(self.log_text, self.log_queue)
+
+            self.installment_automation = InstallmentAutomation(
+                excel_file, verbose=False, key_input=key_input
+            )
+            result = self.installment_automation.verify(start_index=start_index, count=count)
+            # 검증만 하고 끝나므로 로그 기록 스레드/Pause 키 후크/저널 파일을 바로 정리
+            self.installment_automation.cleanup()
+
+            self.log_queue.put("\n" + "=" * 50)
+            if result['status'] == 'completed':
+                if result['mismatches']:
+                    self.log_queue.put(f"❌ 불일치: {result['mismatch_rows']}명, {len(result['mismatches'])}셀")
+                else:
+                    self.log_queue.put(f"✅ 검증 완료: {result['checked']}명 모두 일치")
+                self.log_queue.put(f"소요 시간: {result['elapsed']:.1f}초")
+            else:
+                self.log_queue.put(f"❌ 오류: {result.get('reason', 'unknown')}")
+            self.log_queue.put("=" * 50)
+
+            sys.stdout = original_stdout
+            self.after(0, lambda: self.on_automation_complete(True))
+
+        except Exception as e:
+            sys.stdout = original_stdout
+            error_message = str(e)
+            self.log_queue.put(f"\n❌ 오류 발생: {error_message}")
+            import traceback
+            self.log_queue.put(traceback.format_exc())
+
+            if self.installment_automation:
+                try:
+                    self.installment_automation.cleanup()
+                except:
+                    pass
+
+            self.after(0, lambda: self.on_automation_complete(False, error_message))
+
     def on_automation_complete(self, success, error_message=None):
         """자동화 완료 후 처리"""
         # 안내 창 닫기
@@ -0,0 +1,143 @@
+"""
+여러 ERP 창 동시 실행
+
+회사 DB별로 열어 둔 사원등록/급여자료입력 창에 작업을 하나씩 맡겨 동시에 실행합니다.
+키 입력/복사/붙여넣기 묶음 동안만 전경 창을 한 작업이 독점하고,
+입력 후 대기하는 동안 다른 창의 작업이 키를 보냅니다.
+"""
+
+import argparse
+import sys
+
+from src.erp_backend import default_backend
+from src.foreground_arbiter import DEFAULT_LINGER, DEFAULT_SWITCH_SETTLE
+from src.input_handler import INPUT_MODES, INPUT_MODE_KEYS
+from src.key_input import KEY_INPUTS, KEY_INPUT_TYPE_KEYS
+from src.multi_window import (
+    JOB_DEPENDENT, JOB_KINDS, WINDOW_TITLES, MultiWindowRunner, WindowJob
+)
+
+
+def parse_job(spec: str) -> WindowJob:
+    """
+    --job 값 해석 (종류:PID:경로, PID를 비우면 창 제목으로 연결)
+
+    Args:
+        spec: 예) "dependent:1234:회사A.csv", "installment::연말정산.xls"
+
+    Returns:
+        WindowJob
+
+    Raises:
+        argparse.ArgumentTypeError: 형식이 맞지 않는 경우
+    """
+    parts = spec.split(':', 2)
+    if len(parts) != 3 or parts[0] not in JOB_KINDS or not parts[2]:
+        raise argparse.ArgumentTypeError(
+            f"작업 형식이 올바르지 않습니다: {spec} (종류:PID:경로, 종류={'/'.join(JOB_KINDS)})"
+        )
+    kind, pid, path = parts
+    if pid and not pid.isdigit():
+        raise argparse.ArgumentTypeError(f"PID는 숫자여야 합니다: {pid}")
+    return WindowJob(kind=kind, path=path, process_id=int(pid) if pid else None)
+
+
+def list_windows():
+    """동시 실행에 쓸 수 있는 ERP 창 목록 출력"""
+    backend = default_backend()
+    for title in sorted(set(WINDOW_TITLES.values())):
+        windows = backend.find_windows(title)
+        print(f"{title}: {len(windows)}개")
+        for pid, hwnd in windows:
+            print(f"  PID {pid}  (hwnd 0x{hwnd:08X})")
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(
+        description='여러 ERP 창 동시 실행',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+사용 예시:
+  # 열려 있는 사원등록/급여자료입력 창과 PID 확인
+  python multi_window_run.py --list
+
+  # 회사 2곳의 사원등록 창에 부양가족 동시 입력
+  python multi_window_run.py --job dependent:1234:회사A.csv --job dependent:5678:회사B.csv --snapshot
+
+  # 사원등록(부양가족)과 급여자료입력(분납적용)을 동시에
+  python multi_window_run.py --job dependent:1234:회사A.csv --job installment:5678:연말정산.xls
+
+  # 창 메시지 입력 (복사/붙여넣기/삭제만 전경 창을 번갈아 씀)
+  python multi_window_run.py --job dependent:1234:회사A.csv --job installment:5678:연말정산.xls --key-input message
+
+  # 드라이런 (처음 3명씩)
+  python multi_window_run.py --job dependent:1234:회사A.csv --job dependent:5678:회사B.csv --count 3 --dry-run
+        """
+    )
+
+    parser.add_argument('--list', action='store_true', help='ERP 창 목록(PID)만 출력하고 종료')
+    parser.add_argument('--job', action='append', type=parse_job, default=[], metavar='KIND:PID:PATH',
+                        help=f"창별 작업 (종류={'/'.join(JOB_KINDS)}, 여러 번 지정)")
+    parser.add_argument('--count', type=int, default=None, help='작업마다 처리할 사원 수 (미지정 시 전체)')
+    parser.add_argument('--dry-run', action='store_true', help='실제 입력 없이 테스트')
+    parser.add_argument('--delay', type=float, default=1.0, help='전역 지연 시간 배율 (0.5~2.0, 기본값: 1.0)')
+    parser.add_argument('--input-mode', choices=INPUT_MODES, default=INPUT_MODE_KEYS,
+                        help='부양가족 입력 방식 (기본값: keys)')
+    parser.add_argument('--snapshot', action='store_true',
+                        help='부양가족 작업에서 사원 목록 사번 열을 한 번에 복사해 두고 사원마다 다시 읽지 않음')
+    parser.add_argument('--key-input', choices=KEY_INPUTS, default=KEY_INPUT_TYPE_KEYS,
+                        help='키 입력 방식 (message면 메시지로 보내는 키는 전경 창을 독점하지 않음, 기본값: type_keys)')
+    parser.add_argument('--switch-settle', type=float, default=DEFAULT_SWITCH_SETTLE,
+                        help=f'다른 창으로 전환한 뒤 입력 전 대기 (초, 기본값: {DEFAULT_SWITCH_SETTLE})')
+    parser.add_argument('--linger', type=float, default=DEFAULT_LINGER,
+                        help=f'입력 묶음이 끝난 작업이 이 시간 안에 다시 입력하면 전환 없이 이어 씀 '
+                             f'(초, 기본값: {DEFAULT_LINGER})')
+
+    args = parser.parse_args()
+
+    if args.list:
+        list_windows()
+        return
+
+    if not args.job:
+        parser.error("--job을 하나 이상 지정하세요 (창 목록은 --list)")
+
+    jobs = []
+    for job in args.job:
+        options = {'global_delay': args.delay, 'key_input': args.key_input}
+        if job.kind == JOB_DEPENDENT:
+            options.update(input_mode=args.input_mode, snapshot_mode=args.snapshot)
+        jobs.append(job._replace(options=options, count=args.count))
+
+    def log(level, message, *args):
+        if level != "DEBUG":
+            print(f"[{level}] {message % args if args else message}")
+
+    runner = None
+    try:
+        runner = MultiWindowRunner(jobs, switch_settle=args.switch_settle, linger=args.linger,
+                                   dry_run=args.dry_run, log_callback=log)
+        result = runner.run()
+    except KeyboardInterrupt:
+        print("\n\n중단됨 (Ctrl+C)")
+        if runner:
+            runner.stop()
+        sys.exit(1)
+
+    print("\n" + "=" * 60)
+    for label, job_result in result['jobs'].items():
+        stats = result['arbiter'].get(label, {})
+        print(f"{label}: {job_result.get('status')} "
+              f"({job_result['elapsed_wall']:.1f}초, 독점 {stats.get('hold_time', 0.0):.1f}초"
+              f" / 대기 {stats.get('wait_time', 0.0):.1f}초)"
+              + (f" - {job_result['reason']}" if job_result.get('reason') else ""))
+    print(f"전체: {result['elapsed']:.1f}초, 전경 전환 {result['switches']}회")
+    print("=" * 60)
+
+    if any(r.get('status') == 'error' for r in result['jobs'].values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+클립보드 읽기 모듈
+
+Ctrl+C 후 고정 시간 대기하고 클립보드를 읽는 대신, 복사 전 클립보드 변경 번호를
+기록해 두고 번호가 바뀔 때까지 짧은 간격으로 확인합니다.
+복사가 반영되는 즉시 반환하고, 시간 안에 바뀌지 않으면 이전 값을 돌려주지 않고
+ClipboardTimeout을 발생시킵니다. (ERP는 빈 셀을 복사하면 클립보드를 바꾸지 않으므로
+빈 셀도 타임아웃으로 나타납니다. 빈 셀인지 확인하려면 InputHandler.copy_cell을 사용합니다.)
+"""
+
+import time
+
+# 기본 확인 간격/제한 시간 (초, 제한 시간은 global_delay 적용 전)
+DEFAULT_POLL_INTERVAL = 0.005
+DEFAULT_COPY_TIMEOUT = 0.3
+
+
+class ClipboardTimeout(Exception):
+    """제한 시간 안에 클립보드가 바뀌지 않음 (빈 셀 복사 또는 ERP 응답 지연)"""
+
+
+class ClipboardReader:
+    """클립보드 변경 번호 기반 읽기"""
+
+    def __init__(self, backend, poll_interval: float = DEFAULT_POLL_INTERVAL,
+                 timeout: float = DEFAULT_COPY_TIMEOUT, log_callback=None):
+        """
+        초기화
+
+        Args:
+            backend: clipboard_sequence()/get_clipboard()를 제공하는 백엔드
+                     (Win32Backend, SimulatorBackend, 테스트의 FakeClipboard)
+            poll_interval: 변경 번호 확인 간격 (초)
+            timeout: 기본 제한 시간 (초)
+            log_callback: 로그 출력 콜백 함수 (level, message, *args - LogService.log와 같은 형태)
+        """
+        self.backend = backend
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+        self.log_callback = log_callback
+
+    def _log(self, level: str, message: str, *args):
+        """로그 출력 (콜백이 있으면 사용, args가 있으면 message는 % 포맷 문자열)"""
+        if self.log_callback:
+            self.log_callback(level, message, *args)
+
+    def read_after(self, trigger, timeout: float = None) -> str:
+        """
+        trigger()로 복사한 뒤 클립보드가 바뀌면 읽기
+
+        Args:
+            trigger: 복사 키를 보내는 함수 (인자 없음)
+            timeout: 제한 시간 (초, None이면 기본값)
+
+        Returns:
+            복사된 텍스트
+
+        Raises:
+            ClipboardTimeout: 제한 시간 안에 클립보드 변경 번호가 바뀌지 않은 경우
+        """
+        if timeout is None:
+            timeout = self.timeout
+
+        before = self.backend.clipboard_sequence()
+        trigger()
+
+        deadline = time.perf_counter() + timeout
+        while self.backend.clipboard_sequence() == before:
+            if time.perf_counter() >= deadline:
+                self._log("DEBUG", "클립보드 변경 없음 (%.2f초)", timeout)
+                raise ClipboardTimeout(f"클립보드가 {timeout:.2f}초 안에 바뀌지 않았습니다")
+            time.sleep(self.poll_interval)
+
+        return self.backend.get_clipboard()
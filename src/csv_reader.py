@@ -3,14 +3,69 @@ CSV 테스트 데이터 읽기 모듈
 부양가족 정보 CSV 파일을 읽고 파싱합니다.
 """
 
+import codecs
 import csv
-from typing import List, Dict
-from collections import defaultdict
+from typing import Dict, Iterator, List
+
+from src.dependent_store import DependentStore
+
+# 인코딩 판별용 샘플 크기 (바이트)
+ENCODING_SAMPLE_SIZE = 64 * 1024
+
+
+def _decodes(sample: bytes, encoding: str) -> bool:
+    """샘플이 해당 인코딩으로 디코딩되는지 (샘플 끝에서 잘린 멀티바이트 문자는 허용)"""
+    try:
+        codecs.getincrementaldecoder(encoding)().decode(sample, final=False)
+        return True
+    except UnicodeDecodeError:
+        return False
+
+
+def detect_encoding(csv_path: str, sample_size: int = ENCODING_SAMPLE_SIZE) -> str:
+    """
+    바이트 샘플로 CSV 인코딩 판별 (한 번만)
+
+    BOM이 있으면 BOM을 따르고, 없으면 처음으로 ASCII가 아닌 바이트가 나오는 구간을
+    UTF-8로 디코딩해 봅니다. CP949 한글은 UTF-8로 거의 디코딩되지 않으므로
+    UTF-8로 읽히면 UTF-8, 아니면 CP949(EUC-KR 포함), 둘 다 아니면 latin-1로 봅니다.
+
+    Args:
+        csv_path: CSV 파일 경로
+        sample_size: 한 번에 읽을 샘플 크기 (바이트)
+
+    Returns:
+        open()에 넘길 인코딩 이름
+    """
+    with open(csv_path, 'rb') as f:
+        sample = f.read(sample_size)
+        if sample.startswith(codecs.BOM_UTF8):
+            return 'utf-8-sig'
+        if sample.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+            return 'utf-16'
+
+        # 앞부분이 모두 ASCII면 ASCII가 아닌 바이트가 나올 때까지 넘김
+        while sample and sample.isascii():
+            sample = f.read(sample_size)
+        if not sample:
+            return 'utf-8'
+
+    start = next(i for i, b in enumerate(sample) if b >= 0x80)
+    sample = sample[start:]
+    for encoding in ('utf-8', 'cp949'):
+        if _decodes(sample, encoding):
+            return encoding
+    return 'latin-1'
 
 
 class DependentData:
     """부양가족 한 명의 데이터"""
 
+    __slots__ = (
+        'employee_no', 'employee_name', 'relationship_code', 'name', 'nationality',
+        'id_number', 'age', 'basic_deduction', 'disability_type', 'child_deduction',
+    )
+
     def __init__(self, row: Dict[str, str]):
         self.employee_no = row['근로자\n사번'].strip()
         self.employee_name = row['근로자명'].strip()
@@ -47,58 +102,58 @@ class CSVReader:
 
     def __init__(self, csv_path: str):
         self.csv_path = csv_path
+        self.encoding = None    # 첫 읽기 때 판별
         self.data: List[DependentData] = []
+        self.store: DependentStore = None   # 첫 load() 때 생성
 
-    def read(self) -> List[DependentData]:
-        """CSV 파일을 읽어서 DependentData 리스트로 반환"""
-        # 여러 인코딩을 시도하여 파일 읽기
-        encodings = ['utf-8-sig', 'cp949', 'euc-kr', 'latin-1']
-        last_error = None
+    def iter_rows(self) -> Iterator[DependentData]:
+        """
+        CSV 행을 하나씩 읽어 DependentData로 반환 (self.data에 쌓지 않음)
 
-        for encoding in encodings:
+        Raises:
+            UnicodeDecodeError: 판별한 인코딩으로 읽을 수 없는 바이트가 있는 경우
+        """
+        if self.encoding is None:
+            self.encoding = detect_encoding(self.csv_path)
+
+        with open(self.csv_path, 'r', encoding=self.encoding) as f:
             try:
-                with open(self.csv_path, 'r', encoding=encoding) as f:
-                    reader = csv.DictReader(f)
-                    for row in reader:
-                        self.data.append(DependentData(row))
-
-                return self.data
-            except (UnicodeDecodeError, UnicodeError) as e:
-                last_error = e
-                self.data = []  # 재시도를 위해 데이터 초기화
-                continue
-
-        # 모든 인코딩 실패 시
-        raise UnicodeDecodeError(
-            'multiple', b'', 0, 1,
-            f'CSV 파일을 읽을 수 없습니다. 시도한 인코딩: {encodings}. 마지막 오류: {last_error}'
-        )
+                for row in csv.DictReader(f):
+                    yield DependentData(row)
+            except UnicodeDecodeError as e:
+                raise UnicodeDecodeError(
+                    e.encoding, e.object, e.start, e.end,
+                    f'CSV 파일을 읽을 수 없습니다. 판별한 인코딩: {self.encoding}. 오류: {e.reason}'
+                ) from e
+
+    def load(self) -> DependentStore:
+        """CSV를 한 번 읽어 열 저장소로 반환 (이후 호출은 같은 저장소)"""
+        if self.store is None:
+            self.store = DependentStore(self.iter_rows())
+        return self.store
+
+    def read(self) -> List[DependentData]:
+        """CSV 파일을 읽어서 CSV 순서의 행 리스트로 반환"""
+        self.data = list(self.load().rows())
+        return self.data
 
     def get_by_employee(self, employee_no: str) -> List[DependentData]:
         """특정 사원의 부양가족 데이터만 반환"""
-        return [d for d in self.data if d.employee_no == employee_no]
+        return self.load().get(employee_no, [])
 
-    def group_by_employee(self) -> Dict[str, List[DependentData]]:
-        """사원별로 그룹화된 딕셔너리 반환"""
-        grouped = defaultdict(list)
-        for d in self.data:
-            grouped[d.employee_no].append(d)
-        return dict(grouped)
+    def group_by_employee(self) -> DependentStore:
+        """사원별로 그룹화된 저장소 반환 (사번 → 행 목록 Mapping)"""
+        return self.load()
 
     def get_employee_list(self) -> List[tuple]:
         """사원 목록 반환 [(사번, 이름)]"""
-        employees = {}
-        for d in self.data:
-            if d.relationship_code == '0':  # 본인만
-                employees[d.employee_no] = d.employee_name
-
-        return [(no, name) for no, name in employees.items()]
+        return self.load().employee_list()
 
     def print_summary(self):
         """데이터 요약 출력"""
         grouped = self.group_by_employee()
         print(f"총 사원 수: {len(grouped)}")
-        print(f"총 부양가족 레코드 수: {len(self.data)}")
+        print(f"총 부양가족 레코드 수: {grouped.row_count}")
         print("\n사원별 부양가족 수:")
         for emp_no, dependents in grouped.items():
             emp_name = dependents[0].employee_name
@@ -0,0 +1,263 @@
+"""
+부양가족 CSV 검증 모듈
+
+ERP에 입력하기 전에 CSV 전체를 열 단위로 한 번에 검사합니다.
+주민등록번호 검증번호, 7번째 자리(내/외국인) 규칙, 여권번호 판별, 코드 값 범위,
+사원 내 중복을 확인하고 GUI/CLI에서 보여줄 보고서를 만듭니다.
+"""
+
+import re
+from operator import attrgetter
+from datetime import date
+from typing import Dict, List, NamedTuple
+
+from src.csv_reader import CSVReader, DependentData
+
+LEVEL_ERROR = "ERROR"       # 입력하면 틀린 값이 들어가거나 입력 위치가 밀리는 문제
+LEVEL_WARNING = "WARNING"   # 입력은 되지만 확인이 필요한 값
+
+# 코드 값 범위
+RELATIONSHIP_CODES = frozenset('012345678')     # 연말정산 관계코드 (0=본인)
+NATIONALITY_DOMESTIC = frozenset(['N', '내', '내국인', '1'])
+NATIONALITY_FOREIGN = frozenset(['Y', '외', '외국인', '2'])
+DISABILITY_CODES = frozenset(['', '0', '1', '2', '3'])
+FLAG_VALUES = frozenset(['', 'Y', 'N'])
+
+# 주민등록번호 검증번호 가중치 (앞 12자리)
+RRN_WEIGHTS = (2, 3, 4, 5, 6, 7, 8, 9, 2, 3, 4, 5)
+
+# 7번째 자리 → 출생 세기 (9/0은 1800년대)
+_CENTURY = {'1': 1900, '2': 1900, '5': 1900, '6': 1900,
+            '3': 2000, '4': 2000, '7': 2000, '8': 2000,
+            '9': 1800, '0': 1800}
+
+_RRN_WEIGHT_SUM = sum(RRN_WEIGHTS) * ord('0')
+
+_ALPHA = re.compile(r'[A-Za-z]')
+_NON_DIGIT = re.compile(r'[^0-9]')     # \D는 전각 숫자 등도 숫자로 봄
+
+# 검증에 쓰는 DependentData 필드 (열 순서)
+_COLUMNS = attrgetter('employee_no', 'name', 'relationship_code', 'nationality', 'id_number',
+                      'age', 'basic_deduction', 'disability_type', 'child_deduction')
+
+
+class ValidationIssue(NamedTuple):
+    """검증 문제 하나"""
+    line: int           # CSV 줄 번호 (헤더가 1줄)
+    employee_no: str
+    name: str
+    column: str         # 항목 이름 (CSV 열)
+    level: str          # LEVEL_ERROR / LEVEL_WARNING
+    message: str
+
+
+class ValidationReport:
+    """CSV 검증 결과"""
+
+    def __init__(self, row_count: int, employee_count: int, issues: List[ValidationIssue]):
+        self.row_count = row_count
+        self.employee_count = employee_count
+        self.issues = sorted(issues, key=lambda i: (i.line, i.level != LEVEL_ERROR))
+
+    @property
+    def errors(self) -> List[ValidationIssue]:
+        return [i for i in self.issues if i.level == LEVEL_ERROR]
+
+    @property
+    def warnings(self) -> List[ValidationIssue]:
+        return [i for i in self.issues if i.level == LEVEL_WARNING]
+
+    @property
+    def ok(self) -> bool:
+        """오류가 없으면 True (경고는 허용)"""
+        return not any(i.level == LEVEL_ERROR for i in self.issues)
+
+    def summary(self) -> str:
+        """한 줄 요약"""
+        return (f"{self.row_count:,}행 / 사원 {self.employee_count:,}명 / "
+                f"오류 {len(self.errors):,}건 / 경고 {len(self.warnings):,}건")
+
+    def to_text(self, limit: int = 100) -> str:
+        """
+        보고서 문자열 (로그/GUI 출력용)
+
+        Args:
+            limit: 출력할 최대 문제 수 (오류 먼저)
+
+        Returns:
+            여러 줄 문자열
+        """
+        lines = [f"=== CSV 검증 ===", self.summary()]
+        if not self.issues:
+            lines.append("✓ 문제 없음")
+            return '\n'.join(lines)
+
+        shown = (self.errors + self.warnings)[:limit]
+        for issue in sorted(shown, key=lambda i: i.line):
+            mark = "❌" if issue.level == LEVEL_ERROR else "⚠"
+            lines.append(f"{mark} {issue.line}행 [{issue.employee_no} {issue.name}] "
+                         f"{issue.column}: {issue.message}")
+        if len(self.issues) > len(shown):
+            lines.append(f"  ... 외 {len(self.issues) - len(shown):,}건")
+        return '\n'.join(lines)
+
+
+def _upper(column):
+    """열 값을 대문자로 (값 종류가 적으므로 종류별로 변환)"""
+    mapping = {value: value.upper() for value in set(column)}
+    return [mapping[value] for value in column]
+
+
+def rrn_checksum_ok(number: str) -> bool:
+    """주민등록번호 검증번호 확인 (13자리 ASCII 숫자)"""
+    b = number.encode('ascii')
+    total = (2 * b[0] + 3 * b[1] + 4 * b[2] + 5 * b[3] + 6 * b[4] + 7 * b[5]
+             + 8 * b[6] + 9 * b[7] + 2 * b[8] + 3 * b[9] + 4 * b[10] + 5 * b[11]) - _RRN_WEIGHT_SUM
+    return (11 - total % 11) % 10 == b[12] - 48
+
+
+class DependentValidator:
+    """부양가족 CSV 열 단위 검증"""
+
+    def __init__(self, today: date = None):
+        """
+        Args:
+            today: 만나이 비교 기준일 (None이면 오늘)
+        """
+        self.today = today or date.today()
+
+    def validate(self, dependents: List[DependentData]) -> ValidationReport:
+        """
+        부양가족 전체 검증
+
+        Args:
+            dependents: CSVReader.read() 결과 (CSV 행 순서)
+
+        Returns:
+            ValidationReport
+        """
+        issues: List[ValidationIssue] = []
+        if not dependents:
+            return ValidationReport(0, 0, issues)
+
+        # 열 단위로 분리 (행 i의 CSV 줄 번호는 i + 2)
+        emp_nos, names, relations, nationalities, numbers, ages, basics, disabilities, children = zip(
+            *map(_COLUMNS, dependents)
+        )
+        # 대소문자 정리는 값 종류별로 한 번만
+        nationalities, basics, children = (_upper(column) for column in (nationalities, basics, children))
+
+        def add(i, column, level, message):
+            issues.append(ValidationIssue(i + 2, emp_nos[i], names[i], column, level, message))
+
+        def bad_rows(column, allowed):
+            """열에서 허용 값이 아닌 행 번호 (값 종류로 먼저 걸러 정상 열은 행 단위로 돌지 않음)"""
+            bad = set(column) - allowed
+            return [i for i, value in enumerate(column) if value in bad] if bad else []
+
+        # 필수 값
+        for column, label, message in ((emp_nos, "사번", "사번이 비어 있습니다"),
+                                       (names, "이름", "이름이 비어 있습니다")):
+            if '' in set(column):
+                for i, value in enumerate(column):
+                    if not value:
+                        add(i, label, LEVEL_ERROR, message)
+
+        # 코드 값 범위
+        for i in bad_rows(relations, RELATIONSHIP_CODES):
+            add(i, "관계코드", LEVEL_ERROR, f"알 수 없는 관계코드 '{relations[i]}' (0~8)")
+        for i in bad_rows(nationalities, NATIONALITY_DOMESTIC | NATIONALITY_FOREIGN):
+            add(i, "내/외국인", LEVEL_ERROR, f"알 수 없는 값 '{nationalities[i]}' (내국인으로 입력됨)")
+        for i in bad_rows(basics, FLAG_VALUES):
+            add(i, "기본공제여부", LEVEL_WARNING, f"Y/N이 아닌 값 '{basics[i]}' (공제 Y로 입력됨)")
+        for i in bad_rows(disabilities, DISABILITY_CODES):
+            add(i, "장애유형", LEVEL_ERROR, f"알 수 없는 장애유형 '{disabilities[i]}' (0~3)")
+        for i in bad_rows(children, FLAG_VALUES):
+            add(i, "자녀공제", LEVEL_WARNING, f"Y/N이 아닌 값 '{children[i]}'")
+        if 'Y' in set(children):
+            for i, (value, code) in enumerate(zip(children, relations)):
+                if value == 'Y' and code != '4':
+                    add(i, "자녀공제", LEVEL_WARNING, f"관계코드 {code}는 자녀공제 대상이 아님 (입력 안 함)")
+
+        # 만나이 (경로우대 열 이동에 사용되므로 숫자가 아니면 입력 위치가 밀림)
+        # 나이 값 종류는 적으므로 종류별로 한 번만 변환
+        age_values = {value: int(value) if value.isdigit() and int(value) <= 150 else None
+                      for value in set(ages)}
+        parsed_ages = [age_values[value] for value in ages]
+        if None in age_values.values():
+            for i, age in enumerate(parsed_ages):
+                if age is None:
+                    add(i, "만나이", LEVEL_ERROR, f"나이 값 오류 '{ages[i]}' (0~150 숫자)")
+
+        # 번호 (여권/주민/외국인등록번호)
+        cleaned_numbers = []
+        this_year = self.today.year
+        for i, (raw, nationality, age) in enumerate(zip(numbers, nationalities, parsed_ages)):
+            number = raw.replace('-', '').replace(' ', '')
+            if not (number.isascii() and number.isdigit()):
+                if _ALPHA.search(number):
+                    cleaned_numbers.append(number.upper())
+                    if nationality in NATIONALITY_DOMESTIC:
+                        add(i, "주민등록번호", LEVEL_WARNING, "여권번호인데 내국인으로 표시됨")
+                    continue
+                if any(ch.isdigit() and not ch.isascii() for ch in number):
+                    # 전각 숫자 등은 입력할 때 빠지므로 번호가 틀리게 들어감
+                    cleaned_numbers.append(number)
+                    add(i, "주민등록번호", LEVEL_ERROR, f"ASCII가 아닌 숫자가 있음 '{raw}' (반각 숫자로 고쳐야 함)")
+                    continue
+                number = _NON_DIGIT.sub('', number)
+            cleaned_numbers.append(number)
+            if len(number) != 13:
+                add(i, "주민등록번호", LEVEL_ERROR, f"번호 길이 {len(number)}자리 (13자리 필요)")
+                continue
+
+            digit = number[6]
+            foreign = digit in '5678'
+            if foreign:
+                if nationality in NATIONALITY_DOMESTIC:
+                    add(i, "내/외국인", LEVEL_WARNING, f"7번째 자리 {digit}는 외국인등록번호인데 내국인으로 표시됨")
+            else:
+                if nationality in NATIONALITY_FOREIGN:
+                    add(i, "내/외국인", LEVEL_WARNING, f"7번째 자리 {digit}는 주민등록번호인데 외국인으로 표시됨")
+                if digit in '90':
+                    add(i, "주민등록번호", LEVEL_WARNING, f"7번째 자리 {digit} (1800년대 출생)")
+                if not rrn_checksum_ok(number):
+                    # 2020년 10월 이후 발급 번호는 뒷자리가 임의 번호라 검증번호가 맞지 않을 수 있음
+                    add(i, "주민등록번호", LEVEL_WARNING, "검증번호 불일치 (2020.10 이후 발급 번호면 무시)")
+
+            if age is not None:
+                expected = this_year - _CENTURY[digit] - int(number[:2])
+                if not (expected - 1 <= age <= expected):
+                    add(i, "만나이", LEVEL_WARNING, f"번호 기준 나이 {expected - 1}~{expected}세와 다름 ({age}세)")
+
+        # 사원 내 중복 (키 집합 크기로 먼저 확인하고 중복이 있을 때만 행 단위로 찾음)
+        row_count = len(dependents)
+        number_keys = list(zip(emp_nos, cleaned_numbers))
+        if len(set(number_keys)) != row_count:
+            seen: Dict[tuple, int] = {}
+            for i, key in enumerate(number_keys):
+                first = seen.setdefault(key, i)
+                if first != i and key[1]:
+                    add(i, "주민등록번호", LEVEL_ERROR, f"같은 사원에 같은 번호가 이미 있음 ({first + 2}행)")
+        name_keys = list(zip(emp_nos, relations, names))
+        if len(set(name_keys)) != row_count:
+            seen = {}
+            for i, key in enumerate(name_keys):
+                first = seen.setdefault(key, i)
+                if first != i:
+                    add(i, "이름", LEVEL_WARNING, f"같은 사원에 같은 관계/이름이 이미 있음 ({first + 2}행)")
+        self_rows = [i for i, code in enumerate(relations) if code == '0']
+        if len({emp_nos[i] for i in self_rows}) != len(self_rows):
+            seen = {}
+            for i in self_rows:
+                first = seen.setdefault(emp_nos[i], i)
+                if first != i:
+                    add(i, "관계코드", LEVEL_WARNING, f"본인(0) 행이 두 번 이상 있음 ({first + 2}행)")
+
+        return ValidationReport(len(dependents), len(set(emp_nos)), issues)
+
+
+def validate_csv(csv_path: str) -> ValidationReport:
+    """CSV 파일을 읽어 검증 (GUI/CLI 실행 전 확인용)"""
+    reader = CSVReader(csv_path)
+    return DependentValidator().validate(reader.read())
@@ -0,0 +1,214 @@
+"""
+부양가족 그리드 비교 모듈
+
+오른쪽 부양가족 스프레드(fpUSpread80)를 한 번에 복사한 TSV를 행 단위로 파싱하고,
+CSV 부양가족과 비교해 삭제할 행과 새로 입력할 부양가족을 계산합니다.
+"""
+
+import re
+from typing import Dict, List, NamedTuple, Optional
+
+from src.dependent_normalizer import NormalizedDependent
+
+# 부양가족 스프레드 열 위치 (0부터, 복사한 TSV 기준)
+GRID_COLUMNS: Dict[str, int] = {
+    "관계": 0,
+    "성명": 1,
+    "내외국인": 2,
+    "번호구분": 3,
+    "번호": 4,
+    "나이": 5,
+    "기본공제": 6,
+    "경로": 7,
+    "장애": 8,
+    "자녀": 9,
+}
+
+# 체크 표시로 보는 값 (그 외 빈 값/0/N 등은 미체크)
+_CHECKED_VALUES = {'1', 'Y', 'O', 'V', '○', '√', '예', 'TRUE'}
+
+_LEADING_CODE = re.compile(r'^\s*(\d+)')
+
+
+class GridRow(NamedTuple):
+    """부양가족 스프레드 데이터 행 하나"""
+    row: int        # 스프레드 행 번호 (0=본인, 1부터 부양가족)
+    cells: tuple    # 셀 값 (탭 구분 그대로)
+
+    def cell(self, column: str) -> str:
+        """열 이름으로 셀 값 조회 (열이 없으면 빈 문자열)"""
+        idx = GRID_COLUMNS[column]
+        return self.cells[idx].strip() if idx < len(self.cells) else ""
+
+
+class GridDiff(NamedTuple):
+    """그리드와 CSV 비교 결과"""
+    kept: List[GridRow]             # 그대로 둘 행
+    deleted: List[GridRow]          # 삭제할 행 (아래쪽 행부터)
+    appended: List[NormalizedDependent]   # 새로 입력할 부양가족 (정렬 순서 유지)
+
+    @property
+    def unchanged(self) -> bool:
+        """변경할 내용이 없으면 True"""
+        return not self.deleted and not self.appended
+
+
+def parse_grid(tsv: str) -> Optional[List[GridRow]]:
+    """
+    복사한 부양가족 스프레드 TSV 파싱
+
+    첫 행(본인)은 건너뛰고, 관계 열이 비어 있는 행에서 끝으로 판단합니다.
+
+    Args:
+        tsv: 클립보드 텍스트 (1행 첫 열부터 선택해 복사한 값)
+
+    Returns:
+        부양가족 행 리스트. 첫 행이 본인(관계 0)이 아니면 None (복사 실패로 판단)
+    """
+    lines = tsv.replace('\r\n', '\n').split('\n')
+    if not lines or _code(lines[0].split('\t', 1)[0]) != '0':
+        return None
+
+    rows = []
+    for row, line in enumerate(lines[1:], start=1):
+        cells = tuple(line.split('\t'))
+        if not cells[0].strip():
+            break
+        rows.append(GridRow(row, cells))
+    return rows
+
+
+def _code(value: str) -> str:
+    """코드 값 정규화 ("4.자녀" → "4", 빈 값 → "")"""
+    match = _LEADING_CODE.match(value)
+    return match.group(1) if match else value.strip()
+
+
+def _flag(value: str) -> str:
+    """체크 값 정규화 ("1"=체크, "0"=미체크)"""
+    return '1' if value.strip().upper() in _CHECKED_VALUES else '0'
+
+
+def _nationality(value: str) -> str:
+    """내/외국인 정규화 ("1"=내국인, "2"=외국인)"""
+    value = value.strip()
+    if value.startswith('외'):
+        return '2'
+    if value.startswith('내'):
+        return '1'
+    return _code(value)
+
+
+def _same_number(grid_value: str, expected: str) -> bool:
+    """
+    번호 비교 (하이픈/공백 무시, 그리드의 * 마스킹 자리는 비교 생략)
+    """
+    grid_value = re.sub(r'[\s\-]', '', grid_value).upper()
+    if len(grid_value) != len(expected):
+        return False
+    return all(g == '*' or g == e for g, e in zip(grid_value, expected))
+
+
+class DependentGridComparer:
+    """부양가족 스프레드 행과 CSV 부양가족 비교"""
+
+    def expected_fields(self, dep: NormalizedDependent) -> Dict[str, str]:
+        """
+        부양가족 입력 후 그리드에 있어야 할 값 (입력하는 열만)
+
+        Args:
+            dep: 정규화된 부양가족
+
+        Returns:
+            {열 이름: 정규화된 값}
+        """
+        fields = {
+            "관계": dep.relationship_code,
+            "성명": dep.name.strip(),
+            "내외국인": dep.nationality_code,
+            "번호구분": dep.id_type,
+            "번호": dep.id_number,
+            "기본공제": '1' if dep.basic_deduction else '0',
+        }
+        if dep.basic_deduction:
+            fields["장애"] = dep.disability_type
+            if dep.relationship_code == '4':
+                fields["자녀"] = '1' if dep.child_deduction else '0'
+        return fields
+
+    def paste_cells(self, dep: NormalizedDependent) -> List[str]:
+        """
+        부양가족 1명을 붙여넣을 셀 값 (GRID_COLUMNS 순서)
+
+        나이는 번호로 자동 계산되므로 빈 값, 경로는 필드별 입력({RIGHT}로 건너뜀)과 같게 빈 값,
+        장애/자녀는 기본공제일 때만(자녀는 관계 4만) 채웁니다. 잠긴 셀은 붙여넣어도 바뀌지 않습니다.
+
+        Args:
+            dep: 정규화된 부양가족
+
+        Returns:
+            셀 값 리스트
+        """
+        fields = self.expected_fields(dep)
+        cells = [""] * len(GRID_COLUMNS)
+        for column, value in fields.items():
+            cells[GRID_COLUMNS[column]] = value
+        return cells
+
+    def paste_row(self, dep: NormalizedDependent) -> str:
+        """부양가족 1명의 TSV 한 행 (탭 구분, 줄바꿈 없음)"""
+        return '\t'.join(self.paste_cells(dep))
+
+    def paste_block(self, dependents: List[NormalizedDependent]) -> str:
+        """부양가족 여러 명의 TSV 블록 (행 구분 CRLF, 마지막 줄바꿈 없음)"""
+        return '\r\n'.join(self.paste_row(dep) for dep in dependents)
+
+    def matches(self, row: GridRow, dep: NormalizedDependent) -> bool:
+        """그리드 행이 부양가족 입력 결과와 같으면 True"""
+        for column, expected in self.expected_fields(dep).items():
+            value = row.cell(column)
+            if column == "번호":
+                same = _same_number(value, expected)
+            elif column == "성명":
+                same = value == expected
+            elif column == "내외국인":
+                same = _nationality(value) == expected
+            elif column in ("기본공제", "자녀"):
+                same = _flag(value) == expected
+            elif column == "장애":
+                same = (_code(value) or '0') == expected
+            else:
+                same = _code(value) == expected
+            if not same:
+                return False
+        return True
+
+    def diff(self, rows: List[GridRow], dependents: List[NormalizedDependent]) -> GridDiff:
+        """
+        그리드 행과 CSV 부양가족 비교
+
+        순서와 관계없이 같은 내용의 행은 그대로 두고, 맞는 부양가족이 없는 행은 삭제,
+        맞는 행이 없는 부양가족은 새로 입력합니다. 내용이 바뀐 행은 삭제 후 다시 입력합니다.
+
+        Args:
+            rows: parse_grid() 결과
+            dependents: 정렬된 부양가족 리스트 (본인 제외)
+
+        Returns:
+            GridDiff
+        """
+        remaining = list(rows)
+        kept = []
+        appended = []
+
+        for dep in dependents:
+            for row in remaining:
+                if self.matches(row, dep):
+                    kept.append(row)
+                    remaining.remove(row)
+                    break
+            else:
+                appended.append(dep)
+
+        deleted = sorted(remaining, key=lambda r: r.row, reverse=True)
+        return GridDiff(kept, deleted, appended)
@@ -0,0 +1,163 @@
+"""
+부양가족 정규화 모듈
+
+CSV를 읽은 직후 한 번만 사원별 부양가족을 입력용 값으로 바꿔 둡니다.
+본인(관계코드 0) 제외, (관계코드, 이름) 정렬, 내/외국인 코드 변환, 번호 정제/구분,
+만나이/기본공제/장애/자녀공제 변환을 여기서 끝내므로 입력 루프에서는 문자열을 해석하지 않습니다.
+"""
+
+import re
+from typing import Callable, Dict, Iterable, List, Mapping, NamedTuple, Optional, Tuple
+
+from src.value_digest import values_digest
+
+# 번호 구분 코드
+ID_TYPE_RESIDENT = '1'      # 주민등록번호
+ID_TYPE_FOREIGNER = '2'     # 외국인등록번호
+ID_TYPE_PASSPORT = '3'      # 여권번호
+
+# 내/외국인 CSV 값 → 코드 (1=내국인, 2=외국인)
+NATIONALITY_CODES = {
+    'N': '1', '내': '1', '내국인': '1', '1': '1',
+    'Y': '2', '외': '2', '외국인': '2', '2': '2',
+}
+
+_PASSPORT = re.compile(r'[A-Za-z]')
+_SPACE_DASH = re.compile(r'[\s\-]')
+_NON_DIGIT = re.compile(r'[^0-9]')
+
+
+class NormalizedDependent(NamedTuple):
+    """입력용으로 정규화된 부양가족 1명 (불변)"""
+    employee_no: str
+    employee_name: str
+    relationship_code: str
+    name: str
+    nationality_code: str       # '1'=내국인, '2'=외국인
+    id_type: str                # ID_TYPE_*
+    id_number: str              # 정제된 번호
+    age: int                    # 만나이 (숫자가 아니면 0)
+    basic_deduction: bool       # 기본공제 (N이 아니면 공제)
+    disability_type: str        # 장애유형 코드 ('0'=없음)
+    child_deduction: bool       # 자녀공제 Y
+
+
+class EmployeeDependents(NamedTuple):
+    """사원 1명의 정규화된 부양가족 (본인 제외, 입력 순서)"""
+    employee_no: str
+    employee_name: str
+    dependents: Tuple[NormalizedDependent, ...]
+    digest: str                 # 진행 저널용 CSV 원본 값 해시 (본인 행 포함)
+
+
+def normalize_nationality(value: str) -> Optional[str]:
+    """
+    내/외국인 값 → 코드
+
+    Args:
+        value: CSV의 내/외국인 값 (N, Y, 내, 외 등)
+
+    Returns:
+        '1'/'2', 알 수 없는 값이면 None
+    """
+    return NATIONALITY_CODES.get(value.strip().upper())
+
+
+def normalize_id_number(id_number: str) -> Tuple[str, str]:
+    """
+    주민등록번호/외국인등록번호/여권번호 정제 및 구분
+
+    Args:
+        id_number: 원본 번호
+
+    Returns:
+        (구분 코드, 정제된 번호) - 알파벳이 있으면 여권번호, 13자리 숫자의 7번째 자리가
+        5~8이면 외국인등록번호, 그 밖(길이가 맞지 않는 번호 포함)은 주민등록번호
+    """
+    if _PASSPORT.search(id_number):
+        return ID_TYPE_PASSPORT, _SPACE_DASH.sub('', id_number).upper()
+
+    cleaned = _NON_DIGIT.sub('', id_number)
+    if len(cleaned) == 13 and cleaned[6] in '5678':
+        return ID_TYPE_FOREIGNER, cleaned
+    return ID_TYPE_RESIDENT, cleaned
+
+
+def normalize_dependent(dep, log_callback: Callable[[str, str], None] = None) -> NormalizedDependent:
+    """
+    부양가족 1명 정규화
+
+    Args:
+        dep: DependentData (또는 같은 속성을 가진 행)
+        log_callback: 로그 출력 콜백 함수 (level, message), 해석할 수 없는 값 경고용
+
+    Returns:
+        NormalizedDependent
+    """
+    def warn(message):
+        if log_callback:
+            log_callback("WARNING", f"{dep.employee_no} {dep.name}: {message}")
+
+    nationality_code = normalize_nationality(dep.nationality)
+    if nationality_code is None:
+        warn(f"알 수 없는 내/외국인 값: '{dep.nationality}' → 내국인(1)로 처리")
+        nationality_code = '1'
+
+    id_type, id_number = normalize_id_number(dep.id_number)
+    if id_type != ID_TYPE_PASSPORT and len(id_number) != 13:
+        warn(f"비정상 번호 길이 ({len(id_number)}자리): {dep.id_number}")
+
+    age_text = dep.age.strip()
+    age = int(age_text) if age_text.isdigit() else 0
+
+    return NormalizedDependent(
+        employee_no=dep.employee_no,
+        employee_name=dep.employee_name,
+        relationship_code=dep.relationship_code,
+        name=dep.name,
+        nationality_code=nationality_code,
+        id_type=id_type,
+        id_number=id_number,
+        age=age,
+        basic_deduction=dep.basic_deduction.strip().upper() != 'N',
+        disability_type=dep.disability_type.strip() or '0',
+        child_deduction=dep.child_deduction.strip().upper() == 'Y',
+    )
+
+
+def normalize_employee(employee_no: str, rows: List, log_callback=None) -> EmployeeDependents:
+    """
+    사원 1명 정규화 (본인 제외, (관계코드, 이름) 정렬)
+
+    Args:
+        employee_no: 사번
+        rows: 사원의 CSV 행 (CSV 순서, 본인 포함)
+        log_callback: 로그 출력 콜백 함수 (level, message)
+
+    Returns:
+        EmployeeDependents
+    """
+    employee_name = rows[0].employee_name if rows else ""
+    dependents = sorted((d for d in rows if d.relationship_code != '0'),
+                        key=lambda d: (d.relationship_code, d.name))
+    return EmployeeDependents(
+        employee_no,
+        employee_name,
+        tuple(normalize_dependent(d, log_callback) for d in dependents),
+        values_digest(tuple(d.to_dict().values()) for d in rows),
+    )
+
+
+def normalize_employees(grouped: Mapping[str, Iterable], log_callback=None) -> Dict[str, EmployeeDependents]:
+    """
+    전체 사원 정규화 (CSV 로드 직후 한 번)
+
+    Args:
+        grouped: 사번 → CSV 행 목록 (CSVReader.group_by_employee() 결과)
+        log_callback: 로그 출력 콜백 함수 (level, message)
+
+    Returns:
+        {사번: EmployeeDependents} (CSV에 사원이 처음 나온 순서)
+    """
+    return {emp_no: normalize_employee(emp_no, list(rows), log_callback)
+            for emp_no, rows in grouped.items()}
@@ -0,0 +1,136 @@
+"""
+부양가족 열 저장소 모듈
+
+CSV 행마다 DependentData 객체를 두는 대신 필드별 열(list)에 값을 담습니다.
+반복되는 문자열(사번, 근로자명, 코드 값)은 intern해서 하나만 두고,
+사원별 행이 연속되도록 정렬해 사번 → 행 범위 색인을 미리 만듭니다.
+행은 __slots__ 뷰(DependentRow)로 꺼내며 DependentData와 같은 속성을 가집니다.
+"""
+
+import sys
+from collections.abc import Mapping
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+# 저장하는 필드 (열 순서, DependentData 속성 이름)
+FIELDS = (
+    'employee_no', 'employee_name', 'relationship_code', 'name', 'nationality',
+    'id_number', 'age', 'basic_deduction', 'disability_type', 'child_deduction',
+)
+
+
+def _column_property(column: int, field: str) -> property:
+    """열 번호로 값을 읽는 속성"""
+    return property(lambda self: self._columns[column][self._index], doc=field)
+
+
+class DependentRow:
+    """저장소의 행 1개 (DependentData와 같은 속성, 읽기 전용)"""
+
+    __slots__ = ('_columns', '_index')
+
+    def __init__(self, columns: Tuple[list, ...], index: int):
+        self._columns = columns
+        self._index = index
+
+    def __repr__(self):
+        return f"DependentData({self.employee_no}, {self.name}, 관계={self.relationship_code})"
+
+    def __eq__(self, other):
+        if not isinstance(other, DependentRow):
+            return NotImplemented
+        return self._columns is other._columns and self._index == other._index
+
+    def __hash__(self):
+        return hash((id(self._columns), self._index))
+
+    def to_dict(self) -> Dict[str, str]:
+        """딕셔너리로 변환"""
+        return {field: column[self._index] for field, column in zip(FIELDS, self._columns)}
+
+
+for _column, _field in enumerate(FIELDS):
+    setattr(DependentRow, _field, _column_property(_column, _field))
+
+
+class DependentStore(Mapping):
+    """
+    사번별 부양가족 저장소 (사번 → 행 목록 Mapping)
+
+    group_by_employee()가 돌려주던 딕셔너리 자리에 그대로 쓸 수 있습니다.
+    순회 순서는 CSV에 사원이 처음 나온 순서, 사원 안의 행은 CSV 순서입니다.
+    """
+
+    def __init__(self, records: Iterable):
+        """
+        열 저장소 생성
+
+        Args:
+            records: DependentData (또는 같은 속성을 가진 객체) 반복자, CSV 순서
+        """
+        intern = sys.intern
+        raw = tuple([] for _ in FIELDS)
+        for record in records:
+            for column, field in zip(raw, FIELDS):
+                column.append(intern(getattr(record, field)))
+
+        # 사원별 행이 연속되도록 안정 정렬 (사원은 처음 나온 순서)
+        rank: Dict[str, int] = {}
+        for emp_no in raw[0]:
+            rank.setdefault(emp_no, len(rank))
+        order = sorted(range(len(raw[0])), key=lambda i: rank[raw[0][i]])
+
+        self._columns: Tuple[list, ...] = tuple([column[i] for i in order] for column in raw)
+        # CSV 순서 → 저장소 행 번호
+        self._csv_order: List[int] = [0] * len(order)
+        for position, original in enumerate(order):
+            self._csv_order[original] = position
+
+        # 사번 → (시작, 끝) 행 범위
+        self._ranges: Dict[str, Tuple[int, int]] = {}
+        emp_nos = self._columns[0]
+        start = 0
+        for index in range(1, len(emp_nos) + 1):
+            if index == len(emp_nos) or emp_nos[index] != emp_nos[start]:
+                self._ranges[emp_nos[start]] = (start, index)
+                start = index
+
+        # 사원 목록 (본인 행 기준, 마지막 본인 행 이름)
+        employees: Dict[str, str] = {}
+        for emp_no, name, code in zip(emp_nos, self._columns[1], self._columns[2]):
+            if code == '0':
+                employees[emp_no] = name
+        self._employees: List[Tuple[str, str]] = list(employees.items())
+
+    # Mapping 인터페이스
+    def __getitem__(self, employee_no: str) -> List[DependentRow]:
+        start, stop = self._ranges[employee_no]
+        columns = self._columns
+        return [DependentRow(columns, index) for index in range(start, stop)]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._ranges)
+
+    def __len__(self) -> int:
+        return len(self._ranges)
+
+    def __contains__(self, employee_no) -> bool:
+        return employee_no in self._ranges
+
+    @property
+    def row_count(self) -> int:
+        """전체 행 수"""
+        return len(self._csv_order)
+
+    def row_range(self, employee_no: str) -> Tuple[int, int]:
+        """사원의 행 범위 (시작, 끝), 없으면 (0, 0)"""
+        return self._ranges.get(employee_no, (0, 0))
+
+    def rows(self) -> Iterator[DependentRow]:
+        """전체 행을 CSV 순서대로"""
+        columns = self._columns
+        for index in self._csv_order:
+            yield DependentRow(columns, index)
+
+    def employee_list(self) -> List[Tuple[str, str]]:
+        """사원 목록 [(사번, 이름)] (본인 행 기준, 미리 만들어 둔 값)"""
+        return list(self._employees)
@@ -0,0 +1,62 @@
+"""
+사원 목록 스냅샷 모듈
+
+왼쪽 사원 목록(fpUSpread80)의 사번 열을 한 번에 복사한 TSV를
+순서가 있는 사번 목록으로 변환합니다.
+"""
+
+from typing import Dict, Iterator, List, Optional
+
+
+class EmployeeSnapshot:
+    """왼쪽 사원 목록 스냅샷 (행 순서대로의 사번 목록)"""
+
+    def __init__(self, employee_nos: List[str]):
+        """
+        Args:
+            employee_nos: 행 순서대로의 사번 리스트
+        """
+        self.employee_nos = employee_nos
+        self._index: Dict[str, int] = {}
+        for idx, emp_no in enumerate(employee_nos):
+            self._index.setdefault(emp_no, idx)
+
+    @classmethod
+    def parse(cls, tsv: str) -> "EmployeeSnapshot":
+        """
+        복사한 TSV 파싱
+
+        선택 영역의 첫 번째 열을 사번으로 사용합니다.
+        빈 사번 또는 이미 나온 사번(목록 끝의 빈 행/중복 행)에서 끝으로 판단합니다.
+
+        Args:
+            tsv: 클립보드 텍스트 (행=줄바꿈, 열=탭)
+
+        Returns:
+            EmployeeSnapshot
+        """
+        employee_nos = []
+        seen = set()
+        for line in tsv.splitlines():
+            emp_no = line.split('\t', 1)[0].strip()
+            if not emp_no or emp_no in seen:
+                break
+            seen.add(emp_no)
+            employee_nos.append(emp_no)
+        return cls(employee_nos)
+
+    def index_of(self, employee_no: str) -> Optional[int]:
+        """사번의 행 위치 (0부터, 없으면 None)"""
+        return self._index.get(employee_no)
+
+    def __len__(self) -> int:
+        return len(self.employee_nos)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.employee_nos)
+
+    def __getitem__(self, idx):
+        return self.employee_nos[idx]
+
+    def __repr__(self):
+        return f"EmployeeSnapshot({len(self.employee_nos)}명)"
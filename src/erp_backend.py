@@ -0,0 +1,183 @@
+"""
+ERP 백엔드 모듈
+
+자동화 코드가 ERP 창/클립보드/전역 키보드에 접근하는 경로를 한 곳으로 모읍니다.
+실제 실행은 Win32Backend(pywinauto, pyperclip, keyboard)를 사용하고,
+Linux 벤치마크는 같은 메서드를 가진 시뮬레이터 백엔드(src.erp_simulator)를 사용합니다.
+Windows 전용 패키지는 실제로 쓰는 시점에만 import합니다.
+"""
+
+from contextlib import contextmanager
+from typing import List, Optional, Tuple
+
+
+class Win32Backend:
+    """실제 ERP 백엔드 (pywinauto win32 + pyperclip + keyboard)"""
+
+    def connect(self, title: str, process_id: int = None):
+        """
+        창 제목으로 ERP 프로그램에 연결
+
+        Args:
+            title: 창 제목 (예: "사원등록")
+            process_id: 같은 제목의 창이 여러 개일 때 연결할 프로세스 ID (None이면 제목으로)
+
+        Returns:
+            (Application, 창 wrapper) 튜플
+
+        Raises:
+            Exception: 창을 찾을 수 없는 경우 (pywinauto 예외)
+        """
+        from pywinauto import Application
+
+        app = Application(backend='win32')
+        if process_id is not None:
+            app.connect(process=process_id)
+        else:
+            app.connect(title=title)
+        return app, app.window(title=title)
+
+    def find_windows(self, title: str) -> List[Tuple[int, int]]:
+        """
+        제목이 같은 최상위 창 목록 (여러 회사 DB를 동시에 열어 둔 경우)
+
+        Args:
+            title: 창 제목
+
+        Returns:
+            [(프로세스 ID, hwnd), ...]
+        """
+        import win32process
+        from pywinauto import findwindows
+
+        found = []
+        for hwnd in findwindows.find_windows(title=title):
+            _, pid = win32process.GetWindowThreadProcessId(hwnd)
+            found.append((pid, hwnd))
+        return found
+
+    @contextmanager
+    def exclusive(self, focus=None):
+        """
+        키 입력/복사/붙여넣기 묶음을 전경 창 하나로 보내는 구간
+
+        창 하나만 다룰 때는 아무 것도 하지 않습니다. 여러 창을 동시에 실행할 때는
+        ArbitratedBackend가 이 구간 동안 전경 창을 독점하고 필요하면 focus로 전환합니다.
+
+        Args:
+            focus: 전경 전환이 필요할 때 set_focus할 컨트롤/창
+        """
+        yield
+
+    def process_id(self, window) -> int:
+        """창의 프로세스 ID"""
+        import win32process
+
+        _, pid = win32process.GetWindowThreadProcessId(window.handle)
+        return pid
+
+    def process_dialogs(self, app, process_id: int) -> List[Tuple[int, str, object]]:
+        """
+        프로세스의 보이는 대화상자(#32770) 목록
+
+        Args:
+            app: connect()로 얻은 Application
+            process_id: 프로세스 ID
+
+        Returns:
+            [(hwnd, 제목, 창 wrapper), ...]
+        """
+        import win32gui
+        import win32process
+
+        found = []
+
+        def enum_callback(hwnd, results):
+            if win32gui.IsWindowVisible(hwnd):
+                _, pid = win32process.GetWindowThreadProcessId(hwnd)
+                if pid == process_id and win32gui.GetClassName(hwnd) == "#32770":
+                    results.append((hwnd, win32gui.GetWindowText(hwnd)))
+            return True
+
+        win32gui.EnumWindows(enum_callback, found)
+        return [(hwnd, title, app.window(handle=hwnd)) for hwnd, title in found]
+
+    def get_clipboard(self) -> str:
+        """클립보드 텍스트"""
+        import pyperclip
+
+        return pyperclip.paste()
+
+    def set_clipboard(self, text: str):
+        """클립보드에 텍스트 복사"""
+        import pyperclip
+
+        pyperclip.copy(text)
+
+    def clipboard_sequence(self) -> int:
+        """클립보드 변경 번호 (클립보드 내용이 바뀔 때마다 증가)"""
+        import win32clipboard
+
+        return win32clipboard.GetClipboardSequenceNumber()
+
+    def press_global(self, key: str):
+        """포커스와 관계없이 전역 키 입력 (예: 삭제 확인 'y')"""
+        import keyboard
+
+        keyboard.press_and_release(key)
+
+    def send_keys(self, keys: str, pause: float = 0.05):
+        """현재 포커스 창에 키 입력 (pywinauto 키 문법, pause는 키 사이 간격)"""
+        from pywinauto.keyboard import send_keys
+
+        send_keys(keys, pause=pause)
+
+    def char_message(self, control, ch: str):
+        """컨트롤 핸들로 WM_CHAR 전송 (전경 창과 무관)"""
+        import win32api
+        import win32con
+
+        win32api.SendMessage(control.handle, win32con.WM_CHAR, ord(ch), 0)
+
+    def key_message(self, control, key: str):
+        """
+        컨트롤 핸들로 WM_KEYDOWN/WM_KEYUP 전송 (전경 창과 무관)
+
+        Args:
+            control: 스프레드 컨트롤
+            key: 가상 키 이름 (src.key_syntax.VIRTUAL_KEYS의 키, 예: "DOWN")
+        """
+        import win32api
+        import win32con
+        from src.key_syntax import VIRTUAL_KEYS
+
+        vk = VIRTUAL_KEYS[key]
+        # lParam: 반복 1 + 스캔 코드, 이동/편집 키는 확장 키 비트
+        lparam = 1 | (win32api.MapVirtualKey(vk, 0) << 16)
+        if 0x21 <= vk <= 0x2E:
+            lparam |= 1 << 24
+        win32api.SendMessage(control.handle, win32con.WM_KEYDOWN, vk, lparam)
+        win32api.SendMessage(control.handle, win32con.WM_KEYUP, vk, lparam | 0xC0000000)
+
+    def on_press_key(self, key: str, callback):
+        """전역 키 눌림 리스너 등록"""
+        import keyboard
+
+        keyboard.on_press_key(key, callback)
+
+    def unhook_key(self, key: str):
+        """전역 키 리스너 해제"""
+        import keyboard
+
+        keyboard.unhook_key(key)
+
+
+_default_backend: Optional[Win32Backend] = None
+
+
+def default_backend() -> Win32Backend:
+    """기본 백엔드 (Win32Backend, 처음 호출 시 생성)"""
+    global _default_backend
+    if _default_backend is None:
+        _default_backend = Win32Backend()
+    return _default_backend
@@ -0,0 +1,574 @@
+"""
+ERP 시뮬레이터 모듈
+
+사원등록 창(왼쪽 사원 목록 + 오른쪽 부양가족 스프레드)과 분납적용 다이얼로그를
+프로세스 안에서 흉내냅니다. 커서 이동, 셀 편집, 클립보드, F5 삭제 확인,
+키당 처리 지연/흔들림을 모델링하며, SimulatorBackend로 자동화 코드에 연결합니다.
+
+시간은 VirtualClock으로 흘러가므로 실제로 기다리지 않고도 처리량을 잴 수 있습니다.
+"""
+
+import random
+import re
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+from src.key_syntax import KeyToken, tokenize
+from src.dependent_grid import GRID_COLUMNS
+
+
+class VirtualClock:
+    """가상 시계 (sleep은 시간만 앞으로 보냄)"""
+
+    def __init__(self, start: float = None):
+        self.epoch = start if start is not None else time.time()
+        self.now = 0.0
+
+    def sleep(self, seconds: float):
+        if seconds > 0:
+            self.now += seconds
+
+    def time(self) -> float:
+        return self.epoch + self.now
+
+    def perf_counter(self) -> float:
+        return self.now
+
+    @contextmanager
+    def install(self):
+        """time.sleep / time.time / time.perf_counter를 가상 시계로 교체"""
+        saved = (time.sleep, time.time, time.perf_counter)
+        time.sleep, time.time, time.perf_counter = self.sleep, self.time, self.perf_counter
+        try:
+            yield self
+        finally:
+            time.sleep, time.time, time.perf_counter = saved
+
+
+class WallClock:
+    """실제 시계 (여러 창 동시 실행처럼 스레드가 실제로 기다려야 할 때)"""
+
+    def __init__(self):
+        self.now = 0.0      # VirtualClock과 같은 속성 (사용하지 않음)
+
+    def sleep(self, seconds: float):
+        if seconds > 0:
+            time.sleep(seconds)
+
+    def time(self) -> float:
+        return time.time()
+
+    def perf_counter(self) -> float:
+        return time.perf_counter()
+
+    @contextmanager
+    def install(self):
+        """아무 것도 바꾸지 않음 (VirtualClock.install과 같은 사용법)"""
+        yield self
+
+
+class SimClipboard:
+    """클립보드 (변경 순번 포함)"""
+
+    def __init__(self):
+        self.text = ""
+        self.sequence = 0
+
+    def set(self, text: str):
+        self.text = text
+        self.sequence += 1
+
+
+class SimColumn(NamedTuple):
+    """스프레드 열 정의"""
+    name: str
+    width: int = 0                  # 이 글자 수가 되면 자동으로 다음 열 이동 (0이면 안 함)
+    locked: Optional[Callable] = None   # locked(row) → True면 커서가 건너뜀
+    default: str = ""               # 새 행을 만들 때 기본값
+    enter_skip: bool = False        # True면 ENTER로는 건너뛰지만 방향키로는 갈 수 있음
+
+
+class SimControl:
+    """스프레드 외 자식 컨트롤 (라벨 등)"""
+
+    def __init__(self, text: str, class_name: str = "Static", left: int = 0):
+        self._text = text
+        self._class_name = class_name
+        self._left = left
+
+    def window_text(self) -> str:
+        return self._text
+
+    def class_name(self) -> str:
+        return self._class_name
+
+    def rectangle(self):
+        return _Rect(self._left)
+
+
+class _Rect(NamedTuple):
+    left: int
+
+
+class SimSpread:
+    """fpUSpread80 스프레드 시뮬레이션"""
+
+    def __init__(self, sim: "ErpSimulator", columns: List[SimColumn], rows: List[List[str]] = None,
+                 left: int = 0, readonly: bool = False, insert_row: bool = True, wrap: bool = False,
+                 on_row_change: Callable = None, on_commit: Callable = None, on_f5: Callable = None):
+        """
+        Args:
+            sim: 시뮬레이터 (시계/클립보드/지연 설정 공유)
+            columns: 열 정의
+            rows: 초기 데이터 (행마다 열 개수만큼의 문자열)
+            left: 화면 X 좌표 (왼쪽/오른쪽 정렬용)
+            readonly: True면 문자 입력 무시 (사원 목록)
+            insert_row: True면 마지막 데이터 행 아래 빈 입력 행으로 이동 가능
+            wrap: True면 마지막 열에서 ENTER 시 다음 행 첫 열로 이동
+            on_row_change: 행이 바뀌면 호출 (spread)
+            on_commit: 셀 값이 확정되면 호출 (spread, row, col)
+            on_f5: F5 입력 시 호출 (spread)
+        """
+        self.sim = sim
+        self.columns = columns
+        self.rows = rows if rows is not None else []
+        self.left = left
+        self.readonly = readonly
+        self.insert_row = insert_row
+        self.wrap = wrap
+        self.on_row_change = on_row_change
+        self.on_commit = on_commit
+        self.on_f5 = on_f5
+
+        self.handle = sim.next_handle()
+        self.row = 0
+        self.col = 0
+        self.anchor = None      # 선택 시작 (row, col)
+        self.editing = None     # 입력 중인 문자열
+
+    # ---- pywinauto wrapper 호환 ----
+
+    def class_name(self) -> str:
+        return "fpUSpread80"
+
+    def window_text(self) -> str:
+        return ""
+
+    def rectangle(self):
+        return _Rect(self.left)
+
+    def set_focus(self):
+        self.sim.focused = self
+
+    def type_keys(self, keys: str, pause: float = 0.01, with_spaces: bool = True, **kwargs):
+        """키 입력 (pywinauto type_keys 문법)"""
+        self.sim.focused = self
+        for token in tokenize(keys):
+            if token.key == 'PAUSE':
+                self.sim.clock.sleep(token.pause)
+                continue
+            if token.is_char and token.key == ' ' and not with_spaces:
+                continue
+            self.sim.charge_key(pause)
+            self._key(token)
+
+    def receive_message(self, token: KeyToken):
+        """창 메시지(WM_CHAR/WM_KEYDOWN)로 받은 키 1개 (포커스를 바꾸지 않음)"""
+        self.sim.charge_key(0.0)
+        self._key(token)
+
+    # ---- 셀 접근 ----
+
+    def max_row(self) -> int:
+        """커서가 갈 수 있는 마지막 행"""
+        last = len(self.rows) if self.insert_row else len(self.rows) - 1
+        return max(0, last)
+
+    def cell(self, row: int, col: int) -> str:
+        if row < len(self.rows) and col < len(self.rows[row]):
+            return self.rows[row][col]
+        return ""
+
+    def _set_cell(self, row: int, col: int, value: str):
+        while row >= len(self.rows):
+            self.rows.append([c.default for c in self.columns])
+        self.rows[row][col] = value
+
+    def _locked(self, col: int, row: int = None) -> bool:
+        locked = self.columns[col].locked
+        if locked is None:
+            return False
+        if row is None:
+            row = self.row
+        values = self.rows[row] if row < len(self.rows) else [c.default for c in self.columns]
+        return locked(values)
+
+    # ---- 키 처리 ----
+
+    def _key(self, token):
+        mods = token.modifiers
+        key = token.key
+
+        if 'CTRL' in mods and token.is_char:
+            if key.lower() == 'c':
+                self._copy()
+            elif key.lower() == 'v':
+                self._paste()
+            return
+
+        if token.is_char:
+            self._type_char(key)
+            return
+
+        if key in ('HOME', 'END', 'LEFT', 'RIGHT', 'UP', 'DOWN', 'TAB', 'PGUP', 'PGDN'):
+            self._commit()
+            if 'SHIFT' in mods:
+                if self.anchor is None:
+                    self.anchor = (self.row, self.col)
+            else:
+                self.anchor = None
+            self._move(key, 'CTRL' in mods)
+        elif key == 'ENTER':
+            self._commit()
+            self.anchor = None
+            self._advance()
+        elif key == 'ESC':
+            self.editing = None
+            self.anchor = None
+        elif key == 'SPACE':
+            # 체크박스 셀 토글
+            self._set_cell(self.row, self.col, "" if self.cell(self.row, self.col) == "1" else "1")
+        elif key == 'F5' and self.on_f5:
+            self._commit()
+            self.on_f5(self)
+
+    def _type_char(self, ch: str):
+        if self.readonly:
+            return
+        self.editing = (self.editing or "") + ch
+        width = self.columns[self.col].width
+        if width and len(self.editing) >= width:
+            self._commit()
+            self._advance()
+
+    def _commit(self):
+        if self.editing is None:
+            return
+        value, self.editing = self.editing, None
+        self._set_cell(self.row, self.col, value)
+        if self.on_commit:
+            self.on_commit(self, self.row, self.col)
+
+    def _advance(self):
+        """다음 입력 가능한 열로 이동 (마지막 열이면 wrap에 따라 다음 행)"""
+        for col in range(self.col + 1, len(self.columns)):
+            if not self._locked(col) and not self.columns[col].enter_skip:
+                self.col = col
+                return
+        if self.wrap and self.row < self.max_row():
+            self._set_row(self.row + 1)
+            self.col = 0
+
+    def _set_row(self, row: int):
+        row = max(0, min(row, self.max_row()))
+        if row != self.row:
+            self.row = row
+            if self.on_row_change:
+                self.on_row_change(self)
+
+    def _move(self, key: str, ctrl: bool):
+        last_col = len(self.columns) - 1
+        if key == 'HOME':
+            if ctrl:
+                self._set_row(0)
+            self.col = 0
+        elif key == 'END':
+            if ctrl:
+                self._set_row(max(0, len(self.rows) - 1))
+            self.col = last_col
+        elif key in ('RIGHT', 'TAB'):
+            for col in range(self.col + 1, len(self.columns)):
+                if not self._locked(col):
+                    self.col = col
+                    break
+        elif key == 'LEFT':
+            for col in range(self.col - 1, -1, -1):
+                if not self._locked(col):
+                    self.col = col
+                    break
+        elif key == 'DOWN':
+            self._set_row(self.row + 1)
+        elif key == 'UP':
+            self._set_row(self.row - 1)
+        elif key == 'PGDN':
+            self._set_row(self.row + 20)
+        elif key == 'PGUP':
+            self._set_row(self.row - 20)
+
+    def _copy(self):
+        """선택 영역(없으면 현재 셀) 복사. 빈 값이면 클립보드가 바뀌지 않음 (실제 ERP와 같음)"""
+        if self.anchor is None:
+            text = self.cell(self.row, self.col)
+        else:
+            r1, r2 = sorted((self.anchor[0], self.row))
+            c1, c2 = sorted((self.anchor[1], self.col))
+            r2 = min(r2, len(self.rows) - 1)
+            text = '\r\n'.join(
+                '\t'.join(self.cell(r, c) for c in range(c1, c2 + 1)) for r in range(r1, r2 + 1)
+            )
+            if text:
+                text += '\r\n'
+        if text:
+            self.sim.clipboard.set(text)
+
+    def _paste(self):
+        """클립보드 TSV를 현재 셀부터 붙여넣기"""
+        self._commit()
+        text = self.sim.clipboard.text.rstrip('\r\n')
+        if self.readonly or not text:
+            return
+        for dr, line in enumerate(text.replace('\r\n', '\n').split('\n')):
+            for dc, value in enumerate(line.split('\t')):
+                col = self.col + dc
+                # 잠긴 셀은 붙여넣어도 바뀌지 않음
+                if col < len(self.columns) and not self._locked(col, self.row + dr):
+                    self._set_cell(self.row + dr, col, value)
+                    if self.on_commit:
+                        self.on_commit(self, self.row + dr, col)
+
+
+class SimWindow:
+    """최상위 창/다이얼로그"""
+
+    def __init__(self, sim: "ErpSimulator", title: str, children: list):
+        self.sim = sim
+        self.title = title
+        self._children = children
+        self.handle = sim.next_handle()
+
+    def children(self, class_name: str = None) -> list:
+        if class_name is None:
+            return list(self._children)
+        return [c for c in self._children if c.class_name() == class_name]
+
+    def window_text(self) -> str:
+        return self.title
+
+
+# 부양가족 스프레드 열 (GRID_COLUMNS 순서)
+_COL = GRID_COLUMNS
+
+
+def _age_from_number(number: str, year: int) -> str:
+    """주민/외국인등록번호 앞자리로 나이 계산 (시뮬레이터 자동 입력용)"""
+    if not re.fullmatch(r'\d{13}', number):
+        return ""
+    century = {'1': 1900, '2': 1900, '5': 1900, '6': 1900,
+               '3': 2000, '4': 2000, '7': 2000, '8': 2000}.get(number[6], 1800)
+    return str(year - (century + int(number[:2])))
+
+
+def _age_locked(row: List[str]) -> bool:
+    """경로 열: 기본공제 + 만 60세 이상일 때만 입력 가능"""
+    try:
+        age = int(row[_COL["나이"]])
+    except ValueError:
+        age = 0
+    return age < 60 or row[_COL["기본공제"]] == '0'
+
+
+DEPENDENT_COLUMNS = [
+    SimColumn("관계", width=1),
+    SimColumn("성명"),
+    SimColumn("내외국인", width=1),
+    SimColumn("번호구분", width=1),
+    SimColumn("번호", width=13),
+    SimColumn("나이", locked=lambda row: True),
+    SimColumn("기본공제", width=1, default="1"),
+    SimColumn("경로", width=1, locked=_age_locked),
+    SimColumn("장애", width=1),
+    SimColumn("자녀", width=1),
+]
+
+EMPLOYEE_COLUMNS = [SimColumn("선택"), SimColumn("사번"), SimColumn("성명")]
+
+INSTALLMENT_COLUMNS = [
+    SimColumn("총액_소득세"), SimColumn("총액_지방소득세"), SimColumn("총액_농특세"),
+    SimColumn("분납1_소득세"), SimColumn("분납1_지방소득세"), SimColumn("분납1_농특세"),
+    SimColumn("분납2_소득세"), SimColumn("분납2_지방소득세"), SimColumn("분납2_농특세"),
+    SimColumn("분납3_소득세", locked=lambda row: True),
+    SimColumn("체크", enter_skip=True),     # ENTER로는 가지 않고 방향키로 가서 SPACE로 토글
+]
+
+
+class ErpSimulator:
+    """사원등록 창 + 분납적용 다이얼로그 시뮬레이터"""
+
+    def __init__(self, key_latency: float = 0.0, jitter: float = 0.0, seed: int = 0, clock: VirtualClock = None):
+        """
+        Args:
+            key_latency: 키 1개당 ERP 처리 지연 (초, pause와 별도)
+            jitter: 키 1개당 추가 지연의 최대값 (초, 0~jitter 균등분포)
+            seed: 흔들림 난수 시드
+            clock: 가상 시계 (None이면 새로 생성)
+        """
+        self.clock = clock if clock is not None else VirtualClock()
+        self.clipboard = SimClipboard()
+        self.key_latency = key_latency
+        self.jitter = jitter
+        self.rng = random.Random(seed)
+        self.keystrokes = 0
+        self.focused = None
+        self.pending_confirm = None
+        self.windows: Dict[str, SimWindow] = {}
+        self.dialogs: List[SimWindow] = []
+        self._handle = 0x1000
+
+    def next_handle(self) -> int:
+        self._handle += 1
+        return self._handle
+
+    def charge_key(self, pause: float):
+        """키 1개 처리 시간 (입력 간격 + 처리 지연 + 흔들림)"""
+        self.keystrokes += 1
+        cost = pause + self.key_latency
+        if self.jitter:
+            cost += self.rng.uniform(0, self.jitter)
+        self.clock.sleep(cost)
+
+    # ---- 사원등록 ----
+
+    def build_employee_window(self, employees: List[tuple], dependents: Dict[str, List[List[str]]] = None):
+        """
+        사원등록 창 구성
+
+        Args:
+            employees: [(사번, 성명, 본인 주민번호), ...] (사원 목록 순서)
+            dependents: {사번: [부양가족 행, ...]} 기존 부양가족 (열은 DEPENDENT_COLUMNS 순서)
+        """
+        dependents = dependents or {}
+        year = datetime.fromtimestamp(self.clock.time()).year
+        self.grids: Dict[str, List[List[str]]] = {}
+        for emp_no, name, number in employees:
+            self_row = ['0', name, '1', '1', number, _age_from_number(number, year), '1', '', '', '']
+            self.grids[emp_no] = [self_row] + [list(r) for r in dependents.get(emp_no, [])]
+
+        def on_commit(spread, row, col):
+            if col == _COL["번호"]:
+                spread.rows[row][_COL["나이"]] = _age_from_number(spread.rows[row][col], year)
+
+        def on_f5(spread):
+            if 0 < spread.row < len(spread.rows):
+                target = spread.row
+                self.pending_confirm = lambda: spread.rows.pop(target)
+
+        self.right_spread = SimSpread(self, DEPENDENT_COLUMNS, left=400,
+                                      on_commit=on_commit, on_f5=on_f5)
+
+        def on_row_change(spread):
+            emp_no = spread.cell(spread.row, 1)
+            self.right_spread.rows = self.grids.get(emp_no, [])
+            self.right_spread.row = 0
+            self.right_spread.col = 0
+            self.right_spread.editing = None
+
+        rows = [['', emp_no, name] for emp_no, name, _ in employees]
+        self.left_spread = SimSpread(self, EMPLOYEE_COLUMNS, rows=rows, left=0, readonly=True,
+                                     insert_row=False, on_row_change=on_row_change)
+        on_row_change(self.left_spread)
+
+        self.windows["사원등록"] = SimWindow(self, "사원등록", [self.left_spread, self.right_spread])
+        self.focused = self.left_spread
+
+    def dependent_rows(self, emp_no: str) -> List[List[str]]:
+        """사원의 부양가족 스프레드 행 (본인 제외)"""
+        return self.grids.get(emp_no, [])[1:]
+
+    # ---- 분납적용 ----
+
+    def build_installment_dialog(self, employees: List[tuple]):
+        """
+        급여자료입력 창 + 분납적용 다이얼로그 구성
+
+        Args:
+            employees: [(사원코드, 사원명), ...]
+        """
+        def on_left_row_change(spread):
+            # 왼쪽 사원 목록에서 행을 옮기면 오른쪽 금액 스프레드도 같은 행으로 (Ctrl+Home 포함)
+            self.installment_spread.row = spread.row
+
+        left = SimSpread(self, [SimColumn("사원코드"), SimColumn("사원명")],
+                         rows=[[code, name] for code, name in employees], left=0, readonly=True, insert_row=False,
+                         on_row_change=on_left_row_change)
+        amounts = [[c.default for c in INSTALLMENT_COLUMNS] for _ in employees]
+
+        def on_row_change(spread):
+            # 왼쪽 사원 목록의 현재 행은 오른쪽 금액 스프레드의 현재 행을 따라감
+            left.row = spread.row
+
+        self.installment_spread = SimSpread(self, INSTALLMENT_COLUMNS, rows=amounts, left=300,
+                                            insert_row=False, wrap=True, on_row_change=on_row_change)
+        dialog = SimWindow(self, "", [SimControl("분납적용"), left, self.installment_spread])
+        self.dialogs.append(dialog)
+        self.windows["급여자료입력"] = SimWindow(self, "급여자료입력", [])
+        self.focused = self.installment_spread
+
+
+class SimulatorBackend:
+    """ErpSimulator를 자동화 코드에 연결하는 백엔드 (Win32Backend와 같은 메서드)"""
+
+    def __init__(self, sim: ErpSimulator):
+        self.sim = sim
+
+    def connect(self, title: str, process_id: int = None):
+        window = self.sim.windows.get(title)
+        if window is None:
+            raise Exception(f"시뮬레이터에 '{title}' 창이 없습니다")
+        return self.sim, window
+
+    def find_windows(self, title: str) -> list:
+        window = self.sim.windows.get(title)
+        return [(self.process_id(window), window.handle)] if window is not None else []
+
+    def process_id(self, window) -> int:
+        return 1
+
+    @contextmanager
+    def exclusive(self, focus=None):
+        yield
+
+    def process_dialogs(self, app, process_id: int) -> list:
+        return [(d.handle, d.title, d) for d in self.sim.dialogs]
+
+    def get_clipboard(self) -> str:
+        return self.sim.clipboard.text
+
+    def set_clipboard(self, text: str):
+        self.sim.clipboard.set(text)
+
+    def clipboard_sequence(self) -> int:
+        return self.sim.clipboard.sequence
+
+    def press_global(self, key: str):
+        self.sim.charge_key(0.0)
+        if key.lower() == 'y' and self.sim.pending_confirm:
+            confirm, self.sim.pending_confirm = self.sim.pending_confirm, None
+            confirm()
+
+    def char_message(self, control, ch: str):
+        control.receive_message(KeyToken((), ch, True))
+
+    def key_message(self, control, key: str):
+        control.receive_message(KeyToken((), key, False))
+
+    def send_keys(self, keys: str, pause: float = 0.05):
+        if self.sim.focused is not None:
+            self.sim.focused.type_keys(keys, pause=pause)
+
+    def on_press_key(self, key: str, callback):
+        pass
+
+    def unhook_key(self, key: str):
+        pass
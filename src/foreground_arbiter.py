@@ -0,0 +1,167 @@
+"""
+전경 창 조정 모듈
+
+type_keys/send_keys는 전경 창에만 입력되고 클립보드는 모든 창이 함께 쓰므로,
+여러 ERP 창을 동시에 자동화할 때는 한 번에 한 작업만 키를 보내야 합니다.
+ForegroundArbiter는 키 입력 묶음(burst) 동안만 전경 창을 한 작업에 독점시키고,
+작업이 입력 후 대기(sleep/동기화 대기)하는 동안 다른 작업이 키를 보내게 합니다.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict
+
+# 전경 창 전환 후 입력 전 대기 (초)
+DEFAULT_SWITCH_SETTLE = 0.15
+# 입력 묶음이 끝난 뒤 같은 작업이 다시 입력하면 전환 없이 이어 쓰도록 전경을 잡아 두는 시간 (초)
+DEFAULT_LINGER = 0.25
+
+
+class ForegroundArbiter:
+    """여러 작업이 하나의 전경 창을 번갈아 쓰도록 조정"""
+
+    def __init__(self, switch_settle: float = DEFAULT_SWITCH_SETTLE, linger: float = DEFAULT_LINGER,
+                 log_callback=None):
+        """
+        초기화
+
+        Args:
+            switch_settle: 다른 작업의 창으로 전환한 뒤 입력 전 대기 시간 (초)
+            linger: 독점이 끝난 작업이 이 시간 안에 다시 입력하면 다른 작업보다 먼저 씀 (초).
+                    전환 비용(switch_settle)보다 짧은 입력 후 대기마다 창을 바꾸지 않기 위함
+            log_callback: 로그 출력 콜백 함수 (level, message, *args - LogService.log와 같은 형태)
+        """
+        self.switch_settle = switch_settle
+        self.linger = linger
+        self.log_callback = log_callback
+
+        self._cond = threading.Condition()
+        self._owner = None      # 현재 전경 창을 가진 작업
+        self._holder = None     # 독점 중인 작업 (None이면 아무도 안 씀)
+        self._depth = 0         # 독점 중인 작업의 중첩 hold 깊이
+        self._released_at = 0.0     # 마지막 독점이 끝난 시각 (perf_counter)
+        self.switches = 0
+        self._stats: Dict[str, Dict[str, float]] = {}
+
+    def _log(self, level: str, message: str, *args):
+        """로그 출력 (콜백이 있으면 사용, args가 있으면 message는 % 포맷 문자열)"""
+        if self.log_callback:
+            self.log_callback(level, message, *args)
+
+    def _acquire(self, owner: str):
+        """독점 획득 (다른 작업이 쓰는 중이거나 linger 안이면 대기)"""
+        with self._cond:
+            while True:
+                if self._holder is None or self._holder == owner:
+                    break
+                if self._depth == 0:
+                    # 이전 작업이 입력을 끝냈고 linger가 지났으면 가져옴
+                    remaining = self._released_at + self.linger - time.perf_counter()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                else:
+                    self._cond.wait()
+            self._holder = owner
+            self._depth += 1
+            return self._depth == 1
+
+    def _release(self):
+        """독점 해제 (바깥 hold가 끝나면 linger 동안은 같은 작업이 우선)"""
+        with self._cond:
+            self._depth -= 1
+            if self._depth == 0:
+                self._released_at = time.perf_counter()
+                self._cond.notify_all()
+
+    @contextmanager
+    def hold(self, owner: str, activate: Callable[[], None] = None):
+        """
+        전경 창 독점 구간
+
+        다른 작업이 쓰고 있으면 끝날 때까지 기다리고, 마지막으로 전경을 가진 작업이
+        다른 작업이면 activate()로 전환한 뒤 switch_settle만큼 기다립니다.
+        같은 스레드 안에서는 중첩해서 쓸 수 있습니다.
+
+        Args:
+            owner: 작업 이름
+            activate: 이 작업의 창을 전경으로 가져오는 함수
+        """
+        wait_start = time.perf_counter()
+        outer = self._acquire(owner)
+        hold_start = time.perf_counter()
+        try:
+            if self._owner != owner:
+                if activate is not None:
+                    activate()
+                time.sleep(self.switch_settle)
+                self._log("DEBUG", "전경 전환: %s → %s", self._owner, owner)
+                self._owner = owner
+                self.switches += 1
+            yield
+        finally:
+            if outer:
+                with self._cond:
+                    stats = self._stats.setdefault(owner, {'holds': 0, 'hold_time': 0.0, 'wait_time': 0.0})
+                    stats['holds'] += 1
+                    stats['hold_time'] += time.perf_counter() - hold_start
+                    stats['wait_time'] += hold_start - wait_start
+            self._release()
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """작업별 독점 횟수/독점 시간/대기 시간 (초)"""
+        with self._cond:
+            return {owner: dict(values) for owner, values in self._stats.items()}
+
+
+class ArbitratedBackend:
+    """
+    작업 1개용 백엔드 래퍼 (다른 메서드는 감싼 백엔드에 그대로 위임)
+
+    exclusive()를 ForegroundArbiter.hold로 바꾸고, 전경 창으로 보내는
+    send_keys/press_global은 항상 독점 구간 안에서 보냅니다.
+    """
+
+    def __init__(self, backend, arbiter: ForegroundArbiter, owner: str, process_id: int = None):
+        """
+        Args:
+            backend: 실제 백엔드 (Win32Backend 또는 SimulatorBackend)
+            arbiter: 작업들이 함께 쓰는 ForegroundArbiter
+            owner: 작업 이름 (로그/통계용, 작업마다 달라야 함)
+            process_id: 연결할 ERP 프로세스 ID (None이면 창 제목으로)
+        """
+        self._backend = backend
+        self.arbiter = arbiter
+        self.owner = owner
+        self.target_process_id = process_id
+        self._window = None
+
+    def __getattr__(self, name):
+        return getattr(self._backend, name)
+
+    def connect(self, title: str, process_id: int = None):
+        """작업의 ERP 창에 연결 (전경 전환 대상으로 기억)"""
+        if process_id is None:
+            process_id = self.target_process_id
+        app, window = self._backend.connect(title, process_id=process_id)
+        self._window = window
+        return app, window
+
+    def exclusive(self, focus=None):
+        """이 작업이 전경 창을 독점하는 구간 (전환이 필요하면 focus 또는 연결한 창으로)"""
+        target = focus if focus is not None else self._window
+
+        def activate():
+            if target is not None:
+                target.set_focus()
+
+        return self.arbiter.hold(self.owner, activate)
+
+    def send_keys(self, keys: str, pause: float = 0.05):
+        with self.exclusive():
+            self._backend.send_keys(keys, pause=pause)
+
+    def press_global(self, key: str):
+        with self.exclusive():
+            self._backend.press_global(key)
@@ -5,26 +5,29 @@ Pause 키를 이용한 중지 기능을 제공합니다.
 """
 
 import time
-import keyboard
+
+from src.erp_backend import default_backend
 
 
 class HotkeyManager:
     """핫키 관리 클래스"""
 
-    def __init__(self, log_callback=None):
+    def __init__(self, log_callback=None, backend=None):
         """
         초기화
 
         Args:
             log_callback: 로그 출력 콜백 함수 (level, message)
+            backend: 전역 키 리스너를 제공하는 ERP 백엔드 (None이면 Win32Backend)
         """
         self.log_callback = log_callback
+        self.backend = backend if backend is not None else default_backend()
         self.stop_requested = False
         self.pause_press_count = 0
         self.last_pause_time = 0
 
         # Pause 키 리스너 등록
-        keyboard.on_press_key('pause', self._on_pause_press)
+        self.backend.on_press_key('pause', self._on_pause_press)
 
     def _log(self, level: str, message: str):
         """로그 출력 (콜백이 있으면 사용)"""
@@ -74,7 +77,7 @@ class HotkeyManager:
     def cleanup(self):
         """리소스 정리 (keyboard 후크 해제)"""
         try:
-            keyboard.unhook_key('pause')
+            self.backend.unhook_key('pause')
             self._log("INFO", "Pause 키 리스너 해제됨")
         except Exception as e:
             self._log("WARNING", f"Pause 키 리스너 해제 실패: {e}")
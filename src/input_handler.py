@@ -5,14 +5,30 @@
 """
 
 import time
-import pyperclip
 from typing import Tuple
 
+from src.dependent_normalizer import (
+    ID_TYPE_FOREIGNER, ID_TYPE_PASSPORT, normalize_id_number, normalize_nationality
+)
+from src.clipboard_reader import ClipboardReader, ClipboardTimeout, DEFAULT_COPY_TIMEOUT
+from src.erp_backend import default_backend
+from src.key_input import KEY_INPUT_TYPE_KEYS, create_key_input
+from src.sync_barrier import SyncBarrier, WAIT_MODE_SLEEP, WAIT_MODE_SYNC, WAIT_MODES
+
+# 부양가족 입력 방식
+INPUT_MODE_KEYS = "keys"        # 필드별 type_keys 호출 (기존 방식)
+INPUT_MODE_SCRIPT = "script"    # 부양가족 1명을 키 스크립트 1개로 컴파일해 한 번에 전송
+INPUT_MODE_PASTE = "paste"      # 부양가족 1명을 TSV 1행으로 붙여넣기 (확인 실패 시 필드별 입력)
+INPUT_MODE_BLOCK = "block"      # 사원 1명의 부양가족 전체를 TSV 블록으로 한 번에 붙여넣기 (확인 실패 시 행 단위)
+INPUT_MODES = (INPUT_MODE_KEYS, INPUT_MODE_SCRIPT, INPUT_MODE_PASTE, INPUT_MODE_BLOCK)
+
 
 class InputHandler:
     """입력 처리 클래스"""
 
-    def __init__(self, left_spread, right_spread, global_delay: float = 1.0, log_callback=None):
+    def __init__(self, left_spread, right_spread, global_delay: float = 1.0, log_callback=None,
+                 wait_mode: str = WAIT_MODE_SLEEP, sync_barrier: SyncBarrier = None, backend=None,
+                 copy_timeout: float = DEFAULT_COPY_TIMEOUT, key_input: str = KEY_INPUT_TYPE_KEYS):
         """
         초기화
 
@@ -20,17 +36,34 @@ class InputHandler:
             left_spread: 왼쪽 스프레드 컨트롤
             right_spread: 오른쪽 스프레드 컨트롤
             global_delay: 전역 지연 시간 배율 (0.5~2.0)
-            log_callback: 로그 출력 콜백 함수 (level, message)
+            log_callback: 로그 출력 콜백 함수 (level, message, *args - LogService.log와 같은 형태)
+            wait_mode: 입력 후 대기 방식 ("sleep"=고정 대기, "sync"=동기화 배리어)
+            sync_barrier: 동기화 배리어 (None이면 wait_mode가 "sync"일 때 Win32 백엔드로 생성)
+            backend: 클립보드를 제공하는 ERP 백엔드 (None이면 Win32Backend)
+            copy_timeout: Ctrl+C 후 클립보드 변경을 기다리는 최대 시간 (초, global_delay 적용)
+            key_input: 키 입력 방식 ("type_keys"=전경 창 입력, "message"=스프레드 핸들로 메시지 전송)
         """
+        if wait_mode not in WAIT_MODES:
+            raise ValueError(f"알 수 없는 대기 모드: {wait_mode} (가능: {', '.join(WAIT_MODES)})")
+
         self.left_spread = left_spread
         self.right_spread = right_spread
         self.global_delay = max(0.5, min(2.0, global_delay))
         self.log_callback = log_callback
+        self.wait_mode = wait_mode
+        self.backend = backend if backend is not None else default_backend()
+        self.sync_barrier = sync_barrier
+        if self.sync_barrier is None and wait_mode == WAIT_MODE_SYNC:
+            self.sync_barrier = SyncBarrier(log_callback=log_callback)
+        self.key_input = create_key_input(key_input, self.backend)
+        self.clipboard_reader = ClipboardReader(
+            self.backend, timeout=copy_timeout * self.global_delay, log_callback=log_callback
+        )
 
-    def _log(self, level: str, message: str):
-        """로그 출력 (콜백이 있으면 사용)"""
+    def _log(self, level: str, message: str, *args):
+        """로그 출력 (콜백이 있으면 사용, args가 있으면 message는 % 포맷 문자열)"""
         if self.log_callback:
-            self.log_callback(level, message)
+            self.log_callback(level, message, *args)
 
     def type_keys(self, control, keys: str, **kwargs):
         """
@@ -46,10 +79,10 @@ class InputHandler:
         """
         # 어느 스프레드인지 구분
         control_name = "LEFT " if control == self.left_spread else "RIGHT"
-        self._log("DEBUG", f"[{control_name}] type_keys: '{keys}'")
+        self._log("DEBUG", "[%s] type_keys: '%s'", control_name, keys)
 
         try:
-            control.type_keys(keys, **kwargs)
+            self.key_input.send(control, keys, **kwargs)
         except Exception as e:
             # ElementNotVisible 예외를 명확한 메시지로 변환
             if "ElementNotVisible" in str(type(e).__name__):
@@ -74,7 +107,41 @@ class InputHandler:
             **kwargs: type_keys에 전달할 추가 인자
         """
         self.type_keys(control, keys, **kwargs)
-        time.sleep(sleep_after * self.global_delay)
+        self.wait_for_idle(control, sleep_after)
+
+    def focus(self, control, settle: float = 0.0):
+        """
+        컨트롤에 포커스 (여러 창 실행 중이면 전경 창을 독점한 동안만)
+
+        메시지 입력 방식이면 창을 앞으로 가져오지 않습니다 (메시지는 핸들로 바로 가고,
+        type_keys로 보내는 키는 type_keys가 직접 포커스함).
+
+        Args:
+            control: 포커스할 컨트롤
+            settle: 포커스 후 대기 시간 (global_delay 적용, 독점 구간 밖에서 대기)
+        """
+        if not self.key_input.background:
+            with self.backend.exclusive(control):
+                control.set_focus()
+        if settle:
+            time.sleep(settle * self.global_delay)
+
+    def wait_for_idle(self, control, sleep_after: float = 0.1):
+        """
+        입력 처리 대기
+
+        sleep 모드는 고정 시간 대기, sync 모드는 동기화 배리어로
+        입력 처리가 확인되는 즉시 반환합니다 (고정 시간은 상한).
+
+        Args:
+            control: 입력을 보낸 컨트롤
+            sleep_after: 대기 시간 (global_delay 적용)
+        """
+        max_wait = sleep_after * self.global_delay
+        if self.wait_mode == WAIT_MODE_SYNC:
+            self.sync_barrier.wait(control, max_wait)
+        else:
+            time.sleep(max_wait)
 
     def paste_text(self, control, text: str, sleep_after: float = 0.15):
         """
@@ -85,25 +152,96 @@ class InputHandler:
             text: 입력할 텍스트
             sleep_after: 붙여넣기 후 대기 시간 (global_delay 적용)
         """
-        # 클립보드에 텍스트 복사
-        pyperclip.copy(text)
-        # Ctrl+V로 붙여넣기
-        self.type_keys_with_delay(control, "^v", sleep_after=sleep_after, pause=0.05)
+        # 클립보드는 모든 창이 함께 쓰므로 ERP가 붙여넣기를 처리할 때까지 독점
+        with self.backend.exclusive(control):
+            # 클립보드에 텍스트 복사
+            self.backend.set_clipboard(text)
+            # Ctrl+V로 붙여넣기
+            self.type_keys_with_delay(control, "^v", sleep_after=sleep_after, pause=0.05)
 
-    def copy_from_control(self, control=None):
+    def copy_from_control(self, control=None) -> str:
         """
         현재 선택된 셀에서 텍스트 복사 (Ctrl+C)
 
+        고정 시간 대기 없이 클립보드 변경 번호가 바뀌는 즉시 읽습니다.
+
         Args:
             control: 복사할 컨트롤 (기본: left_spread)
 
         Returns:
             복사된 텍스트
+
+        Raises:
+            ClipboardTimeout: 제한 시간 안에 복사되지 않은 경우 (빈 셀 포함)
         """
         if control is None:
             control = self.left_spread
-        self.type_keys_with_delay(control, "^c", pause=0.05)
-        return pyperclip.paste().strip()
+        with self.backend.exclusive(control):
+            text = self.clipboard_reader.read_after(lambda: self.type_keys(control, "^c", pause=0.05))
+        return text.strip()
+
+    def copy_cell(self, control, select_keys: str = "+{LEFT}", restore_keys: str = "{RIGHT}",
+                  single_first: bool = True) -> str:
+        """
+        현재 셀 복사 (빈 셀과 복사 실패를 구분)
+
+        ERP는 빈 셀을 복사하면 클립보드를 바꾸지 않아, 셀 하나만 복사해서는 빈 셀과
+        복사가 반영되지 않은 경우가 똑같이 타임아웃으로 보입니다. 먼저 셀 하나를 복사하고,
+        타임아웃이면 select_keys로 값이 있는 이웃 셀(왼쪽 또는 위)까지 선택해 다시 복사합니다.
+        두 칸 복사는 현재 셀이 비어 있어도 클립보드를 바꾸므로, 이때 현재 셀 자리가 비어 있어야
+        빈 셀로 확정합니다. 빈 셀이 흔한 곳에서는 single_first=False로 바로 두 칸 복사해
+        타임아웃 대기를 건너뜁니다.
+
+        Args:
+            control: 복사할 컨트롤
+            select_keys: 이웃 셀까지 선택하는 키 (선택 영역의 마지막 칸이 현재 셀이 되는 방향)
+            restore_keys: 선택을 풀고 원래 셀로 돌아오는 키
+            single_first: True면 셀 하나를 먼저 복사 (값이 있는 셀이 대부분일 때)
+
+        Returns:
+            셀 값 (빈 셀이면 빈 문자열)
+
+        Raises:
+            ClipboardTimeout: 두 칸 복사도 반영되지 않은 경우 (값을 알 수 없음)
+        """
+        if single_first:
+            try:
+                return self.copy_from_control(control)
+            except ClipboardTimeout:
+                pass
+
+        with self.backend.exclusive(control):
+            self.type_keys(control, select_keys, pause=0.05)
+            try:
+                text = self.clipboard_reader.read_after(lambda: self.type_keys(control, "^c", pause=0.05))
+            finally:
+                self.type_keys_with_delay(control, restore_keys, pause=0.05)
+
+        cells = [cell for line in text.rstrip('\r\n').split('\r\n') for cell in line.split('\t')]
+        # 현재 셀 행이 없으면(마지막 행 아래) 이웃 셀만 복사됨
+        return cells[-1].strip() if len(cells) >= 2 else ""
+
+    def copy_block(self, control, select_keys: str = "+^{END}") -> str:
+        """
+        현재 셀부터 선택 영역을 넓혀 한 번에 복사 (TSV)
+
+        복사가 안 되면(클립보드 변경 없음) 이전 값 대신 빈 문자열을 반환합니다.
+        복사 후 선택은 그대로 남으므로 호출한 쪽에서 커서를 다시 옮겨야 합니다.
+
+        Args:
+            control: 복사할 컨트롤
+            select_keys: 선택 영역 확장 키 (기본: Shift+Ctrl+End)
+
+        Returns:
+            복사된 TSV 텍스트 (줄 끝 공백만 제거)
+        """
+        with self.backend.exclusive(control):
+            self.type_keys_with_delay(control, select_keys, pause=0.05)
+            try:
+                text = self.clipboard_reader.read_after(lambda: self.type_keys(control, "^c", pause=0.05))
+            except ClipboardTimeout:
+                return ''
+        return text.rstrip('\r\n')
 
     def convert_nationality(self, nationality: str) -> str:
         """
@@ -115,18 +253,12 @@ class InputHandler:
         Returns:
             변환된 코드 (1=내국인, 2=외국인)
         """
-        val = nationality.strip().upper()
-
-        # 내국인: N, 내, 1
-        if val in ['N', '내', '내국인', '1']:
-            return '1'
-        # 외국인: Y, 외, 2
-        elif val in ['Y', '외', '외국인', '2']:
-            return '2'
-        else:
+        code = normalize_nationality(nationality)
+        if code is None:
             # 기본값: 내국인
             self._log("WARNING", f"알 수 없는 내/외국인 값: '{nationality}' → 내국인(1)로 처리")
             return '1'
+        return code
 
     def clean_id_number(self, id_number: str) -> Tuple[str, str]:
         """
@@ -140,33 +272,14 @@ class InputHandler:
             - 타입_코드: '1'=주민등록번호, '2'=외국인등록번호, '3'=여권번호
             - 정제된_번호: 정제된 번호 문자열
         """
-        import re
-
-        # 1. 여권번호 판별 (알파벳 포함)
-        if re.search(r'[A-Za-z]', id_number):
-            # 여권번호: 공백, 하이픈 제거, 대문자 변환
-            cleaned = re.sub(r'[\s\-]', '', id_number).upper()
-            self._log("DEBUG", f"여권번호(3) 감지: {id_number} → {cleaned}")
-            return ('3', cleaned)
-
-        # 2. 주민등록번호 또는 외국인등록번호 (13자리 숫자)
-        # 하이픈 제거
-        cleaned = id_number.replace("-", "").strip()
-
-        # 숫자만 추출
-        cleaned = re.sub(r'[^0-9]', '', cleaned)
-
-        # 13자리 검증
-        if len(cleaned) == 13:
-            # 7번째 자리로 내외국인 구분
-            gender_code = cleaned[6]
-            if gender_code in ['5', '6', '7', '8']:
-                self._log("DEBUG", f"외국인등록번호(2) 감지: {id_number} → {cleaned}")
-                return ('2', cleaned)
-            else:
-                self._log("DEBUG", f"주민등록번호(1): {id_number} → {cleaned}")
-                return ('1', cleaned)
-        else:
+        id_type, cleaned = normalize_id_number(id_number)
+        if id_type == ID_TYPE_PASSPORT:
+            self._log("DEBUG", "여권번호(3) 감지: %s → %s", id_number, cleaned)
+        elif len(cleaned) != 13:
+            # 길이가 맞지 않아도 주민등록번호로 처리
             self._log("WARNING", f"비정상 번호 길이 ({len(cleaned)}자리): {id_number}")
-            # 기본값: 주민등록번호로 처리
-            return ('1', cleaned)
+        elif id_type == ID_TYPE_FOREIGNER:
+            self._log("DEBUG", "외국인등록번호(2) 감지: %s → %s", id_number, cleaned)
+        else:
+            self._log("DEBUG", "주민등록번호(1): %s → %s", id_number, cleaned)
+        return (id_type, cleaned)
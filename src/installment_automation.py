@@ -9,67 +9,55 @@ import time
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List
-import win32process
-import win32gui
-import xlrd
-from pywinauto import Application
-from pywinauto.keyboard import send_keys
-
+from typing import Dict, List, NamedTuple, Optional, Tuple
+from src.clipboard_reader import ClipboardReader, ClipboardTimeout
+from src.erp_backend import default_backend
+from src.installment_grid import (
+    CHECKBOX_COLUMN_OFFSET, GRID_COLUMN_INDEX, INSTALLMENT_THRESHOLD,
+    compare_row, is_installment, parse_grid, paste_columns, paste_row
+)
+from src.key_input import KEY_INPUT_TYPE_KEYS, create_key_input
+from src.key_script import InstallmentScriptCompiler
 from src.hotkey_manager import HotkeyManager
+from src.log_service import LogService
+from src.progress_journal import ProgressJournal, STATUS_DONE, STATUS_ERROR
+from src.value_digest import values_digest
+from src.yearend_loader import load_yearend_data
 
+# 분납적용 입력 방식
+INSTALLMENT_INPUT_KEYS = "keys"        # 금액마다 입력 + ENTER 후 고정 대기 (기존 방식)
+INSTALLMENT_INPUT_STREAM = "stream"    # 사원 1명의 행 전체를 키 스트림 1개로 전송, 커서 이동으로 완료 확인
+INSTALLMENT_INPUT_PASTE = "paste"      # 사원 1명의 금액을 TSV 한 줄로 붙여넣기 후 {DOWN}
+INSTALLMENT_INPUT_COLUMNS = "columns"  # 금액 열마다 전체 사원을 한 번에 붙여넣기
+INSTALLMENT_INPUT_MODES = (INSTALLMENT_INPUT_KEYS, INSTALLMENT_INPUT_STREAM, INSTALLMENT_INPUT_PASTE,
+                           INSTALLMENT_INPUT_COLUMNS)
 
-def load_yearend_data(excel_path):
-    """연말정산 엑셀 파일 읽기 (xlrd, euc-kr 인코딩)"""
-    print(f"\n[데이터 로드] {excel_path}")
-    wb = xlrd.open_workbook(excel_path, encoding_override='euc-kr')
-    ws = wb.sheet_by_index(0)
-    print(f"✓ 총 {ws.nrows}행 로드")
+# 열 붙여넣기 후 대기 시간 (초, global_delay 적용) = 기본 + 행 수 × 행당 (3차분납 자동 계산)
+COLUMN_PASTE_SETTLE = 0.3
+COLUMN_PASTE_ROW_SETTLE = 0.002
+
+# 체크 열 왕복({RIGHT n}/{LEFT n}) 같은 방향키 묶음의 키 사이 간격 (초)
+NAV_KEY_PAUSE = 0.01
+
+# 스트림 완료 확인(왼쪽 스프레드 사원코드 복사)의 클립보드 제한 시간 (초, global_delay 적용)
+CONFIRM_COPY_TIMEOUT = 1.0
+
+# 검증용 스프레드 전체 복사의 클립보드 제한 시간 (초, global_delay 적용)
+VERIFY_COPY_TIMEOUT = 5.0
 
-    def safe_int(value):
-        """셀 값을 int로 변환 (빈 값/문자열은 0)"""
-        if isinstance(value, float):
-            return int(value)
-        if isinstance(value, str) and value.strip():
-            try:
-                return int(float(value))
-            except ValueError:
-                return 0
-        return 0
-
-    data = []
-    for idx in range(2, ws.nrows):
-        사원코드 = str(ws.cell_value(idx, 0)).strip()
-        if not 사원코드:
-            continue
-
-        사원명 = str(ws.cell_value(idx, 1)).strip()
-        총액_소득세 = safe_int(ws.cell_value(idx, 2))
-        총액_지방소득세 = safe_int(ws.cell_value(idx, 3))
-        분납1_소득세 = safe_int(ws.cell_value(idx, 5))
-        분납1_지방소득세 = safe_int(ws.cell_value(idx, 6))
-        분납2_소득세 = safe_int(ws.cell_value(idx, 8))
-        분납2_지방소득세 = safe_int(ws.cell_value(idx, 9))
-
-        data.append({
-            "사원코드": 사원코드,
-            "사원명": 사원명,
-            "총액_소득세": 총액_소득세,
-            "총액_지방소득세": 총액_지방소득세,
-            "분납1_소득세": 분납1_소득세,
-            "분납1_지방소득세": 분납1_지방소득세,
-            "분납2_소득세": 분납2_소득세,
-            "분납2_지방소득세": 분납2_지방소득세,
-        })
-
-    print(f"✓ {len(data)}명 데이터 파싱 완료")
-    return data
+
+class SpreadRows(NamedTuple):
+    """열 붙여넣기 대상 (스프레드 행 순서)"""
+    first: int                      # 맨 위 대상 사원의 스프레드 행 (0부터)
+    rows: List[Optional[Dict]]      # first 행부터의 사원 데이터 (None은 Excel에 없는 사원 행)
 
 
 class InstallmentAutomation:
     """분납적용 자동화"""
 
-    def __init__(self, excel_path: str, verbose: bool = False, global_delay: float = 1.0):
+    def __init__(self, excel_path: str, verbose: bool = False, global_delay: float = 1.0, resume: bool = False,
+                 backend=None, data: List[Dict] = None, key_input: str = KEY_INPUT_TYPE_KEYS,
+                 input_mode: str = INSTALLMENT_INPUT_KEYS, key_pause: float = 0.05, with_checkbox: bool = False):
         """
         초기화 및 연결
 
@@ -77,9 +65,31 @@ class InstallmentAutomation:
             excel_path: Excel 파일 경로 (연말정산.xls)
             verbose: True면 DEBUG 로그 출력, False면 숨김 (기본값: False)
             global_delay: 전역 지연 시간 배율 (0.5~2.0, 기본값: 1.0)
+            resume: True면 진행 저널에 완료로 기록된 사원은 {DOWN}으로 건너뜀 (기본값: False)
+            backend: ERP 창/키 입력 백엔드 (None이면 Win32Backend, 벤치마크는 시뮬레이터)
+            data: 이미 읽은 사원 데이터 (None이면 excel_path에서 읽음)
+            key_input: 키 입력 방식 ("type_keys"=포커스 창에 send_keys, "message"=오른쪽 스프레드로 메시지 전송)
+            input_mode: 입력 방식 ("keys"=금액마다 입력 후 대기, "stream"=사원 1명을 키 스트림 1개로,
+                        "paste"=사원 1명을 TSV 한 줄로 붙여넣기, "columns"=금액 열마다 전체 사원 붙여넣기,
+                        기본값: "keys")
+            key_pause: stream 방식의 키 사이 간격 (초, 기본값: 0.05)
+            with_checkbox: True면 금액 입력과 같은 순회에서 단건(<= 기준 금액) 사원 체크박스도 선택
+                           (run_checkbox를 따로 실행할 필요 없음, 기본값: False)
         """
+        if input_mode not in INSTALLMENT_INPUT_MODES:
+            raise ValueError(f"알 수 없는 입력 방식: {input_mode} (가능: {', '.join(INSTALLMENT_INPUT_MODES)})")
+
         self.verbose = verbose
         self.global_delay = max(0.5, min(2.0, global_delay))
+        self.resume = resume
+        self.backend = backend if backend is not None else default_backend()
+        self.key_input = create_key_input(key_input, self.backend)
+        self.input_mode = input_mode
+        self.key_pause = key_pause
+        self.with_checkbox = with_checkbox
+        self.script_compiler = InstallmentScriptCompiler(with_checkbox=with_checkbox, nav_pause=NAV_KEY_PAUSE)
+        self.clipboard_reader = ClipboardReader(self.backend, timeout=CONFIRM_COPY_TIMEOUT * self.global_delay,
+                                                log_callback=self.log)
 
         print(f"초기화 중...")
 
@@ -88,22 +98,26 @@ class InstallmentAutomation:
         log_dir.mkdir(exist_ok=True)
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         self.log_file = log_dir / f"installment_{timestamp}.log"
+        self.log_service = LogService(self.log_file, verbose=self.verbose)
         print(f"  [OK] 로그 파일: {self.log_file}")
 
         # 핫키 관리자 초기화
-        self.hotkey_manager = HotkeyManager(log_callback=self.log)
+        self.hotkey_manager = HotkeyManager(log_callback=self.log, backend=self.backend)
         print(f"  [OK] 핫키 관리자 초기화 (Pause 키 리스너 등록)")
 
         # Excel 데이터 로드
-        self.data = load_yearend_data(excel_path)
+        self.data = data if data is not None else load_yearend_data(excel_path)
         print(f"  [OK] Excel 로드: {len(self.data)}명 사원")
 
+        # 진행 저널 (Excel 내용별, 분납 입력/체크박스 따로)
+        self.journal = ProgressJournal(excel_path, "분납적용", log_callback=self.log)
+        self.checkbox_journal = ProgressJournal(excel_path, "분납적용_체크", log_callback=self.log)
+        print(f"  [OK] 진행 저널: {self.journal.path}")
+
         # pywinauto 연결 - 급여자료입력 윈도우
         try:
-            self.app = Application(backend='win32')
-            self.app.connect(title="급여자료입력")
-            self.main_window = self.app.window(title="급여자료입력")
-            _, self.process_id = win32process.GetWindowThreadProcessId(self.main_window.handle)
+            self.app, self.main_window = self.backend.connect("급여자료입력")
+            self.process_id = self.backend.process_id(self.main_window)
             print(f"  [OK] 급여자료입력 프로그램 연결 (PID: {self.process_id})")
         except Exception as e:
             error_msg = "❌ 급여자료입력 창을 찾을 수 없습니다!\n\n"
@@ -115,29 +129,19 @@ class InstallmentAutomation:
         # 분납적용 다이얼로그 찾기
         self.dialog = None
         self.dialog_hwnd = None
+        self.left_spread = None
         self.right_spread = None
 
-    def log(self, level: str, message: str):
+    def log(self, level: str, message: str, *args):
         """
-        로그 기록
+        로그 기록 (콘솔/파일 출력은 LogService 기록 스레드가 처리)
 
         Args:
             level: 로그 레벨 (INFO, SUCCESS, WARNING, ERROR, DEBUG)
-            message: 메시지
+            message: 메시지 (args가 있으면 % 포맷 문자열, 포맷팅은 기록 스레드에서)
+            *args: 포맷 인자
         """
-        # DEBUG 로그는 verbose 모드일 때만 출력
-        if level == "DEBUG" and not self.verbose:
-            return
-
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        log_line = f"[{timestamp}] {level}: {message}"
-
-        # 콘솔 출력
-        print(log_line)
-
-        # 파일 기록
-        with open(self.log_file, 'a', encoding='utf-8') as f:
-            f.write(log_line + '\n')
+        self.log_service.log(level, message, *args)
 
     def check_stop_key(self) -> bool:
         """
@@ -154,27 +158,15 @@ class InstallmentAutomation:
 
     def cleanup(self):
         """리소스 정리"""
+        self.journal.close()
+        self.checkbox_journal.close()
         self.hotkey_manager.cleanup()
+        self.log_service.close()
 
     def find_installment_dialog(self):
         """분납적용 다이얼로그 찾기"""
-        found_dialogs = []
-
-        def enum_callback(hwnd, results):
-            if win32gui.IsWindowVisible(hwnd):
-                _, pid = win32process.GetWindowThreadProcessId(hwnd)
-                if pid == self.process_id:
-                    class_name = win32gui.GetClassName(hwnd)
-                    if class_name == "#32770":
-                        title = win32gui.GetWindowText(hwnd)
-                        results.append((hwnd, title))
-            return True
-
-        win32gui.EnumWindows(enum_callback, found_dialogs)
-
-        for hwnd, title in found_dialogs:
+        for hwnd, title, dialog in self.backend.process_dialogs(self.app, self.process_id):
             if not title:
-                dialog = self.app.window(handle=hwnd)
                 for child in dialog.children():
                     try:
                         text = child.window_text()
@@ -205,19 +197,51 @@ class InstallmentAutomation:
 
         # 왼쪽부터 정렬
         spreads.sort(key=lambda s: s.rectangle().left)
+        self.left_spread = spreads[0]   # 왼쪽 스프레드 (사원코드/사원명)
         self.right_spread = spreads[1]  # 오른쪽 스프레드 (입력 필드)
         return True
 
+    def _send(self, keys: str, pause: float = 0.05):
+        """오른쪽 스프레드에 키 입력 (여러 창 실행 중이면 전경 창을 독점한 동안만)"""
+        if self.key_input.background:
+            # 스프레드 핸들로 메시지 전송 (포커스/전경 창과 무관)
+            self.key_input.send(self.right_spread, keys, pause=pause)
+            return
+        with self.backend.exclusive(self.right_spread):
+            self.backend.send_keys(keys, pause=pause)
+
+    def _result_name(self, row: Dict) -> str:
+        """처리 결과 이름 ("installment"=분납 입력, "checkbox"=단건+체크, "skip"=단건)"""
+        if is_installment(row):
+            return "installment"
+        return "checkbox" if self.with_checkbox else "skip"
+
     def _type_and_enter(self, value: str):
         """값 입력 후 ENTER"""
-        send_keys(value)
+        self._send(value)
         time.sleep(0.3 * self.global_delay)
-        send_keys("{ENTER}")
+        self._send("{ENTER}")
         time.sleep(0.3 * self.global_delay)
 
+    def _skip_journaled(self, journal: ProgressJournal, row: Dict, dry_run: bool) -> bool:
+        """
+        저널에 완료로 기록된 사원이면 {DOWN}으로 같은 열의 다음 사원으로 이동
+
+        Returns:
+            True면 건너뜀
+        """
+        if not self.resume or not journal.is_done(row['사원코드'], values_digest(row.values())):
+            return False
+
+        self.log("INFO", f"  → 이미 완료 (저널), 건너뜀")
+        if not dry_run:
+            self._send("{DOWN}")
+            time.sleep(0.15 * self.global_delay)
+        return True
+
     def _skip_enter(self):
         """ENTER로 셀 스킵 (농특세 등)"""
-        send_keys("{ENTER}")
+        self._send("{ENTER}")
         time.sleep(0.15 * self.global_delay)
 
     def process_one_employee(self, row: Dict) -> str:
@@ -233,7 +257,7 @@ class InstallmentAutomation:
         try:
             총액_소득세 = row['총액_소득세']
 
-            if 총액_소득세 > 100000:
+            if 총액_소득세 > INSTALLMENT_THRESHOLD:
                 # Case 1: 분납 대상 (총액 소득세 > 100,000)
                 # 총액 소득세 → ENTER
                 self._type_and_enter(str(row['총액_소득세']))
@@ -260,14 +284,23 @@ class InstallmentAutomation:
                 self._type_and_enter(str(row['총액_소득세']))
                 # 총액 지방소득세 → ENTER
                 self._type_and_enter(str(row['총액_지방소득세']))
+                if self.with_checkbox:
+                    # 농특세 셀 → RIGHT로 체크 셀까지 → SPACE 체크
+                    to_check = CHECKBOX_COLUMN_OFFSET - GRID_COLUMN_INDEX['총액_농특세']
+                    self._send(f"{{RIGHT {to_check}}}{{SPACE}}", pause=NAV_KEY_PAUSE)
+                    time.sleep(0.15 * self.global_delay)
+                    # DOWN → 다음 사원, LEFT → 총액 소득세 셀로 이동
+                    self._send(f"{{DOWN}}{{LEFT {CHECKBOX_COLUMN_OFFSET}}}", pause=NAV_KEY_PAUSE)
+                    time.sleep(0.15 * self.global_delay)
+                    return "checkbox"
                 # DOWN → 다음 사원 (농특세 셀에서)
-                send_keys("{DOWN}")
+                self._send("{DOWN}")
                 time.sleep(0.15 * self.global_delay)
                 # LEFT → 지방소득세
-                send_keys("{LEFT}")
+                self._send("{LEFT}")
                 time.sleep(0.15 * self.global_delay)
                 # LEFT → 소득세 셀로 이동
-                send_keys("{LEFT}")
+                self._send("{LEFT}")
                 time.sleep(0.15 * self.global_delay)
                 return "skip"
 
@@ -275,6 +308,348 @@ class InstallmentAutomation:
             self.log("ERROR", f"입력 실패: {e}")
             return None
 
+    def process_one_employee_stream(self, row: Dict, next_row: Dict = None) -> str:
+        """
+        한 명의 사원 데이터를 키 스트림 1개로 입력
+
+        금액마다 고정 대기하지 않고 행 전체(총액/1차/2차 + 농특세 ENTER)를 한 번에 보낸 뒤,
+        커서가 다음 사원 행으로 넘어갔는지 왼쪽 스프레드의 사원코드를 복사해 확인합니다.
+        (클립보드가 바뀌는 즉시 진행)
+
+        Args:
+            row: 사원 데이터 딕셔너리
+            next_row: 스프레드 다음 행의 사원 데이터 (None이면 확인 생략, 마지막 사원)
+
+        Returns:
+            "installment", "checkbox" 또는 "skip" (process_one_employee와 같음), 입력/확인 실패 시 None
+        """
+        script = self.script_compiler.compile(row)
+        self.log("DEBUG", "  키 스트림: %s", script.render())
+        try:
+            # 체크 열 왕복 방향키만 간격을 짧게 (나머지는 key_pause)
+            for keys, pause in script.segments(self.key_pause):
+                self._send(keys, pause=pause)
+            if next_row is not None and not self._confirm_next_row(next_row):
+                return None
+        except Exception as e:
+            self.log("ERROR", f"입력 실패: {e}")
+            return None
+        return self._result_name(row)
+
+    def process_one_employee_paste(self, row: Dict) -> str:
+        """
+        한 명의 사원 데이터를 TSV 한 줄로 붙여넣기
+
+        총액 소득세 셀에서 총액/1차/2차 금액을 한 번에 붙여넣고(농특세 칸은 빈 값,
+        단건 사원은 총액 두 칸만) {DOWN}으로 다음 사원 총액 소득세 셀로 이동합니다.
+        붙여넣기는 커서를 옮기지 않으므로 열 위치는 그대로입니다.
+        with_checkbox면 단건 사원은 {RIGHT n}으로 체크 셀까지 가서 체크하고 돌아옵니다.
+
+        Args:
+            row: 사원 데이터 딕셔너리
+
+        Returns:
+            "installment", "checkbox" 또는 "skip" (process_one_employee와 같음), 실패 시 None
+        """
+        text = paste_row(row)
+        self.log("DEBUG", "  붙여넣기: %r", text)
+        try:
+            # 클립보드는 모든 창이 함께 쓰므로 ERP가 붙여넣기를 처리할 때까지 독점
+            with self.backend.exclusive(self.right_spread):
+                self.backend.set_clipboard(text)
+                self._send("^v")
+                time.sleep(0.15 * self.global_delay)
+            if self.with_checkbox and not is_installment(row):
+                self._send(f"{{RIGHT {CHECKBOX_COLUMN_OFFSET}}}{{SPACE}}{{DOWN}}{{LEFT {CHECKBOX_COLUMN_OFFSET}}}",
+                           pause=NAV_KEY_PAUSE)
+            else:
+                self._send("{DOWN}")
+        except Exception as e:
+            self.log("ERROR", f"입력 실패: {e}")
+            return None
+        return self._result_name(row)
+
+    def spread_rows(self, rows: List[Dict]) -> Optional[SpreadRows]:
+        """
+        열 붙여넣기용으로 사원 데이터를 스프레드 행 순서로 배치
+
+        왼쪽 스프레드의 사원코드 열을 한 번 복사해(검증과 같은 방식) 대상 사원이 있는
+        가장 위 행부터 가장 아래 행까지를 스프레드 행 순서로 놓습니다.
+        그 사이의 Excel에 없는 사원 행은 None(빈 셀)입니다.
+
+        Args:
+            rows: 대상 사원 데이터 (Excel 순서)
+
+        Returns:
+            SpreadRows, 사원코드를 읽지 못했거나 대상 사원이 스프레드에 없거나 중복되면 None
+        """
+        if not rows:
+            return SpreadRows(0, [])
+
+        codes = [cells[0].strip() if cells else '' for cells in self._copy_grid(self.left_spread)]
+        # Ctrl+C/Ctrl+Home은 type_keys로 왼쪽 스프레드에 가므로 붙여넣기 전에 포커스 복귀
+        self.right_spread.set_focus()
+        if not codes:
+            self.log("ERROR", "❌ 왼쪽 스프레드 사원코드를 복사하지 못했습니다")
+            return None
+
+        positions: Dict[str, int] = {}
+        for idx, code in enumerate(codes):
+            if code and positions.setdefault(code, idx) != idx:
+                self.log("ERROR", f"❌ 왼쪽 스프레드에 사원코드 {code}가 두 번 이상 있습니다")
+                return None
+
+        by_code: Dict[str, Dict] = {}
+        for row in rows:
+            code = row['사원코드']
+            if code in by_code:
+                self.log("ERROR", f"❌ Excel에 사원코드 {code}가 두 번 이상 있습니다")
+                return None
+            if code not in positions:
+                self.log("ERROR", f"❌ 스프레드에 없는 사원: {row['사원명']} ({code})")
+                return None
+            by_code[code] = row
+
+        first = min(positions[code] for code in by_code)
+        last = max(positions[code] for code in by_code)
+        excel_codes = {row['사원코드'] for row in self.data}
+        spread_rows = []
+        for code in codes[first:last + 1]:
+            if code not in by_code and code in excel_codes:
+                # 빈 셀로 붙여넣으면 범위 밖 사원의 입력값이 지워짐
+                self.log("ERROR", f"❌ 입력 범위 사이에 범위 밖 사원({code})이 있습니다 (전체 범위로 실행하세요)")
+                return None
+            spread_rows.append(by_code.get(code))
+        return SpreadRows(first, spread_rows)
+
+    def _anchor_first_row(self, first: int):
+        """
+        오른쪽 스프레드 커서를 맨 위 대상 행의 총액 소득세 셀로
+
+        spread_rows가 왼쪽 스프레드를 Ctrl+Home으로 훑으면 두 스프레드의 행이 연동되어
+        오른쪽 커서도 움직일 수 있으므로, 이전 커서 위치에 기대지 않고 첫 셀에서 다시 셉니다.
+
+        Args:
+            first: 맨 위 대상 사원의 스프레드 행 (0부터)
+        """
+        self._send("^{HOME}")
+        if first:
+            self._send(f"{{DOWN {first}}}")
+
+    def paste_all_columns(self, rows: List[Optional[Dict]]) -> bool:
+        """
+        금액 열마다 모든 사원을 한 번에 붙여넣기
+
+        첫 행의 총액 소득세 셀에서 {RIGHT}로 열을 옮겨 가며 총액/1차/2차 소득세·지방소득세
+        열을 각각 한 번씩 붙여넣고, 끝나면 처음 셀로 돌아옵니다. 농특세 열은 건드리지 않습니다.
+        with_checkbox면 같은 순회에서 체크 열도 붙여넣습니다 (단건 사원만 "1", 분납 대상은 빈 값).
+
+        Args:
+            rows: 스프레드 행 순서의 사원 데이터 (spread_rows, 첫 행의 총액 소득세 셀이 현재 셀, None은 빈 행)
+
+        Returns:
+            True면 모든 열 붙여넣기 완료, False면 중지 요청/실패
+        """
+        current = 0
+        try:
+            for col, text in paste_columns(rows, self.with_checkbox):
+                if self.check_stop_key():
+                    self.log("WARNING", "중지 요청으로 처리 중단")
+                    return False
+                if col > current:
+                    self._send(f"{{RIGHT {col - current}}}")
+                    current = col
+                self.log("INFO", f"  {col}열 붙여넣기 ({len(rows)}행)")
+                with self.backend.exclusive(self.right_spread):
+                    self.backend.set_clipboard(text)
+                    self._send("^v")
+                    time.sleep((COLUMN_PASTE_SETTLE + COLUMN_PASTE_ROW_SETTLE * len(rows)) * self.global_delay)
+            if current:
+                self._send(f"{{LEFT {current}}}")
+        except Exception as e:
+            self.log("ERROR", f"입력 실패: {e}")
+            return False
+        return True
+
+    def _record_done(self, row: Dict, result: str):
+        """입력 완료 저널 기록 (함께 체크했으면 체크박스 저널에도 기록해 run_checkbox 이어서 실행 시 건너뜀)"""
+        digest = values_digest(row.values())
+        self.journal.record(row['사원코드'], STATUS_DONE, digest, result=result)
+        if result == "checkbox":
+            self.checkbox_journal.record(row['사원코드'], STATUS_DONE, digest)
+
+    def _record_pasted(self, layout: SpreadRows) -> Tuple[int, int]:
+        """
+        열 붙여넣기 결과를 오른쪽 스프레드 한 번 복사로 확인해 저널 기록
+
+        금액(with_checkbox면 체크 열도)이 모두 맞는 사원만 완료로, 다른 사원은 오류로 기록합니다.
+        복사하지 못하면 확인할 수 없으므로 저널에 기록하지 않습니다.
+
+        Args:
+            layout: 붙여넣은 대상 (spread_rows)
+
+        Returns:
+            (성공 사원 수, 불일치 사원 수)
+        """
+        targets = [row for row in layout.rows if row is not None]
+        grid = self._copy_grid(self.right_spread)
+        if not grid:
+            self.log("WARNING", "⚠ 붙여넣기 결과를 복사하지 못해 확인 없이 끝냄 (저널 기록 안 함)")
+            return len(targets), 0
+
+        ok = failed = 0
+        for index, row in enumerate(layout.rows, layout.first):
+            if row is None:
+                continue
+            diffs = compare_row(row, grid[index] if index < len(grid) else [], self.with_checkbox)
+            if diffs:
+                failed += 1
+                self.journal.record(row['사원코드'], STATUS_ERROR, values_digest(row.values()))
+                column, expected, actual = diffs[0]
+                self.log("ERROR", f"  [X] {row['사원명']} ({row['사원코드']}) {column}: "
+                                  f"기대 {expected:,} / 실제 {actual:,}")
+            else:
+                ok += 1
+                self._record_done(row, self._result_name(row))
+        return ok, failed
+
+    def _confirm_next_row(self, next_row: Dict) -> bool:
+        """
+        커서가 다음 사원 행에 있는지 확인 (왼쪽 스프레드 현재 행의 사원코드가 다음 사원인지)
+
+        금액은 사원끼리 같을 수 있어(0 포함) 행을 구분하지 못하므로, 오른쪽 스프레드의
+        현재 행을 따라가는 왼쪽 스프레드의 사원코드 셀을 복사해 비교합니다.
+        복사가 반영되지 않으면 확인 실패입니다.
+
+        Args:
+            next_row: 스프레드 다음 행의 사원 데이터
+
+        Returns:
+            True면 확인됨 (포커스는 오른쪽 스프레드로 돌아와 있음)
+        """
+        try:
+            with self.backend.exclusive(self.left_spread):
+                try:
+                    text = self.clipboard_reader.read_after(
+                        lambda: self.key_input.send(self.left_spread, "^c", pause=0.05))
+                finally:
+                    # Ctrl+C는 type_keys로 왼쪽 스프레드에 가므로 이어지는 입력을 위해 포커스 복귀
+                    self.right_spread.set_focus()
+        except ClipboardTimeout:
+            self.log("ERROR", "  커서 확인 실패: 왼쪽 사원코드가 복사되지 않음")
+            return False
+
+        code = text.strip()
+        if code != next_row['사원코드']:
+            self.log("ERROR", f"  커서 확인 실패: 현재 행 사원코드 '{code}' (기대값 {next_row['사원코드']})")
+            return False
+        return True
+
+    def _copy_grid(self, spread) -> List[List[str]]:
+        """
+        스프레드 전체를 한 번에 복사해 행 리스트로 (Ctrl+Home → Shift+Ctrl+End → Ctrl+C)
+
+        Args:
+            spread: 복사할 스프레드 (왼쪽/오른쪽)
+
+        Returns:
+            [[셀, ...], ...] (복사되지 않으면 빈 리스트)
+        """
+        with self.backend.exclusive(spread):
+            self.key_input.send(spread, "^{HOME}+^{END}", pause=0.05)
+            try:
+                text = self.clipboard_reader.read_after(
+                    lambda: self.key_input.send(spread, "^c", pause=0.05),
+                    timeout=VERIFY_COPY_TIMEOUT * self.global_delay
+                )
+            except ClipboardTimeout:
+                return []
+            # 선택 해제 (커서를 첫 셀로)
+            self.key_input.send(spread, "^{HOME}", pause=0.05)
+        return parse_grid(text)
+
+    def verify(self, start_index: int = 0, count: int = None) -> Dict:
+        """
+        입력 결과 검증 (오른쪽 스프레드 전체를 한 번 복사해 Excel 데이터와 비교)
+
+        왼쪽 스프레드의 사원코드로 행을 Excel 사원과 맞추고(복사 실패 시 행 순서로),
+        금액 열(총액/1차/2차 소득세·지방소득세)이 다른 셀을 모두 보고합니다.
+        단건 사원의 1차/2차 칸은 비어 있어야(0) 일치입니다.
+
+        Args:
+            start_index: 검증할 첫 사원 인덱스 (기본값: 0)
+            count: 검증할 사원 수 (None이면 전체)
+
+        Returns:
+            결과 요약 딕셔너리 (checked, mismatch_rows, mismatches=[{사원코드, 사원명, 열, 기대값, 실제값}])
+        """
+        start_time = time.time()
+
+        if count is None:
+            count = len(self.data) - start_index
+        targets = self.data[start_index:start_index + count]
+
+        self.log("INFO", "=== 분납적용 입력 검증 시작 ===")
+        self.log("INFO", f"검증 범위: {start_index + 1}번째 ~ {start_index + count}번째 사원 (총 {count}명)")
+
+        if not self.find_installment_dialog() or not self.find_right_spread():
+            self.log("ERROR", "❌ 분납적용 다이얼로그/스프레드를 찾을 수 없습니다!")
+            self.log_service.flush()
+            return {'status': 'error', 'reason': 'dialog_not_found', 'checked': 0, 'mismatch_rows': 0,
+                    'mismatches': []}
+
+        grid = self._copy_grid(self.right_spread)
+        if not grid:
+            self.log("ERROR", "❌ 오른쪽 스프레드를 복사하지 못했습니다")
+            self.log_service.flush()
+            return {'status': 'error', 'reason': 'copy_failed', 'checked': 0, 'mismatch_rows': 0,
+                    'mismatches': []}
+        codes = [cells[0].strip() if cells else '' for cells in self._copy_grid(self.left_spread)]
+        if len(codes) != len(grid):
+            self.log("WARNING", f"⚠ 왼쪽 스프레드 사원코드 {len(codes)}행 / 오른쪽 {len(grid)}행 → 행 순서로 비교")
+            codes = [row['사원코드'] for row in self.data[:len(grid)]]
+        self.log("INFO", f"✓ 스프레드 {len(grid)}행 복사")
+
+        # 사원코드 → 스프레드 행
+        grid_by_code = {code: cells for code, cells in zip(codes, grid)}
+
+        mismatches = []
+        mismatch_rows = 0
+        for row in targets:
+            cells = grid_by_code.get(row['사원코드'])
+            if cells is None:
+                mismatch_rows += 1
+                mismatches.append({'사원코드': row['사원코드'], '사원명': row['사원명'],
+                                   '열': '사원코드', '기대값': row['사원코드'], '실제값': None})
+                self.log("ERROR", f"  {row['사원명']} ({row['사원코드']}): 스프레드에 사원 없음")
+                continue
+
+            diffs = compare_row(row, cells)
+            if diffs:
+                mismatch_rows += 1
+            for column, expected, actual in diffs:
+                mismatches.append({'사원코드': row['사원코드'], '사원명': row['사원명'],
+                                   '열': column, '기대값': expected, '실제값': actual})
+                self.log("ERROR", f"  {row['사원명']} ({row['사원코드']}) {column}: 기대 {expected:,} / 실제 {actual:,}")
+
+        elapsed = time.time() - start_time
+        self.log("INFO", "=== 검증 완료 ===")
+        self.log("INFO", f"검증: {len(targets)}명")
+        if mismatches:
+            self.log("ERROR", f"불일치: {mismatch_rows}명, {len(mismatches)}셀")
+        else:
+            self.log("SUCCESS", "✓ 모든 금액 일치")
+        self.log("INFO", f"소요 시간: {elapsed:.1f}초")
+
+        self.log_service.flush()
+        return {
+            'status': 'completed',
+            'checked': len(targets),
+            'mismatch_rows': mismatch_rows,
+            'mismatches': mismatches,
+            'elapsed': elapsed
+        }
+
     def run_checkbox(self, start_index: int = 0, count: int = None, dry_run: bool = False) -> Dict:
         """
         체크박스 체크 전용 실행 (<=100k 사원만 체크)
@@ -297,9 +672,11 @@ class InstallmentAutomation:
         process_data = self.data[start_index:start_index + count]
 
         self.log("INFO", "=== 체크박스 체크 시작 ===")
+        if self.resume:
+            self.checkbox_journal.log_resume()
         self.log("INFO", f"처리 범위: {start_index + 1}번째 ~ {start_index + count}번째 사원")
 
-        check_targets = [d for d in process_data if d['총액_소득세'] <= 100000]
+        check_targets = [d for d in process_data if not is_installment(d)]
         self.log("INFO", f"체크 대상: {len(check_targets)}명 (<=100k)")
 
         if dry_run:
@@ -309,6 +686,7 @@ class InstallmentAutomation:
         self.log("INFO", "분납적용 다이얼로그 찾기...")
         if not self.find_installment_dialog():
             self.log("ERROR", "❌ 분납적용 다이얼로그를 찾을 수 없습니다!")
+            self.log_service.flush()
             return {
                 'status': 'error',
                 'reason': 'dialog_not_found',
@@ -322,6 +700,7 @@ class InstallmentAutomation:
         self.log("INFO", "스프레드 컨트롤 찾기...")
         if not self.find_right_spread():
             self.log("ERROR", "❌ 스프레드를 찾을 수 없습니다!")
+            self.log_service.flush()
             return {
                 'status': 'error',
                 'reason': 'spread_not_found',
@@ -334,7 +713,8 @@ class InstallmentAutomation:
         # 오른쪽 스프레드에 포커스
         self.log("INFO", "오른쪽 스프레드에 포커스 설정...")
         try:
-            self.right_spread.set_focus()
+            with self.backend.exclusive(self.right_spread):
+                self.right_spread.set_focus()
             time.sleep(0.5 * self.global_delay)
             self.log("INFO", "✓ 포커스 설정 완료")
         except Exception as e:
@@ -351,33 +731,39 @@ class InstallmentAutomation:
                 self.log("WARNING", "중지 요청으로 처리 중단")
                 break
 
-            needs_check = row['총액_소득세'] <= 100000
+            needs_check = not is_installment(row)
 
             if needs_check:
                 self.log("INFO", f"[{idx + 1}/{len(process_data)}] {row['사원명']} - 체크")
+                if self._skip_journaled(self.checkbox_journal, row, dry_run):
+                    skip_count += 1
+                    continue
                 if not dry_run:
                     try:
                         # SPACE → 체크박스 체크
-                        send_keys("{SPACE}")
+                        self._send("{SPACE}")
                         time.sleep(0.15 * self.global_delay)
                         # DOWN → 다음 사원
-                        send_keys("{DOWN}")
+                        self._send("{DOWN}")
                         time.sleep(0.15 * self.global_delay)
                         success_count += 1
+                        self.checkbox_journal.record(row['사원코드'], STATUS_DONE, values_digest(row.values()))
                         self.log("SUCCESS", f"  [OK] 체크 완료")
                     except Exception as e:
                         fail_count += 1
+                        self.checkbox_journal.record(row['사원코드'], STATUS_ERROR, values_digest(row.values()))
                         self.log("ERROR", f"  [X] 체크 실패: {e}")
                 else:
                     self.log("INFO", f"  → DRY RUN")
                     skip_count += 1
             else:
-                self.log("DEBUG", f"[{idx + 1}/{len(process_data)}] {row['사원명']} - 스킵 (>100k)")
+                self.log("DEBUG", "[%s/%s] %s - 스킵 (>100k)", idx + 1, len(process_data), row['사원명'])
                 if not dry_run:
                     # DOWN → 다음 사원 (체크 안하고 넘기기)
-                    send_keys("{DOWN}")
+                    self._send("{DOWN}")
                     time.sleep(0.15 * self.global_delay)
 
+        self.checkbox_journal.close()
         elapsed = time.time() - start_time
 
         self.log("INFO", "=== 체크박스 체크 완료 ===")
@@ -385,6 +771,7 @@ class InstallmentAutomation:
         self.log("INFO", f"실패: {fail_count}명")
         self.log("INFO", f"소요 시간: {elapsed:.1f}초")
 
+        self.log_service.flush()
         return {
             'status': 'completed',
             'success': success_count,
@@ -413,8 +800,12 @@ class InstallmentAutomation:
         process_data = self.data[start_index:start_index + count]
 
         self.log("INFO", "=== 분납적용 자동화 시작 ===")
+        if self.resume:
+            self.journal.log_resume()
         self.log("INFO", f"처리 범위: {start_index + 1}번째 ~ {start_index + count}번째 사원")
         self.log("INFO", f"총 {count}명")
+        if self.with_checkbox:
+            self.log("INFO", f"단건(<={INSTALLMENT_THRESHOLD:,}) 사원은 체크박스도 함께 선택")
 
         if dry_run:
             self.log("INFO", "!!! DRY RUN 모드 - 실제 입력 안함 !!!")
@@ -423,6 +814,7 @@ class InstallmentAutomation:
         self.log("INFO", "분납적용 다이얼로그 찾기...")
         if not self.find_installment_dialog():
             self.log("ERROR", "❌ 분납적용 다이얼로그를 찾을 수 없습니다!")
+            self.log_service.flush()
             return {
                 'status': 'error',
                 'reason': 'dialog_not_found',
@@ -437,6 +829,7 @@ class InstallmentAutomation:
         self.log("INFO", "스프레드 컨트롤 찾기...")
         if not self.find_right_spread():
             self.log("ERROR", "❌ 스프레드를 찾을 수 없습니다!")
+            self.log_service.flush()
             return {
                 'status': 'error',
                 'reason': 'spread_not_found',
@@ -450,7 +843,8 @@ class InstallmentAutomation:
         # 오른쪽 스프레드에 포커스
         self.log("INFO", "오른쪽 스프레드에 포커스 설정...")
         try:
-            self.right_spread.set_focus()
+            with self.backend.exclusive(self.right_spread):
+                self.right_spread.set_focus()
             time.sleep(0.5 * self.global_delay)
             self.log("INFO", "✓ 포커스 설정 완료")
         except Exception as e:
@@ -464,44 +858,91 @@ class InstallmentAutomation:
         fail_count = 0
         skip_count = 0
 
-        for idx, row in enumerate(process_data):
-            # 중지 요청 체크
-            if self.check_stop_key():
-                self.log("WARNING", "중지 요청으로 처리 중단")
-                break
+        stopped = False
+        stop_reason = 'cursor_mismatch'
 
-            is_installment = row['총액_소득세'] > 100000
-            self.log("INFO", f"[{idx + 1}/{len(process_data)}] {row['사원명']} ({row['사원코드']})")
-            if is_installment:
-                self.log("INFO", f"  분납 입력 | 총액: {row['총액_소득세']:,}/{row['총액_지방소득세']:,}, 1차: {row['분납1_소득세']:,}/{row['분납1_지방소득세']:,}, 2차: {row['분납2_소득세']:,}/{row['분납2_지방소득세']:,}")
+        if self.input_mode == INSTALLMENT_INPUT_COLUMNS:
+            # 사원마다 행을 돌지 않고 열 단위로 한 번에 (같은 값을 다시 붙여넣어도 결과가 같으므로 저널로 건너뛰지 않음)
+            # 열은 Excel 순서가 아니라 왼쪽 스프레드의 사원코드 순서로 만들고, 붙여넣은 뒤 한 번 복사해 확인
+            layout = None if dry_run else self.spread_rows(process_data)
+            if dry_run:
+                self.log("INFO", f"  → DRY RUN (실제 입력 안함)")
+                skip_count = len(process_data)
+            elif layout is None:
+                self.log("ERROR", "스프레드 행 순서를 맞출 수 없어 처리 중단")
+                fail_count = len(process_data)
+                stopped = True
+                stop_reason = 'row_order_mismatch'
             else:
-                self.log("INFO", f"  단건 입력 | 총액: {row['총액_소득세']:,}/{row['총액_지방소득세']:,}")
+                self._anchor_first_row(layout.first)
+                if self.paste_all_columns(layout.rows):
+                    success_count, fail_count = self._record_pasted(layout)
+                    self.log("SUCCESS", f"  [OK] {success_count}명 열 붙여넣기")
+                else:
+                    fail_count = len(process_data)
+        else:
+            for idx, row in enumerate(process_data):
+                # 중지 요청 체크
+                if self.check_stop_key():
+                    self.log("WARNING", "중지 요청으로 처리 중단")
+                    break
+
+                self.log("INFO", f"[{idx + 1}/{len(process_data)}] {row['사원명']} ({row['사원코드']})")
+                if is_installment(row):
+                    self.log("INFO", f"  분납 입력 | 총액: {row['총액_소득세']:,}/{row['총액_지방소득세']:,}, 1차: {row['분납1_소득세']:,}/{row['분납1_지방소득세']:,}, 2차: {row['분납2_소득세']:,}/{row['분납2_지방소득세']:,}")
+                else:
+                    self.log("INFO", f"  단건 입력 | 총액: {row['총액_소득세']:,}/{row['총액_지방소득세']:,}")
+
+                if self._skip_journaled(self.journal, row, dry_run):
+                    skip_count += 1
+                    continue
 
-            if not dry_run:
-                result = self.process_one_employee(row)
-                if result:
-                    success_count += 1
-                    self.log("SUCCESS", f"  [OK] {result}")
+                if not dry_run:
+                    if self.input_mode == INSTALLMENT_INPUT_STREAM:
+                        # 다음 사원 행이 있어야 커서 이동을 확인할 수 있음
+                        next_index = start_index + idx + 1
+                        next_row = self.data[next_index] if next_index < len(self.data) else None
+                        result = self.process_one_employee_stream(row, next_row)
+                    elif self.input_mode == INSTALLMENT_INPUT_PASTE:
+                        result = self.process_one_employee_paste(row)
+                    else:
+                        result = self.process_one_employee(row)
+                    digest = values_digest(row.values())
+                    if result:
+                        success_count += 1
+                        self._record_done(row, result)
+                        self.log("SUCCESS", f"  [OK] {result}")
+                    else:
+                        fail_count += 1
+                        self.journal.record(row['사원코드'], STATUS_ERROR, digest)
+                        self.log("ERROR", f"  [X] 입력 실패")
+                        if self.input_mode == INSTALLMENT_INPUT_STREAM:
+                            # 커서 위치를 알 수 없으면 이후 사원이 다른 행에 입력되므로 중단
+                            self.log("ERROR", "커서가 다음 사원 행에 있지 않아 처리 중단")
+                            stopped = True
+                            break
                 else:
-                    fail_count += 1
-                    self.log("ERROR", f"  [X] 입력 실패")
-            else:
-                self.log("INFO", f"  → DRY RUN (실제 입력 안함)")
-                skip_count += 1
+                    self.log("INFO", f"  → DRY RUN (실제 입력 안함)")
+                    skip_count += 1
 
+        self.journal.close()
         elapsed = time.time() - start_time
 
         self.log("INFO", "=== 입력 완료 ===")
         self.log("INFO", f"성공: {success_count}명")
         self.log("INFO", f"실패: {fail_count}명")
-        if dry_run:
+        if dry_run or skip_count:
             self.log("INFO", f"건너뜀: {skip_count}명")
         self.log("INFO", f"소요 시간: {elapsed:.1f}초")
 
-        return {
-            'status': 'completed',
+        self.log_service.flush()
+        result = {
+            'status': 'error' if stopped else 'completed',
             'success': success_count,
             'fail': fail_count,
             'skip': skip_count,
             'elapsed': elapsed
         }
+        if stopped:
+            result['reason'] = stop_reason
+        return result
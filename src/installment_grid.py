@@ -0,0 +1,154 @@
+"""
+분납적용 그리드 모듈
+
+분납적용 다이얼로그 오른쪽 스프레드(fpUSpread80)의 열 구성과
+분납 대상 판정 기준을 한 곳에 모읍니다.
+"""
+
+import re
+from typing import Dict, List, Optional, Tuple
+
+# 총액 소득세가 이 금액을 넘으면 분납 대상 (이하이면 단건 입력 + 체크박스)
+INSTALLMENT_THRESHOLD = 100000
+
+# 오른쪽 스프레드 열 (0부터, 복사한 TSV 기준) → 엑셀 데이터 키 (None이면 입력하지 않는 열)
+INSTALLMENT_GRID_COLUMNS: List[tuple] = [
+    ("총액_소득세", "총액_소득세"),
+    ("총액_지방소득세", "총액_지방소득세"),
+    ("총액_농특세", None),
+    ("분납1_소득세", "분납1_소득세"),
+    ("분납1_지방소득세", "분납1_지방소득세"),
+    ("분납1_농특세", None),
+    ("분납2_소득세", "분납2_소득세"),
+    ("분납2_지방소득세", "분납2_지방소득세"),
+    ("분납2_농특세", None),
+    ("분납3_소득세", None),     # ERP가 자동 계산
+    ("체크", None),             # 단건(<= 기준 금액) 사원만 SPACE로 체크
+]
+GRID_COLUMN_INDEX: Dict[str, int] = {name: idx for idx, (name, _) in enumerate(INSTALLMENT_GRID_COLUMNS)}
+
+# 총액 소득세 셀에서 체크 셀까지 {RIGHT} 수 (체크 열은 ENTER로 가지 않으므로 방향키로 이동)
+CHECKBOX_COLUMN_OFFSET = GRID_COLUMN_INDEX["체크"] - GRID_COLUMN_INDEX["총액_소득세"]
+
+_NON_DIGIT = re.compile(r'[^0-9]')
+
+
+def is_installment(row: Dict) -> bool:
+    """분납 대상이면 True (총액 소득세 > INSTALLMENT_THRESHOLD)"""
+    return row['총액_소득세'] > INSTALLMENT_THRESHOLD
+
+
+def grid_values(row: Dict) -> List[str]:
+    """
+    사원 1명을 입력했을 때 오른쪽 스프레드 행의 금액 셀 값
+
+    Args:
+        row: load_yearend_data()의 사원 데이터
+
+    Returns:
+        INSTALLMENT_GRID_COLUMNS 순서의 문자열 리스트
+        (단건 사원은 총액만, 분납 대상은 총액/1차/2차 소득세·지방소득세, 나머지는 빈 값)
+    """
+    installment = is_installment(row)
+    return [str(row[key]) if key and (installment or name.startswith("총액")) else ""
+            for name, key in INSTALLMENT_GRID_COLUMNS]
+
+
+def paste_row(row: Dict) -> str:
+    """
+    사원 1명을 총액 소득세 셀부터 붙여넣을 TSV 한 줄
+
+    마지막 금액 셀까지만 만들므로 단건 사원은 두 칸(총액 소득세/지방소득세),
+    분납 대상은 2차 지방소득세까지 여덟 칸 (농특세 칸은 빈 값)입니다.
+
+    Args:
+        row: load_yearend_data()의 사원 데이터
+
+    Returns:
+        탭으로 구분한 문자열 (줄바꿈 없음)
+    """
+    values = grid_values(row)
+    last = max(idx for idx, value in enumerate(values) if value)
+    return '\t'.join(values[:last + 1])
+
+
+def checkbox_value(row: Optional[Dict]) -> str:
+    """체크 열 값 (단건 사원만 "1", 분납 대상/빈 행은 빈 값)"""
+    return "1" if row is not None and not is_installment(row) else ""
+
+
+def paste_columns(rows: List[Optional[Dict]], with_checkbox: bool = False) -> List[Tuple[int, str]]:
+    """
+    여러 사원의 금액을 열 단위 붙여넣기 텍스트로
+
+    Args:
+        rows: 스프레드 행 순서의 사원 데이터 리스트 (None은 입력하지 않는 행, 모든 칸 빈 값)
+        with_checkbox: True면 체크 열도 포함 (단건 사원만 "1")
+
+    Returns:
+        [(열 번호, 줄마다 한 사원인 텍스트), ...] (입력할 열만, 모든 행이 빈 열은 제외)
+        단건 사원 행의 1차/2차 칸은 빈 줄이므로 붙여넣어도 비어 있습니다.
+    """
+    blank = [""] * len(INSTALLMENT_GRID_COLUMNS)
+    values = [grid_values(row) if row is not None else blank for row in rows]
+    columns = []
+    for idx, (_, key) in enumerate(INSTALLMENT_GRID_COLUMNS):
+        cells = [row_values[idx] for row_values in values]
+        if key and any(cells):
+            columns.append((idx, '\r\n'.join(cells) + '\r\n'))
+    if with_checkbox:
+        cells = [checkbox_value(row) for row in rows]
+        if any(cells):
+            columns.append((GRID_COLUMN_INDEX["체크"], '\r\n'.join(cells) + '\r\n'))
+    return columns
+
+
+def parse_amount(text: str) -> int:
+    """스프레드에서 복사한 금액 문자열을 int로 ("1,234" → 1234, 빈 값은 0)"""
+    return int(_NON_DIGIT.sub('', text) or 0)
+
+
+def parse_grid(text: str) -> List[List[str]]:
+    """
+    스프레드에서 복사한 TSV를 행 리스트로
+
+    Args:
+        text: 클립보드 텍스트 (줄 구분 \r\n 또는 \n)
+
+    Returns:
+        [[셀, ...], ...] (빈 텍스트면 빈 리스트)
+    """
+    text = text.replace('\r\n', '\n').rstrip('\n')
+    if not text:
+        return []
+    return [line.split('\t') for line in text.split('\n')]
+
+
+def compare_row(row: Dict, cells: List[str], with_checkbox: bool = False) -> List[Tuple[str, int, int]]:
+    """
+    스프레드 행 하나를 사원 데이터와 비교 (금액 열만, with_checkbox면 체크 열도)
+
+    Args:
+        row: load_yearend_data()의 사원 데이터
+        cells: 같은 사원의 스프레드 행 (INSTALLMENT_GRID_COLUMNS 순서)
+        with_checkbox: True면 체크 열도 비교 (단건 사원 1, 분납 대상 0)
+
+    Returns:
+        [(열 이름, 기대값, 실제값), ...] 다른 셀만 (빈 셀은 0으로 비교)
+    """
+    expected = grid_values(row)
+    diffs = []
+    for idx, (name, key) in enumerate(INSTALLMENT_GRID_COLUMNS):
+        if not key:
+            continue
+        want = parse_amount(expected[idx])
+        got = parse_amount(cells[idx]) if idx < len(cells) else 0
+        if want != got:
+            diffs.append((name, want, got))
+    if with_checkbox:
+        idx = GRID_COLUMN_INDEX["체크"]
+        want = parse_amount(checkbox_value(row))
+        got = parse_amount(cells[idx]) if idx < len(cells) else 0
+        if want != got:
+            diffs.append(("체크", want, got))
+    return diffs
@@ -0,0 +1,134 @@
+"""
+키 입력 백엔드 모듈
+
+스프레드에 키를 보내는 방법을 고를 수 있게 합니다.
+- type_keys: pywinauto type_keys (기존 방식, 전경 창에만 입력됨)
+- message: 문자는 WM_CHAR, 이동 키는 WM_KEYDOWN/WM_KEYUP을 스프레드 핸들로 SendMessage
+  (EmployeeInput.input_to_cell과 같은 방식, 전경 창/마우스와 무관)
+
+fpUSpread80은 메시지로 보낸 Ctrl/Shift 조합(복사/붙여넣기/선택)과 F5 삭제 확인을
+처리하지 못하므로(archive/docs/11), message 방식도 그런 키는 type_keys로 보냅니다.
+"""
+
+import time
+from typing import List
+
+from src.key_syntax import KeyToken, VIRTUAL_KEYS, format_tokens, tokenize
+
+# 키 입력 방식
+KEY_INPUT_TYPE_KEYS = "type_keys"   # pywinauto type_keys (전경 창 필요)
+KEY_INPUT_MESSAGE = "message"       # 스프레드 핸들로 SendMessage (백그라운드 가능)
+KEY_INPUTS = (KEY_INPUT_TYPE_KEYS, KEY_INPUT_MESSAGE)
+
+# message 방식의 키 사이 간격 (초, SendMessage는 처리가 끝나야 돌아오므로 짧게)
+DEFAULT_MESSAGE_PAUSE = 0.015
+
+
+class TypeKeysInput:
+    """pywinauto type_keys로 입력 (전경 창 필요)"""
+
+    name = KEY_INPUT_TYPE_KEYS
+    background = False      # True면 전경 창 없이 입력 가능
+
+    def __init__(self, backend):
+        """
+        Args:
+            backend: ERP 백엔드 (전경 창 독점 구간 exclusive 제공)
+        """
+        self.backend = backend
+
+    def send(self, control, keys: str, **kwargs):
+        """
+        컨트롤에 키 입력
+
+        Args:
+            control: 스프레드 컨트롤
+            keys: pywinauto 키 문법 문자열
+            **kwargs: type_keys에 전달할 추가 인자 (pause, with_spaces 등)
+        """
+        with self.backend.exclusive(control):
+            control.type_keys(keys, **kwargs)
+
+
+class MessageInput(TypeKeysInput):
+    """스프레드 핸들로 창 메시지를 보내 입력 (메시지로 안 되는 키만 type_keys)"""
+
+    name = KEY_INPUT_MESSAGE
+    background = True
+
+    def __init__(self, backend, pause: float = DEFAULT_MESSAGE_PAUSE):
+        """
+        Args:
+            backend: ERP 백엔드 (char_message/key_message 제공)
+            pause: 메시지 사이 간격 (초)
+        """
+        super().__init__(backend)
+        self.pause = pause
+        self.fallbacks = 0      # type_keys로 보낸 묶음 수
+
+    @staticmethod
+    def sendable(token: KeyToken) -> bool:
+        """수정자 없는 문자/이동 키 또는 {PAUSE}면 메시지로 보냄"""
+        if token.modifiers:
+            return False
+        return token.is_char or token.key == 'PAUSE' or token.key in VIRTUAL_KEYS
+
+    def send(self, control, keys: str, **kwargs):
+        """
+        컨트롤에 키 입력 (메시지로 보낼 수 없는 토큰은 모아서 type_keys로)
+
+        Args:
+            control: 스프레드 컨트롤
+            keys: pywinauto 키 문법 문자열
+            **kwargs: type_keys에 전달할 추가 인자 (with_spaces는 메시지 입력에도 적용)
+        """
+        with_spaces = kwargs.get('with_spaces', False)
+        pending: List[KeyToken] = []
+        for token in tokenize(keys):
+            if not self.sendable(token):
+                pending.append(token)
+                continue
+            if pending:
+                self._fallback(control, pending, kwargs)
+                pending = []
+
+            if token.key == 'PAUSE':
+                time.sleep(token.pause)
+                continue
+            if token.is_char:
+                if token.key == ' ' and not with_spaces:
+                    continue
+                self.backend.char_message(control, token.key)
+            else:
+                self.backend.key_message(control, token.key)
+            time.sleep(self.pause)
+
+        if pending:
+            self._fallback(control, pending, kwargs)
+
+    def _fallback(self, control, tokens: List[KeyToken], kwargs):
+        """메시지로 보낼 수 없는 토큰 묶음을 type_keys로 (전경 창 필요)"""
+        self.fallbacks += 1
+        super().send(control, format_tokens(tokens), **kwargs)
+
+
+def create_key_input(name: str, backend, pause: float = DEFAULT_MESSAGE_PAUSE):
+    """
+    키 입력 백엔드 생성
+
+    Args:
+        name: KEY_INPUT_TYPE_KEYS 또는 KEY_INPUT_MESSAGE
+        backend: ERP 백엔드
+        pause: message 방식의 메시지 사이 간격 (초)
+
+    Returns:
+        TypeKeysInput 또는 MessageInput
+
+    Raises:
+        ValueError: 알 수 없는 방식
+    """
+    if name == KEY_INPUT_TYPE_KEYS:
+        return TypeKeysInput(backend)
+    if name == KEY_INPUT_MESSAGE:
+        return MessageInput(backend, pause=pause)
+    raise ValueError(f"알 수 없는 키 입력 방식: {name} (가능: {', '.join(KEY_INPUTS)})")
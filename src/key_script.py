@@ -0,0 +1,275 @@
+"""
+키 스크립트 컴파일러 모듈
+
+부양가족 한 명(또는 분납적용 사원 한 명)의 입력 과정을 하나의 키 시퀀스(KeyScript)로 컴파일하고,
+한 번의 type_keys 호출로 전송합니다.
+컴파일 결과는 텍스트로 확인할 수 있어 분기 로직을 오프라인에서 검증할 수 있습니다.
+"""
+
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from src.dependent_normalizer import NormalizedDependent
+from src.installment_grid import CHECKBOX_COLUMN_OFFSET, GRID_COLUMN_INDEX, is_installment
+from src.key_syntax import escape_text, count_keystrokes
+
+
+class KeyStep(NamedTuple):
+    """키 스크립트의 한 단계"""
+    label: str          # 단계 이름 (로그/검증용)
+    keys: str           # pywinauto 키 문법
+    settle: float = 0.0  # 단계 후 대기 시간 (초, {PAUSE}로 변환)
+    pause: Optional[float] = None   # 키 사이 간격 (초, None이면 전송할 때의 기본값)
+
+
+class KeyScript:
+    """컴파일된 키 스크립트"""
+
+    def __init__(self, steps: List[KeyStep], description: str = ""):
+        """
+        Args:
+            steps: 단계 리스트
+            description: 설명 (예: "20240001 홍길동 → 홍아들(4)")
+        """
+        self.steps = steps
+        self.description = description
+
+    def render(self) -> str:
+        """한 번에 전송할 키 문법 문자열"""
+        parts = []
+        for step in self.steps:
+            parts.append(step.keys)
+            if step.settle > 0:
+                parts.append(f"{{PAUSE {step.settle:g}}}")
+        return ''.join(parts)
+
+    def segments(self, default_pause: float) -> List[Tuple[str, float]]:
+        """
+        키 사이 간격이 같은 연속 단계끼리 묶은 전송 단위
+
+        Args:
+            default_pause: pause가 None인 단계의 키 사이 간격 (초)
+
+        Returns:
+            [(키 문법 문자열, 키 사이 간격), ...] (모든 단계가 기본값이면 render() 하나)
+        """
+        segments = []
+        for step in self.steps:
+            pause = default_pause if step.pause is None else step.pause
+            keys = step.keys + (f"{{PAUSE {step.settle:g}}}" if step.settle > 0 else "")
+            if segments and segments[-1][1] == pause:
+                segments[-1] = (segments[-1][0] + keys, pause)
+            else:
+                segments.append((keys, pause))
+        return segments
+
+    def keystroke_count(self) -> int:
+        """실제 키 입력 수"""
+        return sum(count_keystrokes(step.keys) for step in self.steps)
+
+    def to_text(self) -> str:
+        """
+        사람이 읽을 수 있는 형태로 변환 (골든 비교용)
+
+        Returns:
+            "라벨: 키" 형식의 여러 줄 문자열
+        """
+        lines = []
+        if self.description:
+            lines.append(f"# {self.description}")
+        for step in self.steps:
+            line = f"{step.label}: {step.keys}"
+            if step.settle > 0:
+                line += f" (+{step.settle:g}초)"
+            lines.append(line)
+        return '\n'.join(lines)
+
+    def __str__(self):
+        return self.to_text()
+
+    def __repr__(self):
+        return f"KeyScript({self.description!r}, {len(self.steps)}단계)"
+
+
+class DependentScriptCompiler:
+    """부양가족 데이터 → 키 스크립트 컴파일러"""
+
+    def __init__(self, child_settle: float = 0.3):
+        """
+        초기화
+
+        Args:
+            child_settle: 자녀공제 입력 후 대기 시간 (초)
+        """
+        self.child_settle = child_settle
+
+    def compile(self, dep: NormalizedDependent, employee_no: str = "", employee_name: str = "") -> KeyScript:
+        """
+        부양가족 한 명의 입력 키 스크립트 생성
+
+        BulkDependentInput.input_dependent와 같은 순서와 분기를 따릅니다.
+
+        Args:
+            dep: 정규화된 부양가족
+            employee_no: 사번 (설명용)
+            employee_name: 사원 이름 (설명용)
+
+        Returns:
+            KeyScript
+        """
+        steps = []
+
+        # 1. 관계코드
+        steps.append(KeyStep("관계코드", escape_text(dep.relationship_code)))
+
+        # 2. 성명 + ENTER
+        steps.append(KeyStep("성명", escape_text(dep.name) + "{ENTER}"))
+
+        # 3. 내/외국인
+        steps.append(KeyStep("내/외국인", dep.nationality_code))
+
+        # 4~5. 번호 타입 + 번호
+        steps.append(KeyStep("번호타입", dep.id_type))
+        steps.append(KeyStep("번호", escape_text(dep.id_number)))
+
+        # 6. 나이는 자동 입력되므로 건너뜀
+
+        # 7. 기본공제여부
+        steps.append(KeyStep("기본공제", "{RIGHT}" if dep.basic_deduction else "0"))
+
+        if dep.basic_deduction:
+            # 8. 경로 (만나이 60 이상이면 자동체크 열 건너뜀) + 장애유형
+            if dep.age >= 60:
+                steps.append(KeyStep("경로", "{RIGHT}"))
+
+            if dep.disability_type == '0':
+                steps.append(KeyStep("장애유형", "{RIGHT}"))
+            else:
+                steps.append(KeyStep("장애유형", escape_text(dep.disability_type)))
+
+            # 9. 자녀공제 (연말관계가 4인 경우만)
+            if dep.relationship_code == '4':
+                steps.append(KeyStep("자녀공제", '1' if dep.child_deduction else '0', settle=self.child_settle))
+
+        # 다음 부양가족 행으로 이동
+        steps.append(KeyStep("다음행", "{HOME}{DOWN}"))
+
+        description = f"{employee_no} {employee_name} → {dep.name}({dep.relationship_code})".strip()
+        return KeyScript(steps, description)
+
+
+class InstallmentScriptCompiler:
+    """분납적용 사원 1명 → 키 스크립트 컴파일러 (총액 소득세 셀에서 시작, 다음 사원 총액 소득세 셀에서 끝)"""
+
+    def __init__(self, field_settle: float = 0.0, row_settle: float = 0.1, with_checkbox: bool = False,
+                 nav_pause: float = 0.01):
+        """
+        초기화
+
+        Args:
+            field_settle: 금액 입력 + ENTER 후 대기 시간 (초)
+            row_settle: 다음 사원 행으로 넘어간 뒤 대기 시간 (초, 3차분납 자동 계산용)
+            with_checkbox: True면 단건 사원은 같은 행에서 체크 셀까지 가서 SPACE로 체크
+            nav_pause: 체크 열 왕복 방향키 묶음의 키 사이 간격 (초)
+        """
+        self.field_settle = field_settle
+        self.row_settle = row_settle
+        self.with_checkbox = with_checkbox
+        self.nav_pause = nav_pause
+
+    def compile(self, row: Dict) -> KeyScript:
+        """
+        사원 1명 키 스크립트 생성
+
+        분납 대상은 총액/1차/2차의 소득세·지방소득세를 입력하고 농특세는 ENTER로 건너뛰며,
+        2차 농특세에서 ENTER하면 다음 사원으로 넘어갑니다. 단건 사원은 총액만 입력하고
+        {DOWN}{LEFT}{LEFT}로 다음 사원 총액 소득세 셀로 이동합니다. with_checkbox면 단건 사원은
+        총액 농특세 셀에서 {RIGHT}로 체크 셀까지 가서 체크한 뒤 {DOWN}{LEFT n}으로 돌아옵니다.
+
+        Args:
+            row: load_yearend_data()의 사원 데이터
+
+        Returns:
+            KeyScript
+        """
+        def amount(label, key):
+            return KeyStep(label, f"{row[key]}{{ENTER}}", self.field_settle)
+
+        if is_installment(row):
+            steps = [
+                amount("총액 소득세", '총액_소득세'),
+                amount("총액 지방소득세", '총액_지방소득세'),
+                KeyStep("총액 농특세", "{ENTER}"),
+                amount("1차 소득세", '분납1_소득세'),
+                amount("1차 지방소득세", '분납1_지방소득세'),
+                KeyStep("1차 농특세", "{ENTER}"),
+                amount("2차 소득세", '분납2_소득세'),
+                amount("2차 지방소득세", '분납2_지방소득세'),
+                KeyStep("2차 농특세 → 다음 사원", "{ENTER}", self.row_settle),
+            ]
+        elif self.with_checkbox:
+            # 총액 지방소득세 ENTER 후 커서는 총액 농특세 셀
+            to_check = CHECKBOX_COLUMN_OFFSET - GRID_COLUMN_INDEX["총액_농특세"]
+            steps = [
+                amount("총액 소득세", '총액_소득세'),
+                amount("총액 지방소득세", '총액_지방소득세'),
+                KeyStep("체크", f"{{RIGHT {to_check}}}{{SPACE}}", self.field_settle, self.nav_pause),
+                KeyStep("다음 사원", f"{{DOWN}}{{LEFT {CHECKBOX_COLUMN_OFFSET}}}", self.row_settle, self.nav_pause),
+            ]
+        else:
+            steps = [
+                amount("총액 소득세", '총액_소득세'),
+                amount("총액 지방소득세", '총액_지방소득세'),
+                KeyStep("다음 사원", "{DOWN}{LEFT}{LEFT}", self.row_settle),
+            ]
+        return KeyScript(steps, f"{row['사원코드']} {row['사원명']}")
+
+
+class KeyScriptExecutor:
+    """키 스크립트를 한 번의 입력으로 전송"""
+
+    def __init__(self, input_handler, key_pause: float = 0.05, sleep_after: float = 0.1):
+        """
+        초기화
+
+        Args:
+            input_handler: InputHandler
+            key_pause: 키 사이 간격 (초, type_keys의 pause)
+            sleep_after: 전송 후 대기 시간 (global_delay 적용, 대기 방식은 InputHandler 설정 따름)
+        """
+        self.input_handler = input_handler
+        self.key_pause = key_pause
+        self.sleep_after = sleep_after
+
+    def execute(self, control, script: KeyScript):
+        """
+        스크립트 전송
+
+        Args:
+            control: 대상 컨트롤
+            script: 컴파일된 키 스크립트
+        """
+        self.input_handler.type_keys(control, script.render(), with_spaces=False, pause=self.key_pause)
+        self.input_handler.wait_for_idle(control, self.sleep_after)
+
+
+if __name__ == "__main__":
+    # 오프라인 확인: CSV의 각 부양가족 키 스크립트 출력
+    import sys
+    from src.csv_reader import CSVReader
+    from src.dependent_normalizer import normalize_employees
+
+    if len(sys.argv) < 2:
+        print("사용법: python -m src.key_script <CSV 파일> [사번]")
+        sys.exit(1)
+
+    reader = CSVReader(sys.argv[1])
+    employees = normalize_employees(reader.group_by_employee())
+    target = sys.argv[2] if len(sys.argv) > 2 else None
+
+    compiler = DependentScriptCompiler()
+    for emp_no, employee in employees.items():
+        if target and emp_no != target:
+            continue
+        for dep in employee.dependents:
+            script = compiler.compile(dep, emp_no, employee.employee_name)
+            print(script.to_text())
@@ -0,0 +1,165 @@
+"""
+키 입력 문법 모듈
+
+pywinauto type_keys/send_keys 키 문법의 이스케이프와 토큰 분석 기능을 제공합니다.
+"""
+
+from typing import List, NamedTuple
+
+# pywinauto 키 문법에서 특수 의미를 갖는 문자
+SPECIAL_CHARS = set('+^%~(){}[]')
+
+# 수정자 키 기호
+MODIFIERS = {'+': 'SHIFT', '^': 'CTRL', '%': 'ALT'}
+MODIFIER_SYMBOLS = {name: symbol for symbol, name in MODIFIERS.items()}
+
+# 창 메시지(WM_KEYDOWN/WM_KEYUP)로 보낼 수 있는 가상 키 (이름 → VK 코드)
+# F5처럼 확인 창을 띄우는 키는 SendMessage가 창이 닫힐 때까지 돌아오지 않으므로 넣지 않음
+VIRTUAL_KEYS = {
+    'BACKSPACE': 0x08, 'BS': 0x08, 'TAB': 0x09, 'ENTER': 0x0D, 'ESC': 0x1B, 'SPACE': 0x20,
+    'PGUP': 0x21, 'PGDN': 0x22, 'END': 0x23, 'HOME': 0x24,
+    'LEFT': 0x25, 'UP': 0x26, 'RIGHT': 0x27, 'DOWN': 0x28,
+    'DELETE': 0x2E, 'DEL': 0x2E,
+}
+
+
+class KeyToken(NamedTuple):
+    """키 입력 토큰 하나"""
+    modifiers: tuple    # ('CTRL',), ('SHIFT', 'CTRL') 등
+    key: str            # 'HOME', 'ENTER', 'a', '홍' 등
+    is_char: bool       # True면 일반 문자, False면 가상 키 이름
+    pause: float = 0.0  # {PAUSE x} 토큰이면 대기 시간 (초)
+
+
+def escape_text(text: str) -> str:
+    """
+    일반 텍스트를 키 문법에 안전하게 변환
+
+    Args:
+        text: 입력할 텍스트
+
+    Returns:
+        특수 문자를 {} 로 감싼 문자열 (예: "A+B" → "A{+}B")
+    """
+    return ''.join('{' + ch + '}' if ch in SPECIAL_CHARS else ch for ch in text)
+
+
+def tokenize(keys: str) -> List[KeyToken]:
+    """
+    키 문법 문자열을 토큰 목록으로 분해
+
+    지원 문법: 일반 문자, {NAME}, {NAME n}, {PAUSE x}, {x} (이스케이프),
+    ~ (ENTER), + ^ % 수정자, ( ) 그룹
+
+    Args:
+        keys: 키 문법 문자열 (예: "^{HOME}{DOWN 2}홍길동{ENTER}")
+
+    Returns:
+        KeyToken 리스트
+
+    Raises:
+        ValueError: 닫히지 않은 {, ( 가 있는 경우
+    """
+    tokens = []
+    pending_mods = []
+    group_stack = []
+    i = 0
+
+    def emit(key: str, is_char: bool, count: int = 1, pause: float = 0.0):
+        mods = tuple(m for group in group_stack for m in group) + tuple(pending_mods)
+        for _ in range(count):
+            tokens.append(KeyToken(mods, key, is_char, pause))
+        pending_mods.clear()
+
+    while i < len(keys):
+        ch = keys[i]
+
+        if ch in MODIFIERS:
+            pending_mods.append(MODIFIERS[ch])
+            i += 1
+        elif ch == '(':
+            group_stack.append(tuple(pending_mods))
+            pending_mods.clear()
+            i += 1
+        elif ch == ')':
+            if group_stack:
+                group_stack.pop()
+            i += 1
+        elif ch == '~':
+            emit('ENTER', False)
+            i += 1
+        elif ch == '{':
+            # {}} 처럼 닫는 중괄호 자체를 이스케이프한 경우
+            end = keys.find('}', i + 2)
+            if end == -1:
+                raise ValueError(f"닫히지 않은 '{{': {keys}")
+            code = keys[i + 1:end]
+            i = end + 1
+
+            if len(code) == 1:
+                emit(code, True)
+            elif ' ' in code:
+                name, arg = code.rsplit(' ', 1)
+                if name.upper() == 'PAUSE':
+                    emit('PAUSE', False, pause=float(arg))
+                else:
+                    is_char = len(name) == 1
+                    emit(name if is_char else name.upper(), is_char, count=int(arg))
+            else:
+                emit(code.upper(), False)
+        else:
+            emit(ch, True)
+            i += 1
+
+    if group_stack:
+        raise ValueError(f"닫히지 않은 '(': {keys}")
+
+    return tokens
+
+
+def format_tokens(tokens: List[KeyToken]) -> str:
+    """
+    토큰 목록을 다시 키 문법 문자열로 (tokenize의 역)
+
+    Args:
+        tokens: KeyToken 리스트
+
+    Returns:
+        키 문법 문자열 (수정자는 토큰마다 붙임, 예: "^{HOME}{DOWN}{DOWN}")
+    """
+    parts = []
+    for token in tokens:
+        mods = ''.join(MODIFIER_SYMBOLS[m] for m in token.modifiers)
+        if token.key == 'PAUSE':
+            parts.append(f"{{PAUSE {token.pause}}}")
+        elif token.is_char:
+            parts.append(mods + escape_text(token.key))
+        else:
+            parts.append(f"{mods}{{{token.key}}}")
+    return ''.join(parts)
+
+
+def count_keystrokes(keys: str) -> int:
+    """
+    키 문법 문자열의 실제 키 입력 수 ({PAUSE} 제외)
+
+    Args:
+        keys: 키 문법 문자열
+
+    Returns:
+        키 입력 수
+    """
+    return sum(1 for t in tokenize(keys) if t.key != 'PAUSE')
+
+
+def total_pause(keys: str) -> float:
+    """
+    키 문법 문자열에 포함된 {PAUSE x} 대기 시간 합계 (초)
+
+    Args:
+        keys: 키 문법 문자열
+
+    Returns:
+        대기 시간 합계
+    """
+    return sum(t.pause for t in tokenize(keys) if t.key == 'PAUSE')
@@ -0,0 +1,161 @@
+"""
+로그 서비스 모듈
+
+로그 기록을 큐에 넣기만 하고, 파일 쓰기/콘솔 출력은 백그라운드 스레드가 모아서 처리합니다.
+키 입력을 보내는 자동화 스레드에서는 파일 열기/쓰기/print가 일어나지 않습니다.
+"""
+
+import queue
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+
+class LogService:
+    """백그라운드 일괄 기록 로그 서비스"""
+
+    def __init__(self, log_file: Path, verbose: bool = False, console: bool = True,
+                 max_bytes: int = 5 * 1024 * 1024, backup_count: int = 3, flush_interval: float = 0.2):
+        """
+        초기화 (기록 스레드 시작)
+
+        Args:
+            log_file: 로그 파일 경로
+            verbose: True면 DEBUG 로그도 기록, False면 큐에 넣기 전에 버림
+            console: True면 콘솔(stdout)에도 출력
+            max_bytes: 로그 파일 최대 크기 (넘으면 .1, .2 ... 로 돌려 씀)
+            backup_count: 보관할 이전 로그 파일 수
+            flush_interval: 큐가 비어 있을 때 기록 스레드가 기다리는 최대 시간 (초)
+        """
+        self.log_file = Path(log_file)
+        self.verbose = verbose
+        self.console = console
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.flush_interval = flush_interval
+
+        # SimpleQueue.put은 생산자 쪽에서 대기하지 않음
+        self._queue = queue.SimpleQueue()
+        self._file = None
+        self._closed = False
+        self._thread = threading.Thread(target=self._writer_loop, name="LogService", daemon=True)
+        self._thread.start()
+
+    def log(self, level: str, message: str, *args):
+        """
+        로그 기록 (큐에 넣고 즉시 반환)
+
+        메시지 포맷팅은 기록 스레드에서 합니다. 무거운 값은 f-string 대신
+        log("DEBUG", "소요: %.2f초", elapsed) 처럼 인자로 넘기세요.
+
+        Args:
+            level: 로그 레벨 (INFO, SUCCESS, WARNING, ERROR, DEBUG)
+            message: 메시지 (args가 있으면 % 포맷 문자열)
+            *args: 포맷 인자
+        """
+        # DEBUG 로그는 verbose 모드일 때만 기록
+        if level == "DEBUG" and not self.verbose:
+            return
+        if self._closed:
+            return
+        self._queue.put((time.time(), level, message, args))
+
+    def flush(self, timeout: float = 2.0):
+        """
+        지금까지 넣은 로그가 모두 기록될 때까지 대기
+
+        Args:
+            timeout: 최대 대기 시간 (초)
+        """
+        if self._closed:
+            return
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait(timeout)
+
+    def close(self, timeout: float = 2.0):
+        """남은 로그를 기록하고 기록 스레드 종료"""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join(timeout)
+
+    @staticmethod
+    def _format(record) -> str:
+        """(시각, 레벨, 메시지, 인자) → 로그 한 줄"""
+        created, level, message, args = record
+        if args:
+            try:
+                message = message % args
+            except (TypeError, ValueError):
+                message = f"{message} {args}"
+        timestamp = datetime.fromtimestamp(created).strftime("%Y-%m-%d %H:%M:%S")
+        return f"[{timestamp}] {level}: {message}"
+
+    def _writer_loop(self):
+        """기록 스레드: 큐에 쌓인 로그를 모아서 한 번에 쓰기"""
+        running = True
+        while running:
+            try:
+                item = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                continue
+
+            lines = []
+            events = []
+            while True:
+                if item is None:
+                    running = False
+                elif isinstance(item, threading.Event):
+                    events.append(item)
+                else:
+                    lines.append(self._format(item))
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+
+            if lines:
+                self._write(lines)
+            for event in events:
+                event.set()
+
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _write(self, lines):
+        """로그 묶음 기록 (콘솔 + 파일)"""
+        text = '\n'.join(lines)
+
+        if self.console:
+            try:
+                print(text)
+            except Exception:
+                pass
+
+        try:
+            if self._file is None:
+                self._file = open(self.log_file, 'a', encoding='utf-8')
+            self._file.write(text + '\n')
+            self._file.flush()
+            if self._file.tell() >= self.max_bytes:
+                self._rotate()
+        except OSError:
+            pass
+
+    def _rotate(self):
+        """크기 기준 로그 파일 교체 (log → log.1 → log.2 ...)"""
+        self._file.close()
+        self._file = None
+
+        for i in range(self.backup_count - 1, 0, -1):
+            src = self.log_file.with_name(f"{self.log_file.name}.{i}")
+            if src.exists():
+                src.replace(self.log_file.with_name(f"{self.log_file.name}.{i + 1}"))
+        if self.backup_count > 0:
+            self.log_file.replace(self.log_file.with_name(f"{self.log_file.name}.1"))
+        else:
+            self.log_file.unlink()
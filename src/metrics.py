@@ -0,0 +1,150 @@
+"""
+실행 시간 측정 모듈
+
+이름 붙인 구간(span)의 소요 시간을 time.perf_counter로 재고,
+구간별 고정 크기 히스토그램에 누적합니다. 실행이 끝나면 구간별 p50/p95/max를
+JSON/CSV로 내보내거나 표로 출력할 수 있습니다.
+"""
+
+import csv
+import json
+import time
+from bisect import bisect_left
+from pathlib import Path
+from typing import Dict, List
+
+# 히스토그램 구간 경계 (초): 1ms부터 10%씩 증가, 약 2분까지
+BUCKET_BOUNDS = tuple(0.001 * 1.1 ** i for i in range(124))
+
+
+class Histogram:
+    """고정 크기 히스토그램 (값 개수와 관계없이 메모리 일정)"""
+
+    __slots__ = ('counts', 'count', 'total', 'max')
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKET_BOUNDS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float):
+        """값 하나 기록"""
+        self.counts[bisect_left(BUCKET_BOUNDS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, p: float) -> float:
+        """
+        백분위 값 (해당 구간의 상한, 최대값을 넘지 않음)
+
+        Args:
+            p: 0~100
+
+        Returns:
+            초 (기록이 없으면 0)
+        """
+        if self.count == 0:
+            return 0.0
+        rank = max(1, int(round(self.count * p / 100.0)))
+        seen = 0
+        for idx, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank:
+                bound = BUCKET_BOUNDS[idx] if idx < len(BUCKET_BOUNDS) else self.max
+                return min(bound, self.max)
+        return self.max
+
+
+class _Span:
+    """with 블록 소요 시간 측정"""
+
+    __slots__ = ('histogram', 'start')
+
+    def __init__(self, histogram: Histogram):
+        self.histogram = histogram
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.histogram.record(time.perf_counter() - self.start)
+        return False
+
+
+class Metrics:
+    """구간별 실행 시간 측정"""
+
+    def __init__(self):
+        self.histograms: Dict[str, Histogram] = {}
+
+    def _histogram(self, name: str) -> Histogram:
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = Histogram()
+        return histogram
+
+    def span(self, name: str) -> _Span:
+        """
+        구간 측정 (with metrics.span("성명"): ...)
+
+        Args:
+            name: 구간 이름
+        """
+        return _Span(self._histogram(name))
+
+    def record(self, name: str, seconds: float):
+        """측정한 값 직접 기록"""
+        self._histogram(name).record(seconds)
+
+    def summary(self) -> List[Dict]:
+        """
+        구간별 요약 (처음 기록된 순서)
+
+        Returns:
+            [{'span', 'count', 'p50', 'p95', 'max', 'total'}, ...]
+        """
+        rows = []
+        for name, h in self.histograms.items():
+            rows.append({
+                'span': name,
+                'count': h.count,
+                'p50': round(h.percentile(50), 4),
+                'p95': round(h.percentile(95), 4),
+                'max': round(h.max, 4),
+                'total': round(h.total, 4),
+            })
+        return rows
+
+    def export_json(self, path: Path):
+        """요약을 JSON 파일로 저장"""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.summary(), f, ensure_ascii=False, indent=2)
+
+    def export_csv(self, path: Path):
+        """요약을 CSV 파일로 저장 (엑셀에서 열 수 있게 utf-8-sig)"""
+        with open(path, 'w', encoding='utf-8-sig', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=['span', 'count', 'p50', 'p95', 'max', 'total'])
+            writer.writeheader()
+            writer.writerows(self.summary())
+
+
+def format_summary(rows: List[Dict]) -> str:
+    """
+    요약을 표 형태 문자열로 변환 (로그/GUI 출력용)
+
+    Args:
+        rows: Metrics.summary() 결과
+
+    Returns:
+        여러 줄 문자열
+    """
+    lines = [f"{'구간':<16}{'횟수':>6}{'p50':>9}{'p95':>9}{'max':>9}{'합계':>10}"]
+    for r in rows:
+        lines.append(
+            f"{r['span']:<16}{r['count']:>6}{r['p50']:>8.2f}s{r['p95']:>8.2f}s{r['max']:>8.2f}s{r['total']:>9.1f}s"
+        )
+    return '\n'.join(lines)
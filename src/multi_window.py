@@ -0,0 +1,171 @@
+"""
+여러 창 동시 실행 모듈
+
+회사 DB별로 열어 둔 ERP 창 여러 개에 작업을 하나씩 맡겨 스레드로 동시에 실행합니다.
+작업마다 ArbitratedBackend를 주고 하나의 ForegroundArbiter를 함께 쓰게 해서,
+한 작업이 입력 후 대기하는 동안 다른 작업이 자기 창으로 키를 보냅니다.
+"""
+
+import threading
+import time
+from typing import Dict, List, NamedTuple, Optional
+
+from src.erp_backend import default_backend
+from src.foreground_arbiter import ArbitratedBackend, ForegroundArbiter, DEFAULT_LINGER, DEFAULT_SWITCH_SETTLE
+
+# 작업 종류
+JOB_DEPENDENT = "dependent"       # 부양가족 입력 (사원등록, CSV)
+JOB_INSTALLMENT = "installment"   # 분납적용 입력 (급여자료입력, Excel)
+JOB_CHECKBOX = "checkbox"         # 분납적용 체크박스 (급여자료입력, Excel)
+JOB_KINDS = (JOB_DEPENDENT, JOB_INSTALLMENT, JOB_CHECKBOX)
+
+# 작업 종류별 ERP 창 제목
+WINDOW_TITLES = {
+    JOB_DEPENDENT: "사원등록",
+    JOB_INSTALLMENT: "급여자료입력",
+    JOB_CHECKBOX: "급여자료입력",
+}
+
+
+class WindowJob(NamedTuple):
+    """창 1개에 맡길 작업"""
+    kind: str                       # JOB_*
+    path: str                       # CSV(부양가족) 또는 Excel(분납적용) 경로
+    process_id: Optional[int] = None    # 연결할 ERP 프로세스 ID (None이면 창 제목으로)
+    options: Optional[Dict] = None  # 자동화 클래스 키워드 인자 (global_delay 등)
+    count: Optional[int] = None     # 처리할 사원 수 (None이면 전체)
+    label: str = ""                 # 로그/통계용 이름 (비어 있으면 종류:PID)
+    backend: object = None          # 실제 백엔드 (None이면 Win32Backend, 벤치마크는 시뮬레이터)
+
+
+def job_label(job: WindowJob, index: int) -> str:
+    """작업 이름 (label이 없으면 종류:PID 또는 종류#번호)"""
+    if job.label:
+        return job.label
+    if job.process_id is not None:
+        return f"{job.kind}:{job.process_id}"
+    return f"{job.kind}#{index + 1}"
+
+
+class MultiWindowRunner:
+    """여러 ERP 창에서 작업을 동시에 실행"""
+
+    def __init__(self, jobs: List[WindowJob], switch_settle: float = DEFAULT_SWITCH_SETTLE,
+                 linger: float = DEFAULT_LINGER, dry_run: bool = False, log_callback=None):
+        """
+        초기화
+
+        Args:
+            jobs: 창별 작업 목록
+            switch_settle: 다른 작업의 창으로 전환한 뒤 입력 전 대기 시간 (초)
+            linger: 입력 묶음이 끝난 작업이 다시 입력하면 전환 없이 이어 쓰는 시간 (초)
+            dry_run: True면 실제 입력 없이 테스트
+            log_callback: 로그 출력 콜백 함수 (level, message, *args - LogService.log와 같은 형태)
+
+        Raises:
+            ValueError: 알 수 없는 작업 종류이거나 작업 이름이 겹치는 경우
+        """
+        for job in jobs:
+            if job.kind not in JOB_KINDS:
+                raise ValueError(f"알 수 없는 작업 종류: {job.kind} (가능: {', '.join(JOB_KINDS)})")
+        self.labels = [job_label(job, i) for i, job in enumerate(jobs)]
+        if len(set(self.labels)) != len(self.labels):
+            raise ValueError(f"작업 이름이 겹칩니다: {', '.join(self.labels)}")
+
+        self.jobs = list(jobs)
+        self.dry_run = dry_run
+        self.log_callback = log_callback
+        self.arbiter = ForegroundArbiter(switch_settle=switch_settle, linger=linger, log_callback=log_callback)
+
+        self._lock = threading.Lock()
+        self._automations = {}      # 작업 이름 → 실행 중인 자동화 객체 (중지용)
+
+    def _log(self, level: str, message: str):
+        """로그 출력 (콜백이 있으면 사용)"""
+        if self.log_callback:
+            self.log_callback(level, message)
+
+    def _create(self, job: WindowJob, backend):
+        """작업 종류에 맞는 자동화 객체 생성 (생성자에서 창에 연결)"""
+        options = dict(job.options or {})
+        if job.kind == JOB_DEPENDENT:
+            from bulk_dependent_input import BulkDependentInput
+            return BulkDependentInput(job.path, backend=backend, **options)
+
+        from src.installment_automation import InstallmentAutomation
+        return InstallmentAutomation(job.path, backend=backend, **options)
+
+    def _run_job(self, job: WindowJob, label: str) -> Dict:
+        """작업 1개 실행 (작업 스레드)"""
+        backend = ArbitratedBackend(
+            job.backend if job.backend is not None else default_backend(),
+            self.arbiter, label, process_id=job.process_id
+        )
+        automation = None
+        start = time.perf_counter()
+        try:
+            automation = self._create(job, backend)
+            with self._lock:
+                self._automations[label] = automation
+
+            if job.kind == JOB_CHECKBOX:
+                result = automation.run_checkbox(count=job.count, dry_run=self.dry_run)
+            else:
+                result = automation.run(count=job.count, dry_run=self.dry_run)
+            result = dict(result or {})
+            result.setdefault('status', 'completed')
+        except Exception as e:
+            self._log("ERROR", f"[{label}] 작업 실패: {e}")
+            result = {'status': 'error', 'reason': str(e)}
+        finally:
+            with self._lock:
+                self._automations.pop(label, None)
+            if automation is not None:
+                try:
+                    automation.cleanup()
+                except Exception:
+                    pass
+
+        result['elapsed_wall'] = time.perf_counter() - start
+        return result
+
+    def run(self) -> Dict:
+        """
+        모든 작업을 동시에 실행하고 끝날 때까지 대기
+
+        Returns:
+            {'jobs': {작업 이름: 결과 딕셔너리}, 'elapsed': 전체 경과 시간,
+             'switches': 전경 전환 횟수, 'arbiter': 작업별 독점 통계}
+        """
+        results: Dict[str, Dict] = {}
+
+        def worker(job, label):
+            results[label] = self._run_job(job, label)
+
+        self._log("INFO", f"여러 창 동시 실행: {len(self.jobs)}개 작업 ({', '.join(self.labels)})")
+        start = time.perf_counter()
+        threads = [
+            threading.Thread(target=worker, args=(job, label), name=f"window-{label}", daemon=True)
+            for job, label in zip(self.jobs, self.labels)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+
+        self._log("INFO", f"여러 창 동시 실행 완료: {elapsed:.1f}초, 전경 전환 {self.arbiter.switches}회")
+        return {
+            'jobs': {label: results.get(label, {'status': 'error', 'reason': 'no_result'})
+                     for label in self.labels},
+            'elapsed': elapsed,
+            'switches': self.arbiter.switches,
+            'arbiter': self.arbiter.stats(),
+        }
+
+    def stop(self):
+        """실행 중인 모든 작업에 중지 요청"""
+        with self._lock:
+            automations = list(self._automations.values())
+        for automation in automations:
+            automation.stop()
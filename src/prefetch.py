@@ -0,0 +1,136 @@
+"""
+미리 준비(prefetch) 모듈
+
+사원별 입력 데이터(부양가족 필터/정렬, 번호 정제, 키 스크립트/붙여넣기 행 생성)를
+작업 스레드가 N명 앞서 만들어 크기 제한 큐에 넣어 둡니다.
+키 입력을 보내는 스레드는 큐에서 꺼내 바로 보내기만 합니다.
+"""
+
+import queue
+import threading
+from typing import Callable, Dict, List, NamedTuple, Sequence
+
+from src.dependent_normalizer import NormalizedDependent
+
+_DONE = object()    # 작업 스레드 종료 표시
+_TAKE_POLL = 0.1    # take() 대기 중 중지/작업 스레드 종료 확인 간격 (초)
+
+
+class EmployeePayload(NamedTuple):
+    """사원 1명의 미리 준비된 입력 데이터"""
+    employee_no: str
+    employee_name: str
+    dependents: List[NormalizedDependent]   # 본인 제외, (관계코드, 이름) 정렬
+    digest: str                             # 진행 저널용 CSV 내용 해시
+    encoded: Dict[int, object]              # id(부양가족) → KeyScript 또는 TSV 행 (입력 방식별)
+
+    def encoded_for(self, dep: NormalizedDependent, default=None):
+        """부양가족의 미리 만든 입력 데이터 (없으면 default)"""
+        return self.encoded.get(id(dep), default)
+
+
+class PrefetchPipeline:
+    """순서가 정해진 키 목록을 작업 스레드에서 미리 준비"""
+
+    def __init__(self, keys: Sequence[str], build: Callable[[str], object], depth: int = 4, log_callback=None):
+        """
+        초기화 (start() 호출 전까지 작업 스레드는 시작하지 않음)
+
+        Args:
+            keys: 처리 순서대로의 키 (사번)
+            build: 키 → 준비된 데이터 (작업 스레드에서 호출)
+            depth: 최대 몇 명 앞서 준비할지 (큐 크기)
+            log_callback: 로그 출력 콜백 함수 (level, message, *args - LogService.log와 같은 형태)
+        """
+        self.keys = list(keys)
+        self._key_set = set(self.keys)
+        self.build = build
+        self.depth = max(1, depth)
+        self.log_callback = log_callback
+
+        self._queue = queue.Queue(maxsize=self.depth)
+        self._stop = threading.Event()
+        self._thread = None
+        self._finished = False
+
+    def _log(self, level: str, message: str, *args):
+        """로그 출력 (콜백이 있으면 사용, args가 있으면 message는 % 포맷 문자열)"""
+        if self.log_callback:
+            self.log_callback(level, message, *args)
+
+    def start(self):
+        """작업 스레드 시작"""
+        self._thread = threading.Thread(target=self._worker, name="Prefetch", daemon=True)
+        self._thread.start()
+
+    def _put(self, item) -> bool:
+        """큐에 넣기 (가득 차 있으면 대기, 중지되면 False)"""
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _worker(self):
+        """작업 스레드: 키 순서대로 준비해 큐에 넣기"""
+        for key in self.keys:
+            if self._stop.is_set():
+                return
+            try:
+                payload = self.build(key)
+            except Exception as e:
+                # 준비 실패는 꺼내는 쪽에서 다시 만들어 오류를 그 자리에서 드러냄
+                self._log("DEBUG", "미리 준비 실패 (%s): %s", key, e)
+                payload = None
+            if not self._put((key, payload)):
+                return
+        self._put(_DONE)
+
+    def take(self, key: str):
+        """
+        다음 준비된 데이터 꺼내기 (keys 순서대로 호출)
+
+        준비가 아직 안 됐으면 기다리고, 키가 맞지 않거나 준비에 실패했거나
+        작업 스레드가 끝났으면 지금 스레드에서 build(key)로 만듭니다.
+        다른 스레드가 close()로 큐를 비우고 작업 스레드를 멈춘 경우에도
+        무한히 기다리지 않고 build(key)로 돌아갑니다.
+
+        Args:
+            key: 지금 처리할 키
+
+        Returns:
+            준비된 데이터
+        """
+        if key not in self._key_set:
+            return self.build(key)
+
+        while not self._finished:
+            try:
+                item = self._queue.get(timeout=_TAKE_POLL)
+            except queue.Empty:
+                thread = self._thread     # close()가 다른 스레드에서 None으로 바꿀 수 있음
+                if self._stop.is_set() or thread is None or not thread.is_alive():
+                    break
+                continue
+            if item is _DONE:
+                self._finished = True
+                break
+            item_key, payload = item
+            if item_key == key:
+                return payload if payload is not None else self.build(key)
+            # 순서가 어긋난 항목은 버림 (중간에 건너뛴 사원)
+        return self.build(key)
+
+    def close(self):
+        """작업 스레드 중지 (큐를 비워 대기 중인 put을 풀어줌)"""
+        self._stop.set()
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                break
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
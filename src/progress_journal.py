@@ -0,0 +1,155 @@
+"""
+진행 저널 모듈
+
+사원별 처리 결과를 추가 전용(JSONL) 파일에 한 줄씩 기록하고 매번 fsync합니다.
+중지/오류/비정상 종료 후 다시 실행할 때 이미 끝난 사원을 건너뛰는 데 사용합니다.
+저널 파일은 입력 파일 경로와 ERP 창 이름별로 따로 만들어집니다.
+연결한 회사 DB는 구분하지 않으므로 이어서 실행할 때 어느 저널의 기록을 몇 명 건너뛰는지
+로그로 남깁니다 (log_resume).
+입력 파일 내용이 바뀐 사원은 사원별 값 해시(value_digest.values_digest)로 가려 다시 처리합니다.
+"""
+
+import hashlib
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional
+
+# 저널 파일 위치
+JOURNAL_DIR = Path("logs") / "journal"
+
+# 완료로 보는 상태 (다시 실행할 때 건너뜀)
+STATUS_DONE = "done"
+STATUS_PARTIAL = "partial"
+STATUS_ERROR = "error"
+
+
+def path_digest(path: str) -> str:
+    """
+    입력 파일 절대 경로 해시 (이름이 같은 다른 폴더의 파일과 저널 구분용)
+
+    파일 내용은 넣지 않으므로 입력 파일을 고쳐도 같은 저널을 이어서 씁니다.
+
+    Args:
+        path: 파일 경로
+
+    Returns:
+        SHA-1 앞 12자리
+    """
+    return hashlib.sha1(str(Path(path).resolve()).encode('utf-8')).hexdigest()[:12]
+
+
+class ProgressJournal:
+    """사원별 처리 결과 저널"""
+
+    def __init__(self, source_path: str, window: str, journal_dir: Path = JOURNAL_DIR, log_callback=None):
+        """
+        초기화 (기존 저널이 있으면 읽어 둠)
+
+        Args:
+            source_path: 입력 파일 경로 (CSV/Excel, 경로로 저널 구분)
+            window: 작업 이름 (ERP 창 이름 등, 예: "사원등록")
+            journal_dir: 저널 파일 폴더
+            log_callback: 로그 출력 콜백 함수 (level, message)
+        """
+        self.log_callback = log_callback
+        self.window = window
+
+        journal_dir = Path(journal_dir)
+        journal_dir.mkdir(parents=True, exist_ok=True)
+        safe_window = ''.join(ch if ch.isalnum() else '_' for ch in window)
+        self.path = journal_dir / f"{safe_window}_{Path(source_path).stem}_{path_digest(source_path)}.jsonl"
+
+        self.entries: Dict[str, Dict] = {}
+        self._load()
+        self._file = None
+
+    def _log(self, level: str, message: str):
+        """로그 출력 (콜백이 있으면 사용)"""
+        if self.log_callback:
+            self.log_callback(level, message)
+
+    def _load(self):
+        """기존 저널 읽기 (같은 키는 마지막 기록 사용, 깨진 줄/키나 상태가 없는 줄은 무시)"""
+        if not self.path.exists():
+            return
+
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # 기록 중 종료되어 잘린 마지막 줄
+                    continue
+                if not isinstance(entry, dict) or 'key' not in entry or 'status' not in entry:
+                    continue
+                self.entries[entry['key']] = entry
+
+    def record(self, key: str, status: str, digest: str = "", **extra):
+        """
+        처리 결과 한 줄 기록 (즉시 디스크에 반영)
+
+        Args:
+            key: 사원 키 (사번/사원코드)
+            status: STATUS_DONE / STATUS_PARTIAL / STATUS_ERROR
+            digest: 입력한 값 해시 (value_digest.values_digest)
+            **extra: 추가 기록 (사원명 등)
+        """
+        entry = {
+            'key': key,
+            'status': status,
+            'digest': digest,
+            'time': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        }
+        entry.update(extra)
+
+        if self._file is None:
+            self._file = open(self.path, 'a', encoding='utf-8')
+        self._file.write(json.dumps(entry, ensure_ascii=False) + '\n')
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+        self.entries[key] = entry
+
+    def is_done(self, key: str, digest: Optional[str] = None) -> bool:
+        """
+        이미 완료된 사원인지 확인
+
+        Args:
+            key: 사원 키
+            digest: 현재 입력할 값 해시 (지정하면 기록된 해시와 같아야 완료로 판단)
+
+        Returns:
+            True면 건너뛰어도 됨
+        """
+        entry = self.entries.get(key)
+        if not entry or entry['status'] != STATUS_DONE:
+            return False
+        return digest is None or entry.get('digest') == digest
+
+    def done_count(self) -> int:
+        """완료로 기록된 사원 수"""
+        return sum(1 for e in self.entries.values() if e['status'] == STATUS_DONE)
+
+    def log_resume(self):
+        """
+        이어서 실행 시작 로그 (어느 저널의 완료 기록을 몇 명 건너뛰는지)
+
+        저널은 회사 DB를 구분하지 않으므로, 같은 파일을 다른 회사 DB에 입력하면서
+        이어서 실행을 켜 두면 앞 회사에서 끝낸 사원을 건너뜁니다. 기록이 있으면 경고로 남깁니다.
+        """
+        done = [e for e in self.entries.values() if e['status'] == STATUS_DONE]
+        if not done:
+            self._log("INFO", f"이어서 실행: 저널 {self.path.name}에 완료 기록 없음")
+            return
+        last = max(e.get('time', '') for e in done)
+        self._log("WARNING", f"이어서 실행: 저널 {self.path.name}의 완료 기록 {len(done)}명은 건너뜀 "
+                             f"(마지막 기록 {last or '알 수 없음'})")
+        self._log("WARNING", "  다른 회사 DB에 입력하는 중이라면 중지하고 이어서 실행을 끈 채 다시 실행하세요")
+
+    def close(self):
+        """저널 파일 닫기"""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
@@ -0,0 +1,459 @@
+"""
+실행 계획 모듈
+
+CSV 데이터(사원별 그룹)로부터 실행 전체의 키 입력 계획을 만들고,
+설정된 지연 시간으로 사원별/전체 예상 소요시간을 계산합니다.
+핍홀(peephole) 단계에서 커서 위치가 변하지 않는 중복 이동을 제거합니다.
+"""
+
+from typing import Dict, List, NamedTuple, Optional
+
+from src.clipboard_reader import DEFAULT_COPY_TIMEOUT
+from src.dependent_normalizer import EmployeeDependents, NormalizedDependent
+from src.input_handler import INPUT_MODE_KEYS, INPUT_MODE_SCRIPT, INPUT_MODE_PASTE, INPUT_MODE_BLOCK
+from src.key_syntax import tokenize, count_keystrokes
+
+# 액션 종류
+ACTION_NAV = "nav"        # 커서 이동
+ACTION_READ = "read"      # Ctrl+C 읽기
+ACTION_TYPE = "type"      # 데이터 입력
+ACTION_DELETE = "delete"  # 행 삭제 (F5 + y)
+ACTION_FOCUS = "focus"    # 스프레드 포커스 전환
+
+# 필드별 type_keys 호출의 키 간격 (pause=0.05)
+CALL_PAUSE = 0.05
+
+# Ctrl+C 후 클립보드 변경이 확인되기까지의 예상 시간 (초, 값이 있는 셀)
+COPY_LATENCY = 0.02
+
+
+class PlanAction(NamedTuple):
+    """계획의 액션 하나 (type_keys 호출 1회 단위)"""
+    kind: str       # ACTION_*
+    control: str    # "left" / "right"
+    keys: str       # pywinauto 키 문법 ('' 가능)
+    label: str      # 설명
+    cost: float     # 예상 소요시간 (초)
+
+
+def format_duration(seconds: float) -> str:
+    """초를 "N분 S.S초" 형식으로 변환"""
+    minutes = int(seconds // 60)
+    secs = seconds % 60
+    if minutes > 0:
+        return f"{minutes}분 {secs:.1f}초"
+    return f"{secs:.1f}초"
+
+
+def _call_groups(keys: str) -> int:
+    """
+    필드별 입력 방식에서 단계 하나가 쓰는 type_keys 호출 수
+
+    연속된 일반 문자는 한 번에, 가상 키({ENTER} 등)는 각각 따로 호출합니다.
+    """
+    groups = 0
+    prev_char = False
+    for token in tokenize(keys):
+        if token.key == 'PAUSE':
+            continue
+        if token.is_char:
+            if not prev_char:
+                groups += 1
+            prev_char = True
+        else:
+            groups += 1
+            prev_char = False
+    return groups
+
+
+def _move(pos: tuple, keys: str) -> tuple:
+    """
+    커서 위치 모델에 이동 키 적용
+
+    Args:
+        pos: (행, 열) - 알 수 없으면 None
+        keys: 이동 키
+
+    Returns:
+        이동 후 (행, 열)
+    """
+    row, col = pos
+    for token in tokenize(keys):
+        if token.key == 'HOME' and 'CTRL' in token.modifiers:
+            # 첫 행으로 이동 (열은 보장하지 않으므로 기존 코드처럼 {HOME}을 함께 사용)
+            row = 0
+        elif token.key == 'HOME':
+            col = 0
+        elif token.key == 'DOWN':
+            row = None if row is None else row + 1
+        elif token.key == 'UP':
+            # 0행에서의 동작은 모델링하지 않음
+            row = row - 1 if row else None
+        elif token.key == 'RIGHT':
+            col = None if col is None else col + 1
+        elif token.key == 'LEFT':
+            col = col - 1 if col else None
+        else:
+            row, col = None, None
+    return (row, col)
+
+
+def _known(pos: tuple) -> bool:
+    return pos[0] is not None and pos[1] is not None
+
+
+def peephole(actions: List[PlanAction], positions: Dict[str, tuple] = None) -> tuple:
+    """
+    중복 커서 이동 제거
+
+    같은 컨트롤에 연속된 이동 액션 구간에서, 커서 위치가 구간 시작 위치로
+    되돌아오는 부분 구간(예: 2행에서 ^{HOME} {HOME} {DOWN})을 제거합니다.
+
+    Args:
+        actions: 액션 리스트
+        positions: 컨트롤별 시작 커서 위치 (갱신됨, None이면 모두 알 수 없음)
+
+    Returns:
+        (최적화된 액션 리스트, 제거된 액션 수)
+    """
+    if positions is None:
+        positions = {}
+
+    optimized = []
+    removed = 0
+    i = 0
+
+    while i < len(actions):
+        action = actions[i]
+        control = action.control
+
+        if action.kind != ACTION_NAV:
+            optimized.append(action)
+            if action.kind in (ACTION_TYPE, ACTION_DELETE):
+                positions[control] = (None, None)
+            i += 1
+            continue
+
+        # 같은 컨트롤의 연속 이동 구간 수집
+        run = []
+        while i < len(actions) and actions[i].kind == ACTION_NAV and actions[i].control == control:
+            run.append(actions[i])
+            i += 1
+
+        # 각 액션 후 위치 계산
+        trail = [positions.get(control, (None, None))]
+        for nav in run:
+            trail.append(_move(trail[-1], nav.keys))
+
+        # 같은 위치로 되돌아오는 가장 긴 부분 구간 제거
+        kept = []
+        k = 0
+        while k < len(run):
+            match = None
+            if _known(trail[k]):
+                for m in range(len(run), k, -1):
+                    if trail[m] == trail[k]:
+                        match = m
+                        break
+            if match is not None:
+                removed += match - k
+                k = match
+            else:
+                kept.append(run[k])
+                k += 1
+
+        optimized.extend(kept)
+        positions[control] = trail[-1]
+
+    return optimized, removed
+
+
+class EmployeePlan:
+    """사원 1명의 실행 계획"""
+
+    def __init__(self, employee_no: str, employee_name: str, dependent_count: int, actions: List[PlanAction]):
+        self.employee_no = employee_no
+        self.employee_name = employee_name
+        self.dependent_count = dependent_count
+        self.actions = actions
+
+    @property
+    def estimate(self) -> float:
+        """예상 소요시간 (초)"""
+        return sum(a.cost for a in self.actions)
+
+    @property
+    def keystrokes(self) -> int:
+        """키 입력 수"""
+        return sum(count_keystrokes(a.keys) for a in self.actions if a.keys)
+
+
+class RunPlan:
+    """실행 전체 계획"""
+
+    def __init__(self, employees: List[EmployeePlan], setup: List[PlanAction], removed: int, settings: Dict):
+        self.employees = employees
+        self.setup = setup
+        self.removed = removed
+        self.settings = settings
+        self._by_employee = {e.employee_no: e for e in employees}
+
+    @property
+    def total_estimate(self) -> float:
+        """전체 예상 소요시간 (초)"""
+        return sum(a.cost for a in self.setup) + sum(e.estimate for e in self.employees)
+
+    @property
+    def total_keystrokes(self) -> int:
+        """전체 키 입력 수"""
+        return sum(count_keystrokes(a.keys) for a in self.setup if a.keys) + sum(e.keystrokes for e in self.employees)
+
+    def estimate_for(self, employee_no: str) -> Optional[float]:
+        """사원별 예상 소요시간 (계획에 없으면 None)"""
+        plan = self._by_employee.get(employee_no)
+        return plan.estimate if plan else None
+
+    def to_text(self, limit: int = None) -> str:
+        """
+        계획 요약 텍스트
+
+        Args:
+            limit: 사원별 목록 최대 표시 수 (None이면 전체)
+
+        Returns:
+            여러 줄 문자열
+        """
+        lines = ["=== 실행 계획 ==="]
+        lines.append("설정: " + ", ".join(f"{k}={v}" for k, v in self.settings.items()))
+        lines.append(f"사원 수: {len(self.employees)}명 "
+                     f"(부양가족 {sum(e.dependent_count for e in self.employees)}명)")
+
+        shown = self.employees if limit is None else self.employees[:limit]
+        for idx, emp in enumerate(shown, 1):
+            lines.append(f"  [{idx}] {emp.employee_no} ({emp.employee_name}): "
+                         f"부양가족 {emp.dependent_count}명, 키 {emp.keystrokes}회, "
+                         f"예상 {format_duration(emp.estimate)}")
+        if len(shown) < len(self.employees):
+            lines.append(f"  ... 외 {len(self.employees) - len(shown)}명")
+
+        lines.append(f"중복 이동 제거: {self.removed}회")
+        lines.append(f"총 키 입력: {self.total_keystrokes}회")
+        lines.append(f"총 예상 소요시간: {format_duration(self.total_estimate)}")
+        return '\n'.join(lines)
+
+
+class RunPlanner:
+    """BulkDependentInput 실행 계획 생성기"""
+
+    def __init__(self, compiler, global_delay: float = 1.0, input_mode: str = INPUT_MODE_KEYS,
+                 key_pause: float = 0.05, sleep_after: float = 0.1,
+                 start_from_current: bool = False, assume_rerun: bool = False,
+                 snapshot: bool = False, sync: bool = False):
+        """
+        초기화
+
+        Args:
+            compiler: DependentScriptCompiler (부양가족 입력 단계 생성)
+            global_delay: 전역 지연 시간 배율
+            input_mode: 부양가족 입력 방식
+            key_pause: script 방식의 키 사이 간격 (초)
+            sleep_after: type_keys 호출 후 기본 대기 시간 (global_delay 적용 전)
+            start_from_current: True면 첫 사원 이동 생략
+            assume_rerun: True면 ERP에 CSV와 같은 수의 기존 부양가족이 있다고 가정 (삭제 비용 포함)
+            snapshot: True면 사원 목록 스냅샷 1회 후 사원별 사번 읽기 생략
+            sync: True면 기존 부양가족을 한 번에 읽어 비교 (assume_rerun이면 모두 일치로 가정)
+        """
+        self.compiler = compiler
+        self.global_delay = max(0.5, min(2.0, global_delay))
+        self.input_mode = input_mode
+        self.key_pause = key_pause
+        self.sleep_after = sleep_after
+        self.start_from_current = start_from_current
+        self.assume_rerun = assume_rerun
+        self.snapshot = snapshot
+        self.sync = sync
+
+    def _call(self, kind: str, control: str, keys: str, label: str, sleep_after: float = None) -> PlanAction:
+        """type_keys_with_delay 호출 1회"""
+        if sleep_after is None:
+            sleep_after = self.sleep_after
+        cost = count_keystrokes(keys) * CALL_PAUSE + sleep_after * self.global_delay
+        return PlanAction(kind, control, keys, label, cost)
+
+    def _read(self, control: str, label: str, empty: bool = False) -> PlanAction:
+        """
+        Ctrl+C 읽기 1회
+
+        클립보드 변경이 확인되는 즉시 진행하므로 고정 대기 대신 COPY_LATENCY를,
+        빈 셀(클립보드 변경 없음)이면 제한 시간 전체를 비용으로 잡습니다.
+        """
+        wait = DEFAULT_COPY_TIMEOUT * self.global_delay if empty else COPY_LATENCY
+        return PlanAction(ACTION_READ, control, "^c", label, count_keystrokes("^c") * CALL_PAUSE + wait)
+
+    def _clear_actions(self, existing_rows: int) -> List[PlanAction]:
+        """기존 부양가족 삭제 루프 (clear_existing_dependents)"""
+        actions = []
+        for n in range(existing_rows + 1):
+            actions.append(self._call(ACTION_NAV, "right", "^{HOME}", "2행 이동"))
+            actions.append(self._call(ACTION_NAV, "right", "{HOME}", "2행 이동"))
+            actions.append(self._call(ACTION_NAV, "right", "{DOWN}", "2행 이동"))
+            actions.append(self._read("right", "2행 관계코드", empty=n == existing_rows))
+            if n < existing_rows:
+                actions.append(self._call(ACTION_DELETE, "right", "{F5}", "행 삭제", sleep_after=0.2))
+                actions.append(PlanAction(ACTION_DELETE, "right", "y", "삭제 확인", 0.1 * self.global_delay))
+        return actions
+
+    def _sync_actions(self) -> List[PlanAction]:
+        """기존 부양가족 일괄 읽기 (sync_existing_dependents, 삭제 없음)"""
+        return [
+            self._call(ACTION_NAV, "right", "^{HOME}", "1행 이동"),
+            self._call(ACTION_NAV, "right", "{HOME}", "1행 이동"),
+            self._call(ACTION_NAV, "right", "+^{END}", "부양가족 선택"),
+            self._read("right", "부양가족 목록 복사"),
+        ]
+
+    def _block_actions(self, dependents: List[NormalizedDependent]) -> List[PlanAction]:
+        """부양가족 전체 블록 붙여넣기 + 목록 복사로 확인 (input_dependents_block, 재입력 제외)"""
+        return [
+            self._call(ACTION_TYPE, "right", "^v", f"부양가족 {len(dependents)}명 붙여넣기",
+                       sleep_after=0.1 + 0.05 * len(dependents)),
+            self._call(ACTION_NAV, "right", "^{HOME}", "블록 확인"),
+            self._call(ACTION_NAV, "right", "{HOME}", "블록 확인"),
+            self._call(ACTION_NAV, "right", "+^{END}", "블록 확인"),
+            self._read("right", "블록 확인"),
+        ]
+
+    def _dependent_actions(self, dep: NormalizedDependent, emp_no: str, emp_name: str) -> List[PlanAction]:
+        """부양가족 1명 입력 액션"""
+        if self.input_mode == INPUT_MODE_PASTE:
+            # 붙여넣기 → 행 복사로 확인 → 다음 행 (확인 실패 시 필드별 입력은 계획에 포함하지 않음)
+            return [
+                self._call(ACTION_TYPE, "right", "^v", f"{dep.name} 붙여넣기", sleep_after=0.15),
+                self._call(ACTION_NAV, "right", "+{END}", "붙여넣기 확인"),
+                self._read("right", "붙여넣기 확인"),
+                self._call(ACTION_NAV, "right", "{HOME}", "다음행"),
+                self._call(ACTION_NAV, "right", "{DOWN}", "다음행"),
+            ]
+
+        script = self.compiler.compile(dep, emp_no, emp_name)
+
+        if self.input_mode == INPUT_MODE_SCRIPT:
+            keys = script.render()
+            cost = count_keystrokes(keys) * self.key_pause + sum(s.settle for s in script.steps) \
+                + self.sleep_after * self.global_delay
+            return [PlanAction(ACTION_TYPE, "right", keys, script.description, cost)]
+
+        # 필드별 입력: 단계마다 type_keys 호출 그룹 수만큼 대기
+        actions = []
+        for step in script.steps:
+            groups = _call_groups(step.keys)
+            cost = count_keystrokes(step.keys) * CALL_PAUSE \
+                + groups * self.sleep_after * self.global_delay + step.settle
+            kind = ACTION_NAV if step.label == "다음행" else ACTION_TYPE
+            actions.append(PlanAction(kind, "right", step.keys, step.label, cost))
+        return actions
+
+    def _focus(self, control: str, settle: float) -> PlanAction:
+        """스프레드 포커스 전환 (set_focus + 대기)"""
+        return PlanAction(ACTION_FOCUS, control, "", f"{control} 포커스", settle * self.global_delay)
+
+    def employee_actions(self, emp_no: str, employee: EmployeeDependents) -> tuple:
+        """
+        사원 1명의 액션 리스트 (_process_with_employee_no 흐름)
+
+        Returns:
+            (액션 리스트, 부양가족 수)
+        """
+        emp_name = employee.employee_name
+        dependents = list(employee.dependents)
+
+        actions = []
+        if not self.snapshot:
+            actions.extend([
+                self._call(ACTION_NAV, "left", "{HOME}", "사번 열 이동"),
+                self._call(ACTION_NAV, "left", "{RIGHT}", "사번 열 이동"),
+                self._read("left", "사번 읽기"),
+            ])
+        actions.append(self._focus("right", 0.0))
+        if self.sync:
+            actions.extend(self._sync_actions())
+            # 재실행 가정이면 기존 행이 모두 일치해 입력할 부양가족 없음
+            to_input = [] if self.assume_rerun else dependents
+        else:
+            actions.extend(self._clear_actions(len(dependents) if self.assume_rerun else 0))
+            to_input = dependents
+
+        if to_input:
+            actions.append(self._call(ACTION_NAV, "right", "^{HOME}", "입력 시작 위치"))
+            actions.append(self._call(ACTION_NAV, "right", "{HOME}", "입력 시작 위치"))
+            actions.append(self._call(ACTION_NAV, "right", "{DOWN}", "입력 시작 위치"))
+            if self.input_mode == INPUT_MODE_BLOCK:
+                actions.extend(self._block_actions(to_input))
+            else:
+                for dep in to_input:
+                    actions.extend(self._dependent_actions(dep, emp_no, emp_name))
+
+        actions.append(self._focus("left", 0.1))
+        actions.append(self._call(ACTION_NAV, "left", "{DOWN}", "다음 사원"))
+        return actions, len(dependents)
+
+    def build(self, employees: Dict[str, EmployeeDependents], count: int = None) -> RunPlan:
+        """
+        실행 계획 생성
+
+        Args:
+            employees: normalize_employees() 결과
+            count: 처리할 사원 수 (None이면 CSV 전체)
+
+        Returns:
+            RunPlan
+        """
+        positions = {}
+        removed_total = 0
+
+        setup = []
+        if not self.start_from_current:
+            setup = [
+                self._call(ACTION_NAV, "left", "^{HOME}", "첫 사원 이동"),
+                self._call(ACTION_NAV, "left", "{HOME}", "첫 사원 이동"),
+                self._call(ACTION_NAV, "left", "{LEFT}", "첫 사원 이동"),
+            ]
+        if self.snapshot:
+            setup.extend([
+                self._call(ACTION_NAV, "left", "^{HOME}", "스냅샷 시작"),
+                self._call(ACTION_NAV, "left", "{HOME}", "스냅샷 시작"),
+                self._call(ACTION_NAV, "left", "{RIGHT}", "스냅샷 시작"),
+                self._call(ACTION_NAV, "left", "+^{END}", "사번 열 선택"),
+                self._read("left", "사원 목록 복사"),
+                self._call(ACTION_NAV, "left", "^{HOME}", "첫 사원 복귀"),
+                self._call(ACTION_NAV, "left", "{HOME}", "첫 사원 복귀"),
+                self._call(ACTION_NAV, "left", "{LEFT}", "첫 사원 복귀"),
+            ])
+
+        # 시작 이동/스냅샷은 그대로 실행하고 위치만 반영
+        pos = (None, None)
+        for action in setup:
+            if action.kind == ACTION_NAV:
+                pos = _move(pos, action.keys)
+        positions["left"] = pos
+
+        plans = []
+        items = list(employees.items())
+        if count is not None:
+            items = items[:count]
+
+        for emp_no, employee in items:
+            actions, dependent_count = self.employee_actions(emp_no, employee)
+            actions, removed = peephole(actions, positions)
+            removed_total += removed
+            plans.append(EmployeePlan(emp_no, employee.employee_name, dependent_count, actions))
+
+        settings = {
+            "입력방식": self.input_mode,
+            "지연배율": self.global_delay,
+            "키간격": self.key_pause,
+            "재실행가정": "예" if self.assume_rerun else "아니오",
+            "스냅샷": "예" if self.snapshot else "아니오",
+            "변경분만": "예" if self.sync else "아니오",
+        }
+        return RunPlan(plans, setup, removed_total, settings)
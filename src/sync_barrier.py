@@ -0,0 +1,114 @@
+"""
+동기화 배리어 모듈
+
+키 입력 후 고정 시간만큼 기다리는 대신, 대상 창의 UI 스레드가
+입력 처리를 마치고 메시지 루프로 돌아왔는지 메시지 왕복으로 확인합니다.
+확인되는 즉시 다음 입력으로 넘어가며, 고정 대기 시간은 상한으로만 사용합니다.
+왕복은 큐에 아직 남은 키 입력까지 기다리지는 않으므로 짧은 min_settle과 함께 씁니다.
+"""
+
+import time
+
+# 대기 모드
+WAIT_MODE_SLEEP = "sleep"   # 기존 방식: 고정 시간 대기
+WAIT_MODE_SYNC = "sync"     # 동기화 배리어: 메시지 왕복 확인 후 즉시 진행
+WAIT_MODES = (WAIT_MODE_SLEEP, WAIT_MODE_SYNC)
+
+
+class Win32SyncBackend:
+    """SendMessageTimeout(WM_NULL) 기반 메시지 왕복 백엔드"""
+
+    def round_trip(self, control, timeout: float) -> bool:
+        """
+        대상 컨트롤의 UI 스레드까지 메시지 왕복
+
+        WM_NULL은 UI 스레드가 현재 처리 중인 메시지를 끝내고 메시지 루프로 돌아와야
+        처리되므로, 반환 시점에는 UI 스레드가 바쁘지 않았다는 것까지만 알 수 있습니다.
+
+        한계: SendMessage로 보낸 메시지는 큐에 쌓인 키보드 입력보다 먼저 처리되므로,
+        왕복이 끝났다고 해서 앞서 보낸 키가 모두 소비되었다는 보장은 없습니다.
+        (키 처리 중이면 그 키가 끝날 때까지는 기다리지만, 아직 큐에 남은 키는 기다리지 않음)
+        SyncBarrier의 min_settle은 이 간격을 줄일 뿐 없애지 못하므로, 입력 결과가 꼭 필요한
+        곳(사번 확인, 그리드 행 수 등)은 클립보드/스냅샷으로 값을 다시 읽어 확인해야 합니다.
+
+        Args:
+            control: pywinauto 컨트롤 (handle 속성 필요)
+            timeout: 최대 대기 시간 (초)
+
+        Returns:
+            True면 왕복 성공, False면 타임아웃/실패
+        """
+        import win32con
+        import win32gui
+
+        timeout_ms = max(1, int(timeout * 1000))
+        try:
+            win32gui.SendMessageTimeout(
+                control.handle, win32con.WM_NULL, 0, 0,
+                win32con.SMTO_ABORTIFHUNG | win32con.SMTO_BLOCK, timeout_ms
+            )
+            return True
+        except Exception:
+            # 타임아웃 또는 창 응답 없음 (pywintypes.error)
+            return False
+
+
+class SyncBarrier:
+    """키 입력 후 UI 스레드 입력 처리 완료 대기"""
+
+    def __init__(self, backend=None, min_settle: float = 0.02, log_callback=None):
+        """
+        초기화
+
+        Args:
+            backend: 메시지 왕복 백엔드 (round_trip(control, timeout) -> bool).
+                     None이면 Win32SyncBackend 사용
+            min_settle: 왕복 전 최소 대기 (초). 입력이 대상 스레드 큐에 도달해 처리될 시간
+                        (왕복은 큐에 남은 키 입력을 기다리지 않음, Win32SyncBackend.round_trip 참고)
+            log_callback: 로그 출력 콜백 함수 (level, message, *args - LogService.log와 같은 형태)
+        """
+        self.backend = backend if backend is not None else Win32SyncBackend()
+        self.min_settle = min_settle
+        self.log_callback = log_callback
+
+    def _log(self, level: str, message: str, *args):
+        """로그 출력 (콜백이 있으면 사용, args가 있으면 message는 % 포맷 문자열)"""
+        if self.log_callback:
+            self.log_callback(level, message, *args)
+
+    def wait(self, control, max_wait: float) -> bool:
+        """
+        입력 처리 완료까지 대기
+
+        왕복이 확인되면 즉시 반환하고, 실패하면 max_wait까지 고정 대기합니다.
+
+        Args:
+            control: 입력을 보낸 컨트롤
+            max_wait: 최대 대기 시간 (초, 기존 고정 대기 시간)
+
+        Returns:
+            True면 왕복으로 확인됨, False면 상한까지 대기함
+        """
+        start = time.perf_counter()
+
+        settle = min(self.min_settle, max_wait)
+        if settle > 0:
+            time.sleep(settle)
+
+        remaining = max_wait - (time.perf_counter() - start)
+        if remaining <= 0:
+            return True
+
+        try:
+            confirmed = self.backend.round_trip(control, remaining)
+        except Exception as e:
+            self._log("DEBUG", "동기화 왕복 실패: %s", e)
+            confirmed = False
+
+        if not confirmed:
+            # 왕복 실패 → 남은 시간만큼 고정 대기 (상한)
+            remaining = max_wait - (time.perf_counter() - start)
+            if remaining > 0:
+                time.sleep(remaining)
+
+        return confirmed
@@ -0,0 +1,26 @@
+"""
+값 해시 모듈
+
+입력한 값 목록의 짧은 해시를 만듭니다. 정규화(사원별 CSV 원본 값)와 진행 저널
+(입력 후 기록)이 같은 함수를 쓰도록 데이터/저장 모듈 어느 쪽에도 두지 않습니다.
+"""
+
+import hashlib
+from typing import Iterable
+
+
+def values_digest(values: Iterable) -> str:
+    """
+    입력한 값 목록 해시 (같은 사원이라도 값이 바뀌면 다시 처리)
+
+    Args:
+        values: 입력한 값들 (순서 포함, str로 변환해 비교)
+
+    Returns:
+        SHA-1 앞 12자리
+    """
+    h = hashlib.sha1()
+    for value in values:
+        h.update(str(value).encode('utf-8'))
+        h.update(b'\x1f')
+    return h.hexdigest()[:12]
@@ -0,0 +1,178 @@
+"""
+연말정산 엑셀 로더 모듈
+
+연말정산.xls(euc-kr)에서 분납적용에 필요한 열만 읽어 사원 데이터 리스트로 변환합니다.
+읽은 결과는 파일 경로/크기/수정 시각을 키로 메모리(GUI 실행 동안)와 디스크(실행 사이)에
+캐시하므로 같은 파일로 다시 시작하면 엑셀을 다시 열지 않습니다.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# 데이터 키 → 엑셀 열 번호 (0부터, 4/7열은 농특세라 읽지 않음)
+YEAREND_COLUMNS = {
+    "사원코드": 0,
+    "사원명": 1,
+    "총액_소득세": 2,
+    "총액_지방소득세": 3,
+    "분납1_소득세": 5,
+    "분납1_지방소득세": 6,
+    "분납2_소득세": 8,
+    "분납2_지방소득세": 9,
+}
+TEXT_KEYS = ("사원코드", "사원명")
+
+# 첫 데이터 행 (0부터, 위 두 행은 제목/머리글)
+DATA_START_ROW = 2
+
+# 디스크 캐시 위치 (진행 저널과 같은 logs 아래)
+CACHE_DIR = Path("logs") / "cache"
+
+# 캐시 형식 버전 (읽는 열/변환 규칙이 바뀌면 올림)
+CACHE_VERSION = 1
+
+# 메모리 캐시: 절대 경로 → (파일 키, 사원 데이터)
+_memory_cache: Dict[str, Tuple[list, List[Dict]]] = {}
+
+
+def file_key(path: str) -> list:
+    """
+    캐시 키 (절대 경로, 크기, 수정 시각 ns) - 파일이 바뀌면 달라짐
+
+    Args:
+        path: 파일 경로
+
+    Returns:
+        [절대 경로, 크기, mtime_ns] (JSON으로 저장할 수 있도록 리스트)
+    """
+    stat = os.stat(path)
+    return [str(Path(path).resolve()), stat.st_size, stat.st_mtime_ns]
+
+
+def to_ints(values: list) -> List[int]:
+    """
+    엑셀 열 값을 한 번에 int로 변환 (숫자 셀은 float, 빈 값/문자열은 0)
+
+    Args:
+        values: xlrd col_values 결과
+
+    Returns:
+        int 리스트
+    """
+    result = []
+    for value in values:
+        if isinstance(value, float):
+            result.append(int(value))
+        elif isinstance(value, str) and value.strip():
+            try:
+                result.append(int(float(value)))
+            except ValueError:
+                result.append(0)
+        else:
+            result.append(0)
+    return result
+
+
+def read_yearend_xls(excel_path: str) -> List[Dict]:
+    """
+    연말정산 엑셀에서 필요한 열만 읽기 (xlrd on_demand, 열 단위)
+
+    Args:
+        excel_path: Excel 파일 경로
+
+    Returns:
+        사원 데이터 리스트 (사원코드가 빈 행 제외)
+    """
+    import xlrd
+
+    # on_demand: 첫 시트만 읽음
+    wb = xlrd.open_workbook(excel_path, encoding_override='euc-kr', on_demand=True)
+    try:
+        ws = wb.sheet_by_index(0)
+        print(f"✓ 총 {ws.nrows}행 로드")
+        columns = {}
+        for key, col in YEAREND_COLUMNS.items():
+            values = ws.col_values(col, start_rowx=DATA_START_ROW) if col < ws.ncols else []
+            columns[key] = [str(v).strip() for v in values] if key in TEXT_KEYS else to_ints(values)
+    finally:
+        wb.release_resources()
+
+    rows = len(columns["사원코드"])
+    for key, values in columns.items():
+        if len(values) < rows:
+            values.extend([""] * (rows - len(values)) if key in TEXT_KEYS else [0] * (rows - len(values)))
+
+    keys = list(YEAREND_COLUMNS)
+    return [dict(zip(keys, values)) for values in zip(*(columns[key] for key in keys)) if values[0]]
+
+
+def _cache_path(key: list) -> Path:
+    """디스크 캐시 파일 경로 (원본 파일 경로별 하나)"""
+    digest = hashlib.sha1(key[0].encode('utf-8')).hexdigest()[:12]
+    return CACHE_DIR / f"연말정산_{Path(key[0]).stem}_{digest}.json"
+
+
+def _read_disk_cache(key: list) -> Optional[List[Dict]]:
+    """디스크 캐시 읽기 (없거나 키/버전이 다르거나 깨졌으면 None)"""
+    path = _cache_path(key)
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if cached.get('version') != CACHE_VERSION or cached.get('key') != key:
+        return None
+    return cached.get('data')
+
+
+def _write_disk_cache(key: list, data: List[Dict]):
+    """디스크 캐시 저장 (임시 파일에 쓴 뒤 교체, 실패해도 로드는 계속)"""
+    path = _cache_path(key)
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix('.tmp')
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump({'version': CACHE_VERSION, 'key': key, 'data': data}, f, ensure_ascii=False)
+        os.replace(tmp, path)
+    except OSError as e:
+        print(f"⚠ 캐시 저장 실패: {e}")
+
+
+def load_yearend_data(excel_path: str, use_cache: bool = True) -> List[Dict]:
+    """
+    연말정산 엑셀 파일 읽기 (캐시 사용)
+
+    메모리 캐시 → 디스크 캐시 → 엑셀 순서로 찾고, 엑셀에서 읽었으면 두 캐시에 저장합니다.
+    파일 크기나 수정 시각이 바뀌면 캐시는 쓰지 않습니다.
+
+    Args:
+        excel_path: Excel 파일 경로 (연말정산.xls)
+        use_cache: False면 항상 엑셀에서 다시 읽음 (캐시는 갱신)
+
+    Returns:
+        사원 데이터 리스트 (호출한 쪽에서 바꿔도 캐시에 영향 없도록 복사본)
+    """
+    print(f"\n[데이터 로드] {excel_path}")
+    key = file_key(excel_path)
+
+    data = None
+    if use_cache:
+        cached = _memory_cache.get(key[0])
+        if cached is not None and cached[0] == key:
+            data = cached[1]
+            print(f"✓ 캐시 사용 (메모리)")
+        else:
+            data = _read_disk_cache(key)
+            if data is not None:
+                print(f"✓ 캐시 사용 ({_cache_path(key)})")
+
+    if data is None:
+        data = read_yearend_xls(excel_path)
+        _write_disk_cache(key, data)
+
+    _memory_cache[key[0]] = (key, data)
+    print(f"✓ {len(data)}명 데이터 파싱 완료")
+    return [dict(row) for row in data]
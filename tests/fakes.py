@@ -0,0 +1,101 @@
+"""
+Linux 단위 테스트용 가짜 창/백엔드
+
+Windows/ERP 없이 동기화 배리어와 클립보드 읽기를 시험하기 위한 대역입니다.
+"""
+
+import time
+
+
+class FakeWindow:
+    """
+    처리 지연을 흉내내는 가짜 창
+
+    type_keys로 받은 키마다 latency_per_key만큼 UI 스레드가 바쁜 것으로 간주합니다.
+    """
+
+    def __init__(self, latency_per_key: float = 0.01, handle: int = 0):
+        """
+        Args:
+            latency_per_key: 키 1개당 처리 지연 (초)
+            handle: 가짜 창 핸들
+        """
+        self.handle = handle
+        self.latency_per_key = latency_per_key
+        self.received = []
+        self._busy_until = 0.0
+
+    def type_keys(self, keys: str, **kwargs):
+        """키 입력 수신 (처리 지연 누적)"""
+        self.received.append(keys)
+        now = time.perf_counter()
+        self._busy_until = max(now, self._busy_until) + self.latency_per_key * len(keys)
+
+    def idle_at(self) -> float:
+        """입력 처리가 끝나는 시각 (time.perf_counter 기준)"""
+        return self._busy_until
+
+
+class FakeSyncBackend:
+    """FakeWindow용 메시지 왕복 백엔드"""
+
+    def __init__(self, fail: bool = False):
+        """
+        Args:
+            fail: True면 왕복이 항상 실패 (응답 없는 창)
+        """
+        self.fail = fail
+        self.calls = 0
+
+    def round_trip(self, control, timeout: float) -> bool:
+        """FakeWindow의 처리가 끝날 때까지 대기 (최대 timeout)"""
+        self.calls += 1
+        if self.fail:
+            time.sleep(timeout)
+            return False
+        remaining = control.idle_at() - time.perf_counter()
+        if remaining > timeout:
+            time.sleep(timeout)
+            return False
+        if remaining > 0:
+            time.sleep(remaining)
+        return True
+
+
+class FakeClipboard:
+    """
+    복사 반영 지연을 흉내내는 가짜 클립보드 백엔드
+
+    copy_later로 넣은 값은 delay초 뒤에 클립보드에 반영되고 변경 번호가 증가합니다.
+    """
+
+    def __init__(self):
+        self._text = ""
+        self._sequence = 0
+        self._pending = []   # [(반영 시각, 텍스트)]
+        self.sequence_reads = 0  # clipboard_sequence 호출 수 (확인 간격 테스트용)
+
+    def copy_later(self, text: str, delay: float = 0.0):
+        """delay초 뒤 반영될 복사 예약 (빈 문자열이면 ERP처럼 아무 것도 바뀌지 않음)"""
+        if text:
+            self._pending.append((time.perf_counter() + delay, text))
+            self._pending.sort(key=lambda item: item[0])
+
+    def _apply(self):
+        now = time.perf_counter()
+        while self._pending and self._pending[0][0] <= now:
+            _, self._text = self._pending.pop(0)
+            self._sequence += 1
+
+    def clipboard_sequence(self) -> int:
+        self.sequence_reads += 1
+        self._apply()
+        return self._sequence
+
+    def get_clipboard(self) -> str:
+        self._apply()
+        return self._text
+
+    def set_clipboard(self, text: str):
+        self._text = text
+        self._sequence += 1
@@ -0,0 +1,108 @@
+"""ClipboardReader/InputHandler.copy_cell 단위 테스트 (FakeClipboard, Windows 불필요)"""
+
+import contextlib
+import time
+
+import pytest
+
+from src.clipboard_reader import ClipboardReader, ClipboardTimeout
+from src.input_handler import InputHandler
+from tests.fakes import FakeClipboard
+
+
+def test_read_returns_as_soon_as_sequence_advances():
+    clipboard = FakeClipboard()
+    reader = ClipboardReader(clipboard, poll_interval=0.001, timeout=1.0)
+
+    start = time.perf_counter()
+    text = reader.read_after(lambda: clipboard.copy_later("20240001", delay=0.02))
+    elapsed = time.perf_counter() - start
+
+    assert text == "20240001"
+    assert 0.02 <= elapsed < 0.5    # 제한 시간(1초)까지 기다리지 않음
+
+
+def test_timeout_raises_instead_of_returning_stale_value():
+    clipboard = FakeClipboard()
+    clipboard.set_clipboard("이전 값")
+    logs = []
+    reader = ClipboardReader(clipboard, poll_interval=0.001, timeout=0.05,
+                             log_callback=lambda *a: logs.append(a))
+
+    start = time.perf_counter()
+    with pytest.raises(ClipboardTimeout):
+        reader.read_after(lambda: clipboard.copy_later(""))     # 빈 셀: 클립보드 안 바뀜
+    elapsed = time.perf_counter() - start
+
+    assert elapsed >= 0.05
+    assert logs and logs[0][0] == "DEBUG"
+
+
+def test_poll_interval_limits_sequence_checks():
+    clipboard = FakeClipboard()
+    reader = ClipboardReader(clipboard, poll_interval=0.01, timeout=0.1)
+
+    with pytest.raises(ClipboardTimeout):
+        reader.read_after(lambda: None)
+
+    # 0.1초 / 0.01초 간격 → 복사 전 1회 + 약 10회 (바쁜 대기 아님)
+    assert 5 <= clipboard.sequence_reads <= 15
+
+
+class FakeClipboardBackend(FakeClipboard):
+    """전경 창 독점 구간을 제공하는 FakeClipboard (InputHandler용)"""
+
+    def exclusive(self, control):
+        return contextlib.nullcontext()
+
+
+class FakeCell:
+    """
+    현재 셀 하나를 흉내내는 가짜 스프레드
+
+    ERP처럼 빈 셀을 복사하면 클립보드가 바뀌지 않고, Shift+방향키로 이웃 셀까지
+    선택한 뒤 복사하면 pair(두 칸 TSV)가 복사됩니다.
+    """
+
+    def __init__(self, clipboard: FakeClipboard, value: str, pair: str):
+        self.clipboard = clipboard
+        self.value = value
+        self.pair = pair
+        self.selecting = False
+
+    def type_keys(self, keys: str, **kwargs):
+        if keys == "^c":
+            self.clipboard.copy_later(self.pair if self.selecting else self.value)
+        else:
+            self.selecting = keys.startswith('+')
+
+
+def _handler(clipboard):
+    return InputHandler(None, None, backend=clipboard, copy_timeout=0.05)
+
+
+def test_copy_cell_returns_value_without_neighbor_copy():
+    clipboard = FakeClipboardBackend()
+    cell = FakeCell(clipboard, "20240001", "\t20240001\r\n")
+
+    assert _handler(clipboard).copy_cell(cell) == "20240001"
+    assert not cell.selecting
+
+
+def test_copy_cell_confirms_empty_cell_with_neighbor():
+    clipboard = FakeClipboardBackend()
+    clipboard.set_clipboard("이전 값")
+    cell = FakeCell(clipboard, "", "0\r\n")     # 2행이 없어 1행(본인)만 복사됨
+
+    assert _handler(clipboard).copy_cell(cell, "+{UP}", "{DOWN}") == ""
+    assert not cell.selecting                   # 선택을 풀고 원래 셀로 복귀
+
+
+def test_copy_cell_raises_when_copy_never_lands():
+    clipboard = FakeClipboardBackend()
+    clipboard.set_clipboard("이전 값")
+    cell = FakeCell(clipboard, "", "")          # 두 칸 복사도 반영 안 됨
+
+    with pytest.raises(ClipboardTimeout):
+        _handler(clipboard).copy_cell(cell)
+    assert not cell.selecting
@@ -0,0 +1,36 @@
+"""DependentValidator 번호 검사 테스트"""
+
+from datetime import date
+
+from src.csv_reader import DependentData
+from src.csv_validator import DependentValidator, LEVEL_ERROR
+
+
+def _dependent(id_number, age='34', nationality='N'):
+    return DependentData({
+        '근로자\n사번': '20240001', '근로자명': '홍길동', '관계코드': '3', '이름': '김배우',
+        '내/외국인': nationality, '주민등록번호': id_number, '만나이': age,
+        '기본공제여부': 'Y', '장애유형': '', '자녀공제': '',
+    })
+
+
+def _number_issues(id_number, **kwargs):
+    report = DependentValidator(today=date(2025, 1, 1)).validate([_dependent(id_number, **kwargs)])
+    return [issue for issue in report.issues if issue.column == "주민등록번호"]
+
+
+def test_valid_number_has_no_issue():
+    assert _number_issues('900101-1234568', age='34') == []
+
+
+def test_full_width_digits_are_reported_not_raised():
+    issues = _number_issues('９００１０１-１２３４５６８')
+
+    assert [issue.level for issue in issues] == [LEVEL_ERROR]
+    assert "ASCII" in issues[0].message
+
+
+def test_mixed_full_width_digit_is_reported():
+    issues = _number_issues('900101-１234568')
+
+    assert [issue.level for issue in issues] == [LEVEL_ERROR]
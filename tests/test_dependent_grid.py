@@ -0,0 +1,74 @@
+"""부양가족 그리드 파싱/비교 테스트 (동기화 모드에서 삭제할 행을 정하는 로직)"""
+
+from src.dependent_grid import DependentGridComparer, GridRow, parse_grid
+from src.dependent_normalizer import NormalizedDependent
+
+SELF_ROW = "0\t홍길동\t1\t1\t8001011234567\t45\t1\t\t\t"
+
+
+def _dep(relationship, name, number, basic=True, disability='0', child=False):
+    return NormalizedDependent('20240001', '홍길동', relationship, name, '1', '1', number,
+                               10, basic, disability, child)
+
+
+def _grid(*lines):
+    return '\r\n'.join((SELF_ROW,) + lines + ("",))
+
+
+def test_parse_grid_skips_self_row_and_stops_at_blank_relationship():
+    rows = parse_grid(_grid("3\t김배우\t1\t1\t8201012234567\t43\t1\t\t0\t",
+                            "\t\t\t\t\t\t\t\t\t"))
+
+    assert [(row.row, row.cell("성명")) for row in rows] == [(1, "김배우")]
+
+
+def test_parse_grid_rejects_copy_not_starting_at_self_row():
+    assert parse_grid("3\t김배우\t1\t1\t8201012234567") is None
+
+
+def test_diff_matches_rows_regardless_of_order():
+    spouse = _dep('3', '김배우', '8201012234567')
+    son = _dep('4', '홍아들', '1501013234567', child=True)
+    rows = parse_grid(_grid("4.자녀\t홍아들\t내국인\t1\t150101-3234567\t9\t1\t\t0\t1",
+                            "3\t김배우\t1\t1\t820101-2234567\t43\t1\t\t0\t"))
+
+    diff = DependentGridComparer().diff(rows, [spouse, son])
+
+    assert diff.unchanged
+    assert [row.row for row in diff.kept] == [2, 1]
+
+
+def test_masked_number_digits_are_not_compared():
+    rows = parse_grid(_grid("3\t김배우\t1\t1\t820101-2******\t43\t1\t\t0\t"))
+
+    assert DependentGridComparer().matches(rows[0], _dep('3', '김배우', '8201012234567'))
+    assert not DependentGridComparer().matches(rows[0], _dep('3', '김배우', '8301012234567'))
+
+
+def test_blank_disability_cell_is_no_disability():
+    row = GridRow(1, tuple("1\t홍부친\t1\t1\t4501011234567\t79\t1\t1\t\t".split('\t')))
+
+    assert DependentGridComparer().matches(row, _dep('1', '홍부친', '4501011234567', disability='0'))
+    assert not DependentGridComparer().matches(row, _dep('1', '홍부친', '4501011234567', disability='1'))
+
+
+def test_child_code_prefix_and_child_flag():
+    row = GridRow(1, tuple("4.자녀\t홍아들\t1\t1\t1501013234567\t9\t1\t\t0\t".split('\t')))
+
+    assert DependentGridComparer().matches(row, _dep('4', '홍아들', '1501013234567', child=False))
+    assert not DependentGridComparer().matches(row, _dep('4', '홍아들', '1501013234567', child=True))
+
+
+def test_rows_without_matching_dependent_are_deleted_bottom_up():
+    spouse = _dep('3', '김배우', '8201012234567')
+    daughter = _dep('4', '홍딸', '1801014234567')
+    rows = parse_grid(_grid("1\t홍부친\t1\t1\t4501011234567\t79\t1\t1\t0\t",
+                            "3\t김배우\t1\t1\t8201012234567\t43\t1\t\t0\t",
+                            "3\t김배우\t1\t1\t8201012234567\t43\t0\t\t0\t",
+                            "4\t홍아들\t1\t1\t1501013234567\t9\t1\t\t0\t0"))
+
+    diff = DependentGridComparer().diff(rows, [spouse, daughter])
+
+    assert [row.row for row in diff.kept] == [2]
+    assert [row.row for row in diff.deleted] == [4, 3, 1]     # 아래 행부터 삭제
+    assert diff.appended == [daughter]
@@ -0,0 +1,60 @@
+"""분납적용 그리드 붙여넣기/비교 형식 테스트"""
+
+from src.installment_grid import GRID_COLUMN_INDEX, compare_row, paste_columns, paste_row
+
+
+def _row(code, total, first=0, second=0):
+    return {
+        '사원코드': code, '사원명': code,
+        '총액_소득세': total, '총액_지방소득세': total // 10,
+        '분납1_소득세': first, '분납1_지방소득세': first // 10,
+        '분납2_소득세': second, '분납2_지방소득세': second // 10,
+    }
+
+
+SINGLE = _row('E001', 100000)                       # 기준 금액과 같으면 단건
+INSTALLMENT = _row('E002', 300000, 100000, 100000)
+
+
+def test_paste_row_for_single_payment_is_two_cells():
+    assert paste_row(SINGLE) == "100000\t10000"
+    assert paste_row(INSTALLMENT) == "300000\t30000\t\t100000\t10000\t\t100000\t10000"
+
+
+def test_paste_columns_blank_lines_for_none_and_single_rows():
+    columns = dict(paste_columns([INSTALLMENT, None, SINGLE]))
+
+    assert columns[GRID_COLUMN_INDEX["총액_소득세"]] == "300000\r\n\r\n100000\r\n"
+    assert columns[GRID_COLUMN_INDEX["분납1_소득세"]] == "100000\r\n\r\n\r\n"
+    assert GRID_COLUMN_INDEX["총액_농특세"] not in columns
+    assert GRID_COLUMN_INDEX["체크"] not in columns
+
+
+def test_paste_columns_checkbox_only_for_single_payment():
+    columns = dict(paste_columns([INSTALLMENT, None, SINGLE, _row('E003', 100001)], with_checkbox=True))
+
+    assert columns[GRID_COLUMN_INDEX["체크"]] == "\r\n\r\n1\r\n\r\n"
+
+
+def test_paste_columns_skips_columns_with_no_values():
+    columns = dict(paste_columns([SINGLE]))
+
+    assert sorted(columns) == [GRID_COLUMN_INDEX["총액_소득세"], GRID_COLUMN_INDEX["총액_지방소득세"]]
+
+
+def test_compare_row_single_payment_requires_blank_installments():
+    cells = ["100,000", "10,000", "", "", "", "", "", "", "", "", "1"]
+
+    assert compare_row(SINGLE, cells) == []
+    assert compare_row(SINGLE, cells, with_checkbox=True) == []
+
+    cells[GRID_COLUMN_INDEX["분납1_소득세"]] = "5"
+    cells[GRID_COLUMN_INDEX["체크"]] = ""
+    assert compare_row(SINGLE, cells, with_checkbox=True) == [("분납1_소득세", 0, 5), ("체크", 1, 0)]
+
+
+def test_compare_row_checkbox_must_be_clear_for_installment():
+    cells = ["300000", "30000", "", "100000", "10000", "", "100000", "10000", "", "100000", "1"]
+
+    assert compare_row(INSTALLMENT, cells) == []
+    assert compare_row(INSTALLMENT, cells, with_checkbox=True) == [("체크", 0, 1)]
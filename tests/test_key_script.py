@@ -0,0 +1,153 @@
+"""키 스크립트 컴파일러 골든 테스트 (대표 부양가족/분납 행의 키 입력 텍스트 고정)"""
+
+from src.csv_reader import DependentData
+from src.dependent_normalizer import normalize_dependent
+from src.key_script import DependentScriptCompiler, InstallmentScriptCompiler
+
+
+def _compile(relationship_code, name, nationality, id_number, age, basic, disability='', child=''):
+    dep = DependentData({
+        '근로자\n사번': '20240001', '근로자명': '홍길동',
+        '관계코드': relationship_code, '이름': name, '내/외국인': nationality,
+        '주민등록번호': id_number, '만나이': age, '기본공제여부': basic,
+        '장애유형': disability, '자녀공제': child,
+    })
+    return DependentScriptCompiler().compile(normalize_dependent(dep), '20240001', '홍길동')
+
+
+def test_senior_with_basic_deduction():
+    script = _compile('1', '홍부친', 'N', '450101-1234567', '79', 'Y')
+
+    assert script.to_text() == (
+        "# 20240001 홍길동 → 홍부친(1)\n"
+        "관계코드: 1\n"
+        "성명: 홍부친{ENTER}\n"
+        "내/외국인: 1\n"
+        "번호타입: 1\n"
+        "번호: 4501011234567\n"
+        "기본공제: {RIGHT}\n"
+        "경로: {RIGHT}\n"
+        "장애유형: {RIGHT}\n"
+        "다음행: {HOME}{DOWN}"
+    )
+
+
+def test_no_basic_deduction_skips_deduction_fields():
+    script = _compile('3', '김배우', 'N', '900101-2234567', '34', 'N')
+
+    assert script.to_text() == (
+        "# 20240001 홍길동 → 김배우(3)\n"
+        "관계코드: 3\n"
+        "성명: 김배우{ENTER}\n"
+        "내/외국인: 1\n"
+        "번호타입: 1\n"
+        "번호: 9001012234567\n"
+        "기본공제: 0\n"
+        "다음행: {HOME}{DOWN}"
+    )
+
+
+def test_child_with_child_deduction():
+    script = _compile('4', '홍아들', 'N', '150101-3234567', '9', 'Y', '', 'Y')
+
+    assert script.to_text() == (
+        "# 20240001 홍길동 → 홍아들(4)\n"
+        "관계코드: 4\n"
+        "성명: 홍아들{ENTER}\n"
+        "내/외국인: 1\n"
+        "번호타입: 1\n"
+        "번호: 1501013234567\n"
+        "기본공제: {RIGHT}\n"
+        "장애유형: {RIGHT}\n"
+        "자녀공제: 1 (+0.3초)\n"
+        "다음행: {HOME}{DOWN}"
+    )
+    assert script.render() == "4홍아들{ENTER}111501013234567{RIGHT}{RIGHT}1{PAUSE 0.3}{HOME}{DOWN}"
+
+
+def test_disability_code_without_child_deduction():
+    script = _compile('4', '홍딸', 'N', '120101-4234567', '12', 'Y', '1', '')
+
+    assert script.to_text() == (
+        "# 20240001 홍길동 → 홍딸(4)\n"
+        "관계코드: 4\n"
+        "성명: 홍딸{ENTER}\n"
+        "내/외국인: 1\n"
+        "번호타입: 1\n"
+        "번호: 1201014234567\n"
+        "기본공제: {RIGHT}\n"
+        "장애유형: 1\n"
+        "자녀공제: 0 (+0.3초)\n"
+        "다음행: {HOME}{DOWN}"
+    )
+
+
+def test_passport_number():
+    script = _compile('6', 'Smith', 'Y', 'm1234 5678', '40', 'Y')
+
+    assert script.to_text() == (
+        "# 20240001 홍길동 → Smith(6)\n"
+        "관계코드: 6\n"
+        "성명: Smith{ENTER}\n"
+        "내/외국인: 2\n"
+        "번호타입: 3\n"
+        "번호: M12345678\n"
+        "기본공제: {RIGHT}\n"
+        "장애유형: {RIGHT}\n"
+        "다음행: {HOME}{DOWN}"
+    )
+
+
+def test_foreign_registration_number():
+    script = _compile('3', 'Tanaka', 'Y', '900101-5234567', '34', 'Y')
+
+    assert script.to_text() == (
+        "# 20240001 홍길동 → Tanaka(3)\n"
+        "관계코드: 3\n"
+        "성명: Tanaka{ENTER}\n"
+        "내/외국인: 2\n"
+        "번호타입: 2\n"
+        "번호: 9001015234567\n"
+        "기본공제: {RIGHT}\n"
+        "장애유형: {RIGHT}\n"
+        "다음행: {HOME}{DOWN}"
+    )
+
+
+def _installment_row(code, total, local, first=0, first_local=0, second=0, second_local=0):
+    return {
+        '사원코드': code, '사원명': '사원' + code,
+        '총액_소득세': total, '총액_지방소득세': local,
+        '분납1_소득세': first, '분납1_지방소득세': first_local,
+        '분납2_소득세': second, '분납2_지방소득세': second_local,
+    }
+
+
+def test_installment_row():
+    script = InstallmentScriptCompiler().compile(
+        _installment_row('1', 150000, 15000, 50000, 5000, 50000, 5000))
+
+    assert script.to_text() == (
+        "# 1 사원1\n"
+        "총액 소득세: 150000{ENTER}\n"
+        "총액 지방소득세: 15000{ENTER}\n"
+        "총액 농특세: {ENTER}\n"
+        "1차 소득세: 50000{ENTER}\n"
+        "1차 지방소득세: 5000{ENTER}\n"
+        "1차 농특세: {ENTER}\n"
+        "2차 소득세: 50000{ENTER}\n"
+        "2차 지방소득세: 5000{ENTER}\n"
+        "2차 농특세 → 다음 사원: {ENTER} (+0.1초)"
+    )
+
+
+def test_single_row_with_checkbox():
+    script = InstallmentScriptCompiler(with_checkbox=True).compile(_installment_row('2', 100000, 10000))
+
+    assert script.to_text() == (
+        "# 2 사원2\n"
+        "총액 소득세: 100000{ENTER}\n"
+        "총액 지방소득세: 10000{ENTER}\n"
+        "체크: {RIGHT 8}{SPACE}\n"
+        "다음 사원: {DOWN}{LEFT 10} (+0.1초)"
+    )
@@ -0,0 +1,37 @@
+"""PrefetchPipeline 단위 테스트"""
+
+import threading
+import time
+
+from src.prefetch import PrefetchPipeline
+
+
+def test_take_returns_prefetched_payloads_in_order():
+    pipeline = PrefetchPipeline(["A", "B", "C"], lambda key: key.lower(), depth=2)
+    pipeline.start()
+    try:
+        assert [pipeline.take(key) for key in ["A", "B", "C"]] == ["a", "b", "c"]
+    finally:
+        pipeline.close()
+
+
+def test_take_builds_itself_when_closed_from_another_thread():
+    release = threading.Event()
+
+    def build(key):
+        if threading.current_thread().name == "Prefetch":
+            release.wait(2.0)       # 작업 스레드는 close()될 때까지 준비를 끝내지 못함
+        return key.lower()
+
+    pipeline = PrefetchPipeline(["A", "B"], build, depth=1)
+    pipeline.start()
+    closer = threading.Timer(0.05, lambda: (pipeline.close(), release.set()))
+    closer.start()
+
+    start = time.perf_counter()
+    payload = pipeline.take("A")
+    elapsed = time.perf_counter() - start
+    closer.join()
+
+    assert payload == "a"
+    assert elapsed < 1.0            # 중지 후 무한 대기하지 않음
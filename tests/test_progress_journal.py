@@ -0,0 +1,34 @@
+"""ProgressJournal 단위 테스트"""
+
+import json
+
+from src.progress_journal import ProgressJournal, STATUS_DONE
+
+
+def test_lines_without_key_or_status_are_ignored(tmp_path):
+    journal = ProgressJournal("data.csv", "사원등록", journal_dir=tmp_path)
+    journal.record("A", STATUS_DONE, "d1")
+    journal.close()
+    with open(journal.path, 'a', encoding='utf-8') as f:
+        f.write(json.dumps({'key': 'B'}) + '\n')           # 상태 없는 줄 (손으로 고친 줄)
+        f.write(json.dumps(['key', 'C']) + '\n')
+        f.write('{"key": "D", "sta')                        # 기록 중 잘린 줄
+
+    reopened = ProgressJournal("data.csv", "사원등록", journal_dir=tmp_path)
+
+    assert reopened.is_done("A", "d1")
+    assert not reopened.is_done("B")
+    assert reopened.done_count() == 1
+
+
+def test_log_resume_warns_with_journal_name_and_count(tmp_path):
+    logs = []
+    journal = ProgressJournal("data.csv", "사원등록", journal_dir=tmp_path,
+                              log_callback=lambda level, message: logs.append((level, message)))
+    journal.record("A", STATUS_DONE, "d1")
+
+    journal.log_resume()
+    journal.close()
+
+    assert logs[0][0] == "WARNING"
+    assert journal.path.name in logs[0][1] and "1명" in logs[0][1]
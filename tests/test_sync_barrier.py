@@ -0,0 +1,79 @@
+"""SyncBarrier 단위 테스트 (FakeWindow/FakeSyncBackend, Windows 불필요)"""
+
+import time
+
+from src.sync_barrier import SyncBarrier
+from tests.fakes import FakeSyncBackend, FakeWindow
+
+
+def _elapsed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def test_wait_returns_when_window_is_idle():
+    window = FakeWindow(latency_per_key=0.01)
+    window.type_keys("abcde")       # 약 0.05초 처리
+    barrier = SyncBarrier(FakeSyncBackend(), min_settle=0.0)
+
+    confirmed, elapsed = _elapsed(lambda: barrier.wait(window, max_wait=1.0))
+
+    assert confirmed is True
+    assert 0.03 <= elapsed < 0.5    # 상한(1초)까지 기다리지 않음
+
+
+def test_wait_is_immediate_for_idle_window():
+    barrier = SyncBarrier(FakeSyncBackend(), min_settle=0.0)
+
+    confirmed, elapsed = _elapsed(lambda: barrier.wait(FakeWindow(), max_wait=1.0))
+
+    assert confirmed is True
+    assert elapsed < 0.1
+
+
+def test_wait_falls_back_to_max_wait_when_round_trip_fails():
+    backend = FakeSyncBackend(fail=True)
+    barrier = SyncBarrier(backend, min_settle=0.0)
+
+    confirmed, elapsed = _elapsed(lambda: barrier.wait(FakeWindow(), max_wait=0.1))
+
+    assert confirmed is False
+    assert backend.calls == 1
+    assert elapsed >= 0.1
+
+
+def test_wait_caps_busy_window_at_max_wait():
+    window = FakeWindow(latency_per_key=0.1)
+    window.type_keys("abcdefghij")  # 약 1초 처리
+    barrier = SyncBarrier(FakeSyncBackend(), min_settle=0.0)
+
+    confirmed, elapsed = _elapsed(lambda: barrier.wait(window, max_wait=0.1))
+
+    assert confirmed is False
+    assert 0.1 <= elapsed < 0.5
+
+
+def test_backend_exception_is_treated_as_failure():
+    class BrokenBackend:
+        def round_trip(self, control, timeout):
+            raise OSError("창 없음")
+
+    logs = []
+    barrier = SyncBarrier(BrokenBackend(), min_settle=0.0, log_callback=lambda *a: logs.append(a))
+
+    confirmed, elapsed = _elapsed(lambda: barrier.wait(FakeWindow(), max_wait=0.05))
+
+    assert confirmed is False
+    assert elapsed >= 0.05
+    assert logs and logs[0][0] == "DEBUG"
+
+
+def test_min_settle_is_waited_before_round_trip():
+    backend = FakeSyncBackend()
+    barrier = SyncBarrier(backend, min_settle=0.05)
+
+    _, elapsed = _elapsed(lambda: barrier.wait(FakeWindow(), max_wait=1.0))
+
+    assert elapsed >= 0.05
+    assert backend.calls == 1
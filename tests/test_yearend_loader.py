@@ -0,0 +1,144 @@
+"""연말정산 로더 열 읽기/캐시 테스트 (가짜 xlrd 시트, 실제 엑셀 불필요)"""
+
+import os
+import sys
+import types
+
+import pytest
+
+from src import yearend_loader
+from src.yearend_loader import load_yearend_data, read_yearend_xls, to_ints
+
+
+class FakeSheet:
+    """xlrd 시트 대역 (행 리스트, col_values만 제공)"""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.nrows = len(rows)
+        self.ncols = max(len(row) for row in rows)
+        self.read_columns = []
+
+    def col_values(self, colx, start_rowx=0):
+        self.read_columns.append(colx)
+        return [row[colx] if colx < len(row) else "" for row in self.rows[start_rowx:]]
+
+
+class FakeBook:
+    def __init__(self, sheet):
+        self.sheet = sheet
+        self.released = False
+
+    def sheet_by_index(self, index):
+        return self.sheet
+
+    def release_resources(self):
+        self.released = True
+
+
+def _fake_xlrd(monkeypatch, sheet):
+    """import xlrd가 sheet를 여는 가짜 모듈을 받도록"""
+    book = FakeBook(sheet)
+    module = types.SimpleNamespace(open_workbook=lambda path, **kwargs: book)
+    monkeypatch.setitem(sys.modules, 'xlrd', module)
+    return book
+
+
+HEADER = [["연말정산"], ["사원코드", "사원명", "소득세", "지방소득세", "농특세",
+                          "1차 소득세", "1차 지방", "1차 농특", "2차 소득세", "2차 지방"]]
+
+
+def test_to_ints_converts_numbers_and_blanks():
+    assert to_ints([1234.0, "5678", " 90.0 ", "", "  ", "abc", None]) == [1234, 5678, 90, 0, 0, 0, 0]
+
+
+def test_read_projects_needed_columns_and_drops_blank_codes(monkeypatch):
+    sheet = FakeSheet(HEADER + [
+        ["E001", " 홍길동 ", 300000.0, 30000.0, 999.0, 100000.0, 10000.0, 999.0, 100000.0, 10000.0],
+        ["", "합계", 1.0, 1.0],
+        ["E002", "김철수", 50000.0, 5000.0],
+    ])
+    book = _fake_xlrd(monkeypatch, sheet)
+
+    data = read_yearend_xls("연말정산.xls")
+
+    assert book.released
+    assert 4 not in sheet.read_columns and 7 not in sheet.read_columns      # 농특세 열은 읽지 않음
+    assert [row['사원코드'] for row in data] == ["E001", "E002"]
+    assert data[0]['사원명'] == "홍길동"
+    assert data[0]['분납2_지방소득세'] == 10000
+    assert data[1]['분납1_소득세'] == 0                                     # 짧은 행의 빈 셀
+
+
+def test_read_pads_columns_missing_from_sheet(monkeypatch):
+    sheet = FakeSheet(HEADER[:1] + [["사원코드", "사원명", "소득세", "지방소득세"],
+                                    ["E001", "홍길동", 80000.0, 8000.0]])
+    sheet.ncols = 4                                                         # 분납 열이 없는 시트
+    _fake_xlrd(monkeypatch, sheet)
+
+    data = read_yearend_xls("연말정산.xls")
+
+    assert data == [{
+        "사원코드": "E001", "사원명": "홍길동", "총액_소득세": 80000, "총액_지방소득세": 8000,
+        "분납1_소득세": 0, "분납1_지방소득세": 0, "분납2_소득세": 0, "분납2_지방소득세": 0,
+    }]
+
+
+@pytest.fixture
+def cached_loader(monkeypatch, tmp_path):
+    """tmp_path 캐시 폴더 + 읽은 횟수를 세는 read_yearend_xls"""
+    monkeypatch.setattr(yearend_loader, "CACHE_DIR", tmp_path / "cache")
+    monkeypatch.setattr(yearend_loader, "_memory_cache", {})
+    reads = []
+
+    def fake_read(path):
+        reads.append(path)
+        return [{"사원코드": "E001", "사원명": "홍길동", "총액_소득세": len(reads)}]
+
+    monkeypatch.setattr(yearend_loader, "read_yearend_xls", fake_read)
+    source = tmp_path / "연말정산.xls"
+    source.write_bytes(b"v1")
+    return source, reads
+
+
+def test_memory_and_disk_cache_skip_excel(cached_loader, monkeypatch):
+    source, reads = cached_loader
+
+    first = load_yearend_data(str(source))
+    first[0]['사원명'] = "바뀐 이름"                 # 복사본이므로 캐시에 영향 없음
+    second = load_yearend_data(str(source))
+    assert len(reads) == 1
+    assert second[0]['사원명'] == "홍길동"
+
+    monkeypatch.setattr(yearend_loader, "_memory_cache", {})     # 다음 실행 (디스크 캐시만 남음)
+    third = load_yearend_data(str(source))
+    assert len(reads) == 1
+    assert third == second
+
+
+@pytest.mark.parametrize("rewrite", ["size", "mtime"])
+def test_cache_is_invalidated_when_file_changes(cached_loader, monkeypatch, rewrite):
+    source, reads = cached_loader
+    load_yearend_data(str(source))
+
+    stat = os.stat(source)
+    if rewrite == "size":
+        source.write_bytes(b"v2 longer")
+        os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    else:
+        os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    data = load_yearend_data(str(source))
+    assert len(reads) == 2
+    assert data[0]['총액_소득세'] == 2
+
+    monkeypatch.setattr(yearend_loader, "_memory_cache", {})     # 디스크 캐시도 새 키로 갱신됨
+    assert load_yearend_data(str(source))[0]['총액_소득세'] == 2
+    assert len(reads) == 2
+
+
+def test_use_cache_false_rereads(cached_loader):
+    source, reads = cached_loader
+    load_yearend_data(str(source))
+    load_yearend_data(str(source), use_cache=False)
+    assert len(reads) == 2